@@ -0,0 +1,43 @@
+import time
+from typing import Callable
+
+from .timer import Timer
+
+__all__ = ["Backoff", "poll_until"]
+
+
+class Backoff:
+    """Exponentially growing polling intervals, bound to maximum.
+
+    >>> backoff = Backoff(0.001, 0.004)
+    >>> [backoff.next() for _ in range(4)]
+    [0.001, 0.002, 0.004, 0.004]
+    """
+
+    def __init__(self, minimum: float, maximum: float, factor: float = 2.0) -> None:
+        self.minimum: float = minimum
+        self.maximum: float = max(minimum, maximum)
+        self.factor: float = factor
+        self._interval: float = self.minimum
+
+    def next(self) -> float:
+        interval = self._interval
+        self._interval = min(self._interval * self.factor, self.maximum)
+        return interval
+
+    def reset(self) -> None:
+        self._interval = self.minimum
+
+
+def poll_until(predicate: Callable[[], bool], timeout: float, backoff: Backoff) -> bool:
+    """Poll predicate until it returns True using backoff intervals.
+
+    Returns False if predicate was not satisfied within timeout. Sleeping
+    never exceeds the remaining time to timeout.
+    """
+    t = Timer()
+    while t.delta() < timeout:
+        if predicate():
+            return True
+        time.sleep(max(0., min(backoff.next(), timeout - t.delta())))
+    return False
@@ -0,0 +1,96 @@
+"""Incrementally maintained bounds of plot data."""
+
+import math
+from typing import Iterable, Optional, Tuple
+
+__all__ = ["Bounds"]
+
+
+class Bounds:
+    """Bounding box of 2D points updated in constant time per point, points
+    with non finite coordinates are ignored.
+
+    >>> bounds = Bounds()
+    >>> bounds.add(1.0, 4.0)
+    >>> bounds.add(-2.0, 3.0)
+    >>> bounds.x_range, bounds.y_range
+    ((-2.0, 1.0), (3.0, 4.0))
+    """
+
+    __slots__ = (
+        "x_min",
+        "x_max",
+        "y_min",
+        "y_max"
+    )
+
+    def __init__(self) -> None:
+        self.clear()
+
+    def clear(self) -> None:
+        self.x_min: float = math.inf
+        self.x_max: float = -math.inf
+        self.y_min: float = math.inf
+        self.y_max: float = -math.inf
+
+    @property
+    def empty(self) -> bool:
+        return self.x_min > self.x_max
+
+    @property
+    def x_range(self) -> Optional[Tuple[float, float]]:
+        if self.empty:
+            return None
+        return self.x_min, self.x_max
+
+    @property
+    def y_range(self) -> Optional[Tuple[float, float]]:
+        if self.empty:
+            return None
+        return self.y_min, self.y_max
+
+    def add(self, x: float, y: float) -> None:
+        if math.isfinite(x) and math.isfinite(y):
+            if x < self.x_min:
+                self.x_min = x
+            if x > self.x_max:
+                self.x_max = x
+            if y < self.y_min:
+                self.y_min = y
+            if y > self.y_max:
+                self.y_max = y
+
+    def extend(self, points: Iterable[Tuple[float, float]]) -> None:
+        for x, y in points:
+            self.add(x, y)
+
+    @classmethod
+    def track(cls, series) -> "Bounds":
+        """Return bounds of a Qt XY series, updated on every change of its
+        points. Added points extend the bounds, any other change rebuilds
+        them from all points of the series.
+        """
+        bounds = cls()
+
+        def pointAdded(index: int) -> None:
+            point = series.at(index)
+            bounds.add(point.x(), point.y())
+
+        def pointsChanged(*args) -> None:
+            bounds.clear()
+            bounds.extend((point.x(), point.y()) for point in series.pointsVector())
+
+        pointsChanged()
+        series.pointAdded.connect(pointAdded)
+        series.pointRemoved.connect(pointsChanged)
+        series.pointsRemoved.connect(pointsChanged)
+        series.pointReplaced.connect(pointsChanged)
+        series.pointsReplaced.connect(pointsChanged)
+        return bounds
+
+    def update(self, other: "Bounds") -> None:
+        """Extend bounds by other bounds."""
+        self.x_min = min(self.x_min, other.x_min)
+        self.x_max = max(self.x_max, other.x_max)
+        self.y_min = min(self.y_min, other.y_min)
+        self.y_max = max(self.y_max, other.y_max)
@@ -0,0 +1,182 @@
+"""Min/max decimation of plot data."""
+
+import collections
+import math
+from typing import Deque, List, Optional, Tuple
+
+import numpy as np
+
+from .ringbuffer import RingBuffer
+from .series import SeriesStore
+
+__all__ = ["minmax_indices", "minmax_decimate", "StreamDecimator", "DecimatedSeries"]
+
+
+def minmax_indices(y, bucket_size: int) -> Tuple[np.ndarray, np.ndarray]:
+    """Return indices of minimum and maximum of every bucket of
+    `bucket_size` consecutive values in original order and the number of
+    indices per bucket. NaN values are ignored, buckets containing only NaN
+    values are omitted.
+
+    >>> minmax_indices([1, 5, 3, 2, 0, 4], 3)
+    (array([0, 1, 4, 5]), array([2, 2]))
+    """
+    y = np.asarray(y, dtype=float)
+    bucket_size = max(1, int(bucket_size))
+    count = -(-len(y) // bucket_size)
+    padded = np.full(count * bucket_size, np.nan)
+    padded[:len(y)] = y
+    buckets = padded.reshape(count, bucket_size)
+    valid = ~np.isnan(buckets)
+    offsets = np.arange(count) * bucket_size
+    lower = np.where(valid, buckets, np.inf).argmin(axis=1) + offsets
+    upper = np.where(valid, buckets, -np.inf).argmax(axis=1) + offsets
+    first = np.minimum(lower, upper)
+    second = np.maximum(lower, upper)
+    has_values = valid.any(axis=1)
+    has_second = has_values & (first != second)
+    indices = np.column_stack((first, second)).ravel()
+    mask = np.column_stack((has_values, has_second)).ravel()
+    return indices[mask], has_values.astype(int) + has_second.astype(int)
+
+
+def minmax_decimate(x, y, bucket_size: int) -> Tuple[np.ndarray, np.ndarray]:
+    """Return x and y reduced to minimum and maximum of every bucket of
+    `bucket_size` consecutive points, preserving visual extremes.
+
+    >>> x, y = minmax_decimate([0, 1, 2, 3, 4, 5], [1, 5, 3, 2, 0, 4], 3)
+    >>> x.tolist(), y.tolist()
+    ([0.0, 1.0, 4.0, 5.0], [1.0, 5.0, 0.0, 4.0])
+    """
+    x = np.asarray(x, dtype=float)
+    y = np.asarray(y, dtype=float)
+    if bucket_size <= 1:
+        return x, y
+    indices, _ = minmax_indices(y, bucket_size)
+    return x[indices], y[indices]
+
+
+class StreamDecimator:
+    """Incremental min/max decimation of a sliding window of points.
+
+    Keeps up to `capacity` points, every completed bucket of `bucket_size`
+    points is reduced to its minimum and maximum. Method `push` returns the
+    changes to apply to a plot series: number of points to remove from the
+    front, number of points to remove from the back and points to append.
+    """
+
+    def __init__(self, capacity: int, bucket_size: int = 1) -> None:
+        self._buffer: RingBuffer = RingBuffer(capacity, 2)
+        self._bucket_size: int = max(1, int(bucket_size))
+        self._buckets: Deque[int] = collections.deque()
+        self._current: List[Tuple[float, float]] = []
+        self._start: int = 0
+        self._total: int = 0
+
+    @property
+    def capacity(self) -> int:
+        return self._buffer.capacity
+
+    @property
+    def bucket_size(self) -> int:
+        return self._bucket_size
+
+    def __len__(self) -> int:
+        return len(self._buffer)
+
+    def clear(self) -> None:
+        self._buffer.clear()
+        self._buckets.clear()
+        self._current = []
+        self._start = 0
+        self._total = 0
+
+    def push(self, x: float, y: float) -> Tuple[int, int, List[Tuple[float, float]]]:
+        self._buffer.append((x, y))
+        self._total += 1
+        self._current.append((x, y))
+        front = 0
+        # Remove buckets with all points outside of the window
+        while self._buckets and self._start + self._bucket_size <= self._total - self.capacity:
+            front += self._buckets.popleft()
+            self._start += self._bucket_size
+        if len(self._current) < self._bucket_size:
+            return front, 0, [(x, y)]
+        values = np.array(self._current, dtype=float)
+        indices, _ = minmax_indices(values[:, 1], self._bucket_size)
+        points = [self._current[index] for index in indices]
+        back = len(self._current) - 1
+        self._buckets.append(len(points))
+        self._current = []
+        return front, back, points
+
+    def rebuild(self, bucket_size: int) -> List[Tuple[float, float]]:
+        """Change bucket size and return all decimated points."""
+        self._bucket_size = max(1, int(bucket_size))
+        data = self._buffer.to_array()
+        complete = (len(data) // self._bucket_size) * self._bucket_size
+        indices, counts = minmax_indices(data[:complete, 1], self._bucket_size)
+        self._buckets = collections.deque(counts.tolist())
+        self._current = [tuple(row) for row in data[complete:].tolist()]
+        self._start = self._total - len(data)
+        return [tuple(row) for row in data[indices].tolist()] + self._current
+
+    def points(self) -> List[Tuple[float, float]]:
+        """Return all decimated points using current bucket size."""
+        return self.rebuild(self._bucket_size)
+
+
+class DecimatedSeries:
+    """Full resolution x/y data with min/max decimated views for rendering.
+
+    >>> series = DecimatedSeries()
+    >>> series.extend(np.arange(1000), np.sin(np.arange(1000)))
+    >>> x, y = series.view(100)
+    >>> len(x) <= 100
+    True
+    """
+
+    def __init__(self) -> None:
+        self._store: SeriesStore = SeriesStore()
+        self._store.register("x")
+        self._store.register("y")
+
+    def __len__(self) -> int:
+        return self._store.size
+
+    @property
+    def x(self) -> np.ndarray:
+        return self._store["x"]
+
+    @property
+    def y(self) -> np.ndarray:
+        return self._store["y"]
+
+    def append(self, x: float, y: float) -> None:
+        self._store.append(x=x, y=y)
+
+    def extend(self, x, y) -> None:
+        self._store.extend(x=x, y=y)
+
+    def clear(self) -> None:
+        self._store.clear()
+
+    def view(self, points: int, x_range: Optional[Tuple[float, float]] = None) -> Tuple[np.ndarray, np.ndarray]:
+        """Return data decimated to at most `points` points. If `x_range` is
+        given only points inside the range and their direct neighbours are
+        returned.
+        """
+        x, y = self.x, self.y
+        if x_range is not None:
+            inside = (x >= x_range[0]) & (x <= x_range[1])
+            mask = inside.copy()
+            mask[1:] |= inside[:-1]
+            mask[:-1] |= inside[1:]
+            indices = np.flatnonzero(mask)
+        else:
+            indices = np.arange(len(x))
+        buckets = max(1, points // 2)
+        if len(indices) > max(1, points):
+            selected, _ = minmax_indices(y[indices], math.ceil(len(indices) / buckets))
+            indices = indices[selected]
+        return x[indices], y[indices]
@@ -1,8 +1,9 @@
+import math
 from typing import List
 
 import numpy as np
 
-__all__ = ["std_mean_filter"]
+__all__ = ["std_mean_filter", "RunningStatistics"]
 
 
 def std_mean_filter(values: List[float], threshold: float) -> bool:
@@ -18,3 +19,93 @@ def std_mean_filter(values: List[float], threshold: float) -> bool:
     sample_std_dev = np.std(values, ddof=1)
     ratio = sample_std_dev / mean
     return bool(ratio < threshold)
+
+
+class RunningStatistics:
+    """Running mean and sample standard deviation over a fixed size window.
+
+    Uses Welford's algorithm on a ring buffer, replacing the oldest value
+    once the window is full.
+
+    >>> stats = RunningStatistics(2)
+    >>> for value in [0.1, 0.250, 0.249]:
+    ...     stats.push(value)
+    >>> stats.ratio < 0.005
+    True
+    """
+
+    def __init__(self, size: int) -> None:
+        if size < 1:
+            raise ValueError(f"Invalid window size: {size}")
+        self._buffer: np.ndarray = np.zeros(size, dtype=float)
+        self._index: int = 0
+        self._count: int = 0
+        self._mean: float = 0.
+        self._m2: float = 0.
+
+    @property
+    def size(self) -> int:
+        return len(self._buffer)
+
+    @property
+    def count(self) -> int:
+        """Number of values in window."""
+        return self._count
+
+    @property
+    def full(self) -> bool:
+        return self._count == self.size
+
+    @property
+    def mean(self) -> float:
+        if not self._count:
+            return float("nan")
+        return self._mean
+
+    @property
+    def variance(self) -> float:
+        """Sample variance (ddof=1) of values in window."""
+        if self._count < 2:
+            return float("nan")
+        return max(0., self._m2) / (self._count - 1)
+
+    @property
+    def std(self) -> float:
+        """Sample standard deviation (ddof=1) of values in window."""
+        return math.sqrt(self.variance)
+
+    @property
+    def sem(self) -> float:
+        """Standard error of the mean of values in window."""
+        if self._count < 2:
+            return float("nan")
+        return self.std / math.sqrt(self._count)
+
+    @property
+    def ratio(self) -> float:
+        """Sample standard deviation / mean of values in window."""
+        try:
+            return self.std / self.mean
+        except ZeroDivisionError:
+            return float("nan")
+
+    def push(self, value: float) -> None:
+        if self._count < self.size:
+            self._count += 1
+            delta = value - self._mean
+            self._mean += delta / self._count
+            self._m2 += delta * (value - self._mean)
+        else:
+            previous = float(self._buffer[self._index])
+            mean = self._mean
+            delta = value - previous
+            self._mean += delta / self._count
+            self._m2 += delta * (value - self._mean + previous - mean)
+        self._buffer[self._index] = value
+        self._index = (self._index + 1) % self.size
+
+    def clear(self) -> None:
+        self._index = 0
+        self._count = 0
+        self._mean = 0.
+        self._m2 = 0.
@@ -1,6 +1,9 @@
 import csv
 import os
-from typing import Any, Dict, List, Optional
+import re
+from typing import Any, Dict, List, Mapping, Optional, Sequence
+
+import numpy as np
 
 __all__ = ["FormatterError", "Formatter", "CSVFormatter", "PQCFormatter"]
 
@@ -10,6 +13,35 @@ class FormatterError(Exception):
     ...
 
 
+def printf_spec(format_spec: str, kind: str) -> Optional[str]:
+    """Return printf style format equivalent to format spec for NumPy dtype
+    kind, None if there is no equivalent.
+
+    >>> printf_spec("+.3E", "f")
+    '%+.3E'
+    """
+    match = re.fullmatch(r"([+\- ]?)(#?)(0?)(\d*)(\.\d+)?([eEfFgGd])", format_spec)
+    if not match or kind not in "fiu":
+        return None
+    if match.group(6) == "d" and kind not in "iu":
+        return None
+    return "%" + "".join(group or "" for group in match.groups())
+
+
+def format_column(values: Sequence[Any], format_spec: str) -> List[str]:
+    """Return list of formatted column values.
+
+    >>> format_column(np.array([1.0, -2.0]), "+E")
+    ['+1.000000E+00', '-2.000000E+00']
+    """
+    if isinstance(values, np.ndarray):
+        spec = printf_spec(format_spec, values.dtype.kind)
+        if spec is not None:
+            return ((spec + "\n") * len(values) % tuple(values.tolist())).split("\n")[:-1]
+        values = values.tolist()
+    return [format(value, format_spec) for value in values]
+
+
 class Formatter:
 
     def __init__(self, f) -> None:
@@ -72,6 +104,36 @@ class CSVFormatter(Formatter):
         self._f.write(self.linesep)
         self._has_rows = True
 
+    def write_columns(self, columns: Mapping[str, Sequence[Any]]) -> None:
+        """Write CSV rows from column sequences, applying column formats.
+
+        Every column is formatted at once, numeric NumPy columns using a
+        single printf style operation, then joined to rows and written at
+        once. Falls back to `write_row` if any value requires quoting.
+        """
+        for key in columns:
+            if key not in self._fieldnames:
+                raise ValueError(f"column not in fieldnames: {key!r}")
+        if not self._fieldnames:
+            return
+        size = len(columns.get(self._fieldnames[0], ()))
+        if any(len(columns.get(name, ())) != size for name in self._fieldnames):
+            raise ValueError("inconsistent column lengths")
+        if not size:
+            return
+        dialect = self._writer.writer.dialect
+        delimiter = dialect.delimiter
+        special = [char for char in (delimiter, "\n", "\r", dialect.quotechar, dialect.escapechar) if char]
+        formatted = [format_column(columns.get(name, ()), self.format_spec(name)) for name in self._fieldnames]
+        # Values containing special characters require quoting
+        if dialect.quoting != csv.QUOTE_MINIMAL or any(char in text for text in map("".join, formatted) for char in special):
+            for row in zip(*[columns.get(name, ()) for name in self._fieldnames]):
+                self.write_row(dict(zip(self._fieldnames, row)))
+            return
+        self._f.write(self.linesep.join(map(delimiter.join, zip(*formatted))))
+        self._f.write(self.linesep)
+        self._has_rows = True
+
     def write_line(self, line: str) -> None:
         self._f.write(line)
         self._f.write(os.linesep)
@@ -1,25 +1,116 @@
 """Functions module."""
 
 from decimal import Context, Decimal
-from typing import Iterator
+from typing import Iterator, List, Optional, Tuple
+
+import numpy as np
 
 __all__ = ["LinearRange"]
 
 ctx: Context = Context(prec=16)
 
+PRECISION_LIMIT: int = 10 ** 28
+"""Scaled integers below this limit are exact in default decimal context."""
 
-class LinearRange:
-    """Linear range function generator class.
-    Range is bound to [begin, end].
+FLOAT_INT_LIMIT: int = 2 ** 53
+"""Integers below this limit are exact in double precision."""
 
-    >>> list(LinearRange(0, 10, 2.5)) # positive ramp
-    [0.0, 2.5, 5.0, 7.5, 10.0]
+FLOAT_EXP_LIMIT: int = 22
+"""Powers of ten up to this exponent are exact in double precision."""
 
-    >>> list(LinearRange(10, 0, -2.5)) # negative ramp
-    [10.0, 7.5, 5.0, 2.5, 0.0]
 
-    >>> list(LinearRange(0, 4, -1)) # auto corrected step
-    [0.0, 1.0, 2.0, 3.0, 4.0]
+def round_half_even(numerator: int, denominator: int) -> int:
+    """Return integer division rounded half to even, like `round(a / b)`.
+
+    >>> round_half_even(5, 2)
+    2
+    """
+    quotient, remainder = divmod(numerator, denominator)
+    twice = 2 * remainder
+    if twice > denominator or (twice == denominator and quotient & 1):
+        quotient += 1
+    return quotient
+
+
+def scaled_integers(*values: float) -> Optional[Tuple[int, List[int]]]:
+    """Return common decimal exponent and values as scaled integers, values
+    are rounded to 16 significant digits.
+
+    Returns `None` for non finite values.
+
+    >>> scaled_integers(2.5, 10)
+    (-1, [25, 100])
+    """
+    mantissas = []
+    exponents = []
+    for value in values:
+        sign, digits, exponent = ctx.create_decimal(value).as_tuple()
+        if not isinstance(exponent, int):
+            return None
+        mantissa = int("".join(map(str, digits)))
+        # Strip trailing zeros to keep scaled integers small
+        while mantissa and not mantissa % 10:
+            mantissa //= 10
+            exponent += 1
+        mantissas.append(-mantissa if sign else mantissa)
+        exponents.append(exponent)
+    common = min(exponents)
+    return common, [mantissa * 10 ** (exponent - common) for mantissa, exponent in zip(mantissas, exponents)]
+
+
+def scaled_to_float(value: int, exponent: int) -> float:
+    """Return correctly rounded float of `value * 10 ** exponent`."""
+    if exponent < 0:
+        return value / 10 ** -exponent
+    return float(value * 10 ** exponent)
+
+
+class LinearRangePlan:
+    """Exact integer plan of a linear range, all values scaled by
+    `10 ** exponent`."""
+
+    __slots__ = (
+        "exponent",
+        "begin",
+        "end",
+        "step",
+        "distance",
+        "count"
+    )
+
+    def __init__(self, exponent: int, begin: int, end: int, step: int) -> None:
+        distance = abs(end - begin)
+        step = abs(step)
+        # Limit step to distance
+        if step > distance:
+            step = distance
+        self.exponent: int = exponent
+        self.begin: int = begin
+        self.end: int = end
+        self.step: int = step if begin < end else -step
+        self.distance: int = distance
+        self.count: int = round_half_even(distance, step) if step else 0
+
+    def is_exact(self) -> bool:
+        """Return True if all intermediate values are exact in the reference
+        decimal implementation."""
+        return abs(self.begin) + (self.count + 1) * abs(self.step) < PRECISION_LIMIT and abs(self.end) < PRECISION_LIMIT
+
+    def is_vectorizable(self) -> bool:
+        """Return True if values can be calculated exactly using double
+        precision arithmetic."""
+        return (
+            abs(self.begin) + (self.count + 1) * abs(self.step) < FLOAT_INT_LIMIT
+            and abs(self.end) < FLOAT_INT_LIMIT
+            and abs(self.exponent) <= FLOAT_EXP_LIMIT
+        )
+
+
+class DecimalLinearRange:
+    """Reference linear range implementation using decimal arithmetic.
+
+    >>> list(DecimalLinearRange(0, 10, 2.5))
+    [0.0, 2.5, 5.0, 7.5, 10.0]
     """
 
     __slots__ = (
@@ -35,11 +126,6 @@ class LinearRange:
 
     @property
     def distance(self) -> float:
-        """Return distance of linear range.
-
-        >>> LinearRange(-2.5, 2.5, 0.5).distance
-        5.0
-        """
         begin: Decimal = ctx.create_decimal(self.begin)
         end: Decimal = ctx.create_decimal(self.end)
         return abs(float(end - begin))
@@ -80,3 +166,121 @@ class LinearRange:
             # Yield end if range is incomplete (last odd step).
             if value != end:
                 yield float(end)
+
+
+class LinearRange:
+    """Linear range function generator class.
+    Range is bound to [begin, end].
+
+    Values are calculated using scaled integer arithmetic and are identical
+    to the decimal reference implementation `DecimalLinearRange`.
+
+    >>> list(LinearRange(0, 10, 2.5)) # positive ramp
+    [0.0, 2.5, 5.0, 7.5, 10.0]
+
+    >>> list(LinearRange(10, 0, -2.5)) # negative ramp
+    [10.0, 7.5, 5.0, 2.5, 0.0]
+
+    >>> list(LinearRange(0, 4, -1)) # auto corrected step
+    [0.0, 1.0, 2.0, 3.0, 4.0]
+
+    >>> LinearRange(0, 10, 2.5).to_array()
+    array([ 0. ,  2.5,  5. ,  7.5, 10. ])
+    """
+
+    __slots__ = (
+        "begin",
+        "end",
+        "step",
+        "_cache"
+    )
+
+    def __init__(self, begin: float, end: float, step: float):
+        self.begin: float = begin
+        self.end: float = end
+        self.step: float = abs(step) if begin < end else -abs(step)
+        self._cache: Optional[Tuple[Tuple[float, float, float], Optional[LinearRangePlan]]] = None
+
+    def _plan(self) -> Optional[LinearRangePlan]:
+        """Return cached integer plan, `None` if reference implementation
+        is required."""
+        key = self.begin, self.end, self.step
+        if self._cache is None or self._cache[0] != key:
+            plan = None
+            scaled = scaled_integers(*key)
+            if scaled is not None:
+                exponent, (begin, end, step) = scaled
+                plan = LinearRangePlan(exponent, begin, end, step)
+                if not plan.is_exact():
+                    plan = None
+            self._cache = key, plan
+        return self._cache[1]
+
+    def _reference(self) -> DecimalLinearRange:
+        return DecimalLinearRange(self.begin, self.end, self.step)
+
+    @property
+    def distance(self) -> float:
+        """Return distance of linear range.
+
+        >>> LinearRange(-2.5, 2.5, 0.5).distance
+        5.0
+        """
+        plan = self._plan()
+        if plan is None:
+            return self._reference().distance
+        return scaled_to_float(plan.distance, plan.exponent)
+
+    def __len__(self) -> int:
+        plan = self._plan()
+        if plan is None:
+            return len(self._reference())
+        return plan.count
+
+    def to_array(self) -> np.ndarray:
+        """Return all values of linear range as array.
+
+        >>> LinearRange(0, 1, 0.4).to_array()
+        array([0. , 0.4, 0.8, 1. ])
+        """
+        plan = self._plan()
+        if plan is None:
+            return np.fromiter(self._reference(), dtype=float)
+        if not plan.count:
+            return np.empty(0, dtype=float)
+        if plan.is_vectorizable():
+            values = plan.begin + np.arange(plan.count + 1, dtype=np.int64) * plan.step
+            # Mangle values not to exceed valid range.
+            if plan.step > 0:
+                np.minimum(values, plan.end, out=values)
+            else:
+                np.maximum(values, plan.end, out=values)
+            # Append end if range is incomplete (last odd step).
+            if values[-1] != plan.end:
+                values = np.append(values, plan.end)
+            result = values.astype(float)
+            if plan.exponent < 0:
+                result /= float(10 ** -plan.exponent)
+            elif plan.exponent > 0:
+                result *= float(10 ** plan.exponent)
+            return result
+        return np.array(self._scaled_values(plan), dtype=float)
+
+    def _scaled_values(self, plan: LinearRangePlan) -> List[float]:
+        values = []
+        value = plan.begin
+        for i in range(plan.count + 1):
+            value = plan.begin + i * plan.step
+            # Mangle value not to exceed valid range.
+            if plan.step > 0:
+                value = min(value, plan.end)
+            else:
+                value = max(value, plan.end)
+            values.append(scaled_to_float(value, plan.exponent))
+        # Append end if range is incomplete (last odd step).
+        if value != plan.end:
+            values.append(scaled_to_float(plan.end, plan.exponent))
+        return values
+
+    def __iter__(self) -> Iterator[float]:
+        return iter(self.to_array().tolist())
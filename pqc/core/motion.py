@@ -0,0 +1,40 @@
+"""Motion planning for safe table movements."""
+
+import math
+from typing import Optional, Sequence
+
+__all__ = ["partial_retreat_height"]
+
+
+def partial_retreat_height(current: Sequence[float], target: Sequence[float],
+                           clearance: float, max_hop: float,
+                           limits: Sequence[float]) -> Optional[float]:
+    """Return Z height to retreat to before a short X/Y hop or `None` if a
+    full Z retreat is required. All values in millimeters.
+
+    A partial retreat is only planned if enabled (positive clearance and
+    hop distance), the X/Y hop is not longer than `max_hop`, current and
+    target position are inside configured probe card `limits` and the
+    resulting height is at least `clearance` below current and target Z.
+
+    >>> partial_retreat_height((10, 10, 20), (12, 10, 20.5), 1.0, 5.0, (100, 100, 25))
+    19.0
+    >>> partial_retreat_height((10, 10, 20), (50, 10, 20), 1.0, 5.0, (100, 100, 25)) is None
+    True
+    """
+    if not clearance > 0 or not max_hop > 0:
+        return None
+    values = (*current, *target, *limits)
+    if len(values) != 9 or not all(math.isfinite(value) for value in values):
+        return None
+    if not all(limit > 0 for limit in limits):
+        return None
+    for position in (current, target):
+        if not all(0 <= value <= limit for value, limit in zip(position, limits)):
+            return None
+    if math.hypot(target[0] - current[0], target[1] - current[1]) > max_hop:
+        return None
+    height = min(current[2], target[2]) - clearance
+    if height <= 0:
+        return None
+    return height
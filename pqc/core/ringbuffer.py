@@ -0,0 +1,54 @@
+"""Fixed capacity ring buffer."""
+
+from typing import Sequence
+
+import numpy as np
+
+__all__ = ["RingBuffer"]
+
+
+class RingBuffer:
+    """Fixed capacity ring buffer of float rows backed by a NumPy array,
+    appending to a full buffer overwrites the oldest row.
+
+    >>> buffer = RingBuffer(2, 2)
+    >>> for row in [(1, 2), (3, 4), (5, 6)]:
+    ...     buffer.append(row)
+    >>> buffer.to_array().tolist()
+    [[3.0, 4.0], [5.0, 6.0]]
+    """
+
+    def __init__(self, capacity: int, columns: int = 1) -> None:
+        self._data: np.ndarray = np.empty((max(1, capacity), columns), dtype=float)
+        self._start: int = 0
+        self._size: int = 0
+
+    @property
+    def capacity(self) -> int:
+        return len(self._data)
+
+    @property
+    def full(self) -> bool:
+        return self._size == len(self._data)
+
+    def __len__(self) -> int:
+        return self._size
+
+    def append(self, row: Sequence[float]) -> None:
+        capacity = len(self._data)
+        self._data[(self._start + self._size) % capacity] = row
+        if self._size < capacity:
+            self._size += 1
+        else:
+            self._start = (self._start + 1) % capacity
+
+    def clear(self) -> None:
+        self._start = 0
+        self._size = 0
+
+    def to_array(self) -> np.ndarray:
+        """Return copy of all rows, oldest first."""
+        end = self._start + self._size
+        if end <= len(self._data):
+            return self._data[self._start:end].copy()
+        return np.concatenate((self._data[self._start:], self._data[:end - len(self._data)]))
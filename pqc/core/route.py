@@ -0,0 +1,101 @@
+"""Route planning for table movements."""
+
+import math
+from typing import List, Optional, Sequence, Tuple
+
+import numpy as np
+
+__all__ = ["route_length", "plan_route"]
+
+Point = Tuple[float, float]
+
+
+def route_length(points: Sequence[Point], order: Sequence[int], start: Optional[Point] = None) -> float:
+    """Return length of open path visiting points in order, starting at
+    optional start point.
+
+    >>> route_length([(0, 0), (3, 4), (3, 0)], [0, 1, 2])
+    9.0
+    """
+    path = [tuple(points[index]) for index in order]
+    if start is not None:
+        path.insert(0, tuple(start))
+    return float(sum(math.dist(a, b) for a, b in zip(path, path[1:])))
+
+
+def plan_route(points: Sequence[Point], start: Optional[Point] = None,
+               pin_first: bool = False, pin_last: bool = False,
+               max_passes: int = 64) -> List[int]:
+    """Return order of points minimizing the open path length using nearest
+    neighbour construction and 2-opt improvement.
+
+    If `start` is given the path starts at this position (e.g. the current
+    table position). Pinned first or last points keep their place. Returns
+    the original order if no shorter route was found.
+
+    >>> plan_route([(0, 0), (10, 0), (1, 0), (11, 0)])
+    [0, 2, 1, 3]
+    """
+    count = len(points)
+    identity = list(range(count))
+    if count < 2 or (count < 3 and start is None):
+        return identity
+    coords = np.asarray(points, dtype=float).reshape(count, -1)
+    deltas = coords[:, None, :] - coords[None, :, :]
+    distances = np.sqrt((deltas ** 2).sum(axis=-1))
+    if start is not None:
+        start_distances = np.sqrt(((coords - np.asarray(start, dtype=float)) ** 2).sum(axis=-1))
+    else:
+        start_distances = np.zeros(count)
+
+    first = [0] if pin_first and count else []
+    last = [count - 1] if pin_last and count > len(first) else []
+    remaining = [index for index in identity if index not in first and index not in last]
+
+    # Nearest neighbour construction
+    order = list(first)
+    while remaining:
+        if order:
+            row = distances[order[-1]]
+        elif start is not None:
+            row = start_distances
+        else:
+            row = None
+        if row is None:
+            index = remaining[0]
+        else:
+            index = min(remaining, key=lambda i: row[i])
+        order.append(index)
+        remaining.remove(index)
+    order.extend(last)
+
+    def distance(a: Optional[int], b: Optional[int]) -> float:
+        if a is None or b is None:
+            return 0.
+        if a < 0:
+            return float(start_distances[b])
+        return float(distances[a, b])
+
+    # 2-opt improvement by reversing segments, -1 denotes start position
+    head = -1 if start is not None else None
+    lower = len(first)
+    upper = count - len(last)
+    for _ in range(max_passes):
+        improved = False
+        for i in range(lower, upper - 1):
+            for j in range(i + 1, upper):
+                before = order[i - 1] if i > 0 else head
+                after = order[j + 1] if j + 1 < count else None
+                delta = (
+                    distance(before, order[j]) + distance(order[i], after)
+                    - distance(before, order[i]) - distance(order[j], after)
+                )
+                if delta < -1e-9:
+                    order[i:j + 1] = order[i:j + 1][::-1]
+                    improved = True
+        if not improved:
+            break
+
+    if route_length(points, order, start) < route_length(points, identity, start):
+        return order
+    return identity
@@ -0,0 +1,45 @@
+import json
+from collections.abc import Mapping
+from typing import Any, Dict
+
+import numpy as np
+
+__all__ = ["NumpyEncoder", "serialize_npz", "deserialize_npz"]
+
+
+class NumpyEncoder(json.JSONEncoder):
+    def default(self, obj):
+        if isinstance(obj, np.ndarray):
+            return obj.tolist()
+        if isinstance(obj, Mapping):
+            return dict(obj)
+        return super().default(obj)
+
+
+def serialize_npz(data: dict, fp) -> None:
+    """Serialize data dictionary to compressed NumPy archive.
+
+    Series are stored as typed arrays named `series/<key>`, meta data, series
+    units and analysis results are stored as JSON string named `header`.
+    """
+    header = {
+        "meta": data.get("meta", {}),
+        "series_units": data.get("series_units", {}),
+        "analysis": data.get("analysis", {}),
+    }
+    arrays: Dict[str, Any] = {"header": np.array(json.dumps(header, cls=NumpyEncoder))}
+    for key, values in data.get("series", {}).items():
+        arrays[f"series/{key}"] = np.asarray(values)
+    np.savez_compressed(fp, **arrays)
+
+
+def deserialize_npz(fp) -> dict:
+    """Return data dictionary from compressed NumPy archive."""
+    with np.load(fp) as archive:
+        data = json.loads(str(archive["header"]))
+        data["series"] = {}
+        prefix = "series/"
+        for name in archive.files:
+            if name.startswith(prefix):
+                data["series"][name[len(prefix):]] = archive[name]
+    return data
@@ -0,0 +1,118 @@
+"""Columnar series storage."""
+
+from collections.abc import Mapping
+from typing import Dict, FrozenSet, Iterator
+
+import numpy as np
+
+__all__ = ["SeriesStore"]
+
+
+class SeriesStore(Mapping):
+    """Columnar series storage backed by preallocated NumPy arrays.
+
+    Columns must be registered before the first row is appended. Rows are
+    appended in place, the buffers grow in chunks if the reserved capacity
+    is exceeded. Item access returns read only views of the valid rows
+    without copying.
+
+    >>> store = SeriesStore()
+    >>> store.register("voltage")
+    >>> store.register("current")
+    >>> store.reserve(11)
+    >>> store.append(voltage=0.0, current=1e-9)
+    >>> store["voltage"]
+    array([0.])
+    """
+
+    chunk_size: int = 256
+
+    def __init__(self, dtype=float) -> None:
+        self._dtype: np.dtype = np.dtype(dtype)
+        self._columns: Dict[str, np.ndarray] = {}
+        self._keys: FrozenSet[str] = frozenset()
+        self._size: int = 0
+        self._capacity: int = 0
+
+    @property
+    def size(self) -> int:
+        """Number of rows."""
+        return self._size
+
+    @property
+    def capacity(self) -> int:
+        """Number of allocated rows."""
+        return self._capacity
+
+    def register(self, key: str) -> None:
+        """Register a new column.
+
+        Raise `KeyError` if column already exists and `ValueError` if rows
+        have already been appended.
+        """
+        if key in self._columns:
+            raise KeyError(f"Series already exists: {key}")
+        if self._size:
+            raise ValueError(f"Unable to register series after rows were appended: {key}")
+        self._columns[key] = np.empty(self._capacity, dtype=self._dtype)
+        self._keys = frozenset(self._columns)
+
+    def reserve(self, capacity: int) -> None:
+        """Preallocate buffers for at least `capacity` rows."""
+        if capacity > self._capacity:
+            for key, column in self._columns.items():
+                buffer = np.empty(capacity, dtype=self._dtype)
+                buffer[:self._size] = column[:self._size]
+                self._columns[key] = buffer
+            self._capacity = capacity
+
+    def append(self, **kwargs) -> None:
+        """Append a row, keys must match the registered columns.
+
+        Raise `KeyError` on inconsistent keys.
+        """
+        if kwargs.keys() != self._keys:
+            raise KeyError("Inconsistent series keys")
+        index = self._size
+        if index >= self._capacity:
+            self.reserve(self._capacity + max(self.chunk_size, self._capacity // 2))
+        columns = self._columns
+        for key, value in kwargs.items():
+            columns[key][index] = value
+        self._size = index + 1
+
+    def extend(self, **kwargs) -> None:
+        """Append multiple rows from equally sized arrays, keys must match
+        the registered columns.
+
+        Raise `KeyError` on inconsistent keys and `ValueError` on arrays of
+        different size.
+        """
+        if kwargs.keys() != self._keys:
+            raise KeyError("Inconsistent series keys")
+        arrays = {key: np.asarray(value, dtype=self._dtype).ravel() for key, value in kwargs.items()}
+        sizes = {len(array) for array in arrays.values()}
+        if len(sizes) > 1:
+            raise ValueError("Inconsistent series sizes")
+        count = sizes.pop() if sizes else 0
+        size = self._size + count
+        if size > self._capacity:
+            self.reserve(max(size, self._capacity + max(self.chunk_size, self._capacity // 2)))
+        for key, array in arrays.items():
+            self._columns[key][self._size:size] = array
+        self._size = size
+
+    def clear(self) -> None:
+        """Remove all rows, keeps registered columns and allocated buffers."""
+        self._size = 0
+
+    def __getitem__(self, key: str) -> np.ndarray:
+        view = self._columns[key][:self._size]
+        view.flags.writeable = False
+        return view
+
+    def __iter__(self) -> Iterator[str]:
+        return iter(self._columns)
+
+    def __len__(self) -> int:
+        return len(self._columns)
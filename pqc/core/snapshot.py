@@ -0,0 +1,116 @@
+"""Immutable timestamped worker state snapshots.
+
+Workers publish a new snapshot by replacing a single reference, readers on
+any thread get a consistent state without locking or queueing requests.
+"""
+
+import math
+import threading
+import time
+import types
+from typing import Any, Dict, Mapping, Optional
+
+__all__ = ["StateSnapshot", "TableState", "EnvironmentState", "StateCell"]
+
+
+class StateSnapshot:
+    """Immutable state snapshot, subclasses declare fields in `defaults`.
+
+    Every field keeps the timestamp it was last published, so publishing
+    one field does not make the other fields look fresh. Fields never
+    published have an infinite age.
+    """
+
+    __slots__ = ("timestamp", "timestamps")
+
+    timestamp: float
+    timestamps: Mapping[str, float]
+
+    defaults: Dict[str, Any] = {}
+
+    def __init__(self, timestamp: Optional[float] = None, timestamps: Optional[Dict[str, float]] = None, **values) -> None:
+        unknown = set(values) - set(self.defaults)
+        if unknown:
+            raise TypeError(f"unknown state field(s): {', '.join(sorted(unknown))}")
+        if timestamp is None:
+            timestamp = time.monotonic()
+        field_timestamps = {}
+        for name, default in self.defaults.items():
+            object.__setattr__(self, name, values.get(name, default))
+            field_timestamps[name] = timestamp if name in values else -math.inf
+        field_timestamps.update(timestamps or {})
+        object.__setattr__(self, "timestamp", timestamp)
+        object.__setattr__(self, "timestamps", types.MappingProxyType(field_timestamps))
+
+    def __setattr__(self, name: str, value: Any) -> None:
+        raise AttributeError(f"{type(self).__name__} is immutable")
+
+    def __repr__(self) -> str:
+        values = ", ".join(f"{name}={getattr(self, name)!r}" for name in self.defaults)
+        return f"{type(self).__name__}({values}, timestamp={self.timestamp!r})"
+
+    @property
+    def age(self) -> float:
+        """Return age of snapshot in seconds."""
+        return time.monotonic() - self.timestamp
+
+    def field_age(self, name: str) -> float:
+        """Return seconds since field `name` was last published."""
+        return time.monotonic() - self.timestamps[name]
+
+    def asdict(self) -> Dict[str, Any]:
+        return {name: getattr(self, name) for name in self.defaults}
+
+    def replace(self, **changes) -> "StateSnapshot":
+        """Return new snapshot with changed fields and current timestamp,
+        only the timestamps of changed fields are updated."""
+        values = self.asdict()
+        values.update(changes)
+        timestamp = time.monotonic()
+        timestamps = dict(self.timestamps)
+        timestamps.update({name: timestamp for name in changes})
+        return type(self)(timestamp=timestamp, timestamps=timestamps, **values)
+
+
+class TableState(StateSnapshot):
+    """Table state with position and caldone in millimeters."""
+
+    __slots__ = ("position", "caldone", "joystick", "error")
+
+    defaults = {
+        "position": (math.nan, math.nan, math.nan),
+        "caldone": (math.nan, math.nan, math.nan),
+        "joystick": None,
+        "error": None,
+    }
+
+
+class EnvironmentState(StateSnapshot):
+    """Environment box state with last PC data."""
+
+    __slots__ = ("pc_data", "error")
+
+    defaults = {
+        "pc_data": None,
+        "error": None,
+    }
+
+
+class StateCell:
+    """Holds the latest snapshot, replaced atomically on publish.
+
+    Reading requires no lock, concurrent publishers are serialized.
+    """
+
+    def __init__(self, state: StateSnapshot) -> None:
+        self._state: StateSnapshot = state
+        self._lock = threading.Lock()
+
+    def get(self) -> StateSnapshot:
+        return self._state
+
+    def publish(self, **changes) -> StateSnapshot:
+        with self._lock:
+            state = self._state.replace(**changes)
+            self._state = state
+        return state
@@ -0,0 +1,85 @@
+"""Append-only streaming of measurement data."""
+
+import json
+import os
+from typing import Any, Dict, Optional, Type
+
+from .timer import Timer
+
+__all__ = ["StreamWriter", "read_stream"]
+
+KEY_META = "meta"
+KEY_SERIES = "series"
+KEY_SERIES_UNITS = "series_units"
+KEY_ANALYSIS = "analysis"
+
+
+class StreamWriter:
+    """Append-only JSON lines writer for measurement data.
+
+    Every record is written as a single line using the same keys as the
+    measurement data layout. File buffers are synced to disk at most every
+    `fsync_interval` seconds, an interval of zero syncs on every record.
+
+    >>> with open("data.partial", "w") as f:
+    >>>     stream = StreamWriter(f, fsync_interval=1.0)
+    >>>     stream.write_meta("sample_name", "spam")
+    >>>     stream.write_series_unit("voltage", "V")
+    >>>     stream.write_row({"voltage": 1.0})
+    >>>     stream.sync()
+    """
+
+    def __init__(self, f, fsync_interval: float = 1.0, cls: Optional[Type[json.JSONEncoder]] = None) -> None:
+        self._f = f
+        self.fsync_interval: float = fsync_interval
+        self._encoder: json.JSONEncoder = (cls or json.JSONEncoder)()
+        self._timer: Timer = Timer()
+
+    def write_meta(self, key: str, value: Any) -> None:
+        self._write_record(KEY_META, {key: value})
+
+    def write_series_unit(self, key: str, value: str) -> None:
+        self._write_record(KEY_SERIES_UNITS, {key: value})
+
+    def write_row(self, row: Dict[str, Any]) -> None:
+        self._write_record(KEY_SERIES, row)
+
+    def write_analysis(self, key: str, value: Any) -> None:
+        self._write_record(KEY_ANALYSIS, {key: value})
+
+    def _write_record(self, key: str, value: Any) -> None:
+        self._f.write(self._encoder.encode({key: value}))
+        self._f.write("\n")
+        if self._timer.delta() >= self.fsync_interval:
+            self.sync()
+
+    def sync(self) -> None:
+        """Flush write buffer and sync file to disk."""
+        self._f.flush()
+        os.fsync(self._f.fileno())
+        self._timer.reset()
+
+
+def read_stream(f) -> dict:
+    """Return measurement data dictionary restored from a stream file.
+
+    An incomplete last record (e.g. on power loss) is ignored.
+    """
+    data: dict = {
+        KEY_META: {},
+        KEY_SERIES_UNITS: {},
+        KEY_SERIES: {},
+        KEY_ANALYSIS: {},
+    }
+    for line in f:
+        try:
+            record = json.loads(line)
+        except ValueError:
+            break
+        for key, value in record.items():
+            if key == KEY_SERIES:
+                for name, item in value.items():
+                    data[KEY_SERIES].setdefault(name, []).append(item)
+            elif key in data:
+                data[key].update(value)
+    return data
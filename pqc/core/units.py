@@ -0,0 +1,71 @@
+"""Fast unit conversion using precomputed scale factors.
+
+Pint is used for parsing configuration strings, conversions between metric
+prefixes of the same unit in hot code paths use plain scale factors.
+"""
+
+import functools
+from typing import Tuple
+
+import numpy as np
+
+__all__ = ["scale_factor", "convert", "convert_array"]
+
+PREFIXES = {
+    "T": 12,
+    "G": 9,
+    "M": 6,
+    "k": 3,
+    "": 0,
+    "m": -3,
+    "u": -6,
+    "µ": -6,
+    "n": -9,
+    "p": -12,
+    "f": -15,
+}
+
+BASE_UNITS = ("m", "s", "V", "A", "F", "Hz", "ohm", "W")
+
+
+def _parse_unit(unit: str) -> Tuple[int, str]:
+    if unit in BASE_UNITS:
+        return 0, unit
+    prefix, base = unit[:1], unit[1:]
+    if prefix in PREFIXES and base in BASE_UNITS:
+        return PREFIXES[prefix], base
+    raise ValueError(f"Unsupported unit: {unit!r}")
+
+
+@functools.lru_cache(maxsize=None)
+def scale_factor(unit: str, target: str) -> float:
+    """Return factor converting values of `unit` to `target` unit.
+
+    Raise `ValueError` for unsupported or incompatible units.
+
+    >>> scale_factor("um", "mm")
+    0.001
+    """
+    exponent, base = _parse_unit(unit)
+    target_exponent, target_base = _parse_unit(target)
+    if base != target_base:
+        raise ValueError(f"Incompatible units: {unit!r}, {target!r}")
+    return 10.0 ** (exponent - target_exponent)
+
+
+def convert(value: float, unit: str, target: str) -> float:
+    """Convert scalar value of `unit` to `target` unit.
+
+    >>> convert(42.0, "A", "uA")
+    42000000.0
+    """
+    return value * scale_factor(unit, target)
+
+
+def convert_array(values, unit: str, target: str) -> np.ndarray:
+    """Convert array of values of `unit` to `target` unit.
+
+    >>> convert_array([1, 2], "F", "pF")
+    array([1.e+12, 2.e+12])
+    """
+    return np.asarray(values, dtype=float) * scale_factor(unit, target)
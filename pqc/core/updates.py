@@ -0,0 +1,107 @@
+"""Coalescing buffer for measurement updates."""
+
+import threading
+from typing import Any, Dict, List, Optional, Tuple
+
+import numpy as np
+
+__all__ = ["UpdateBatch", "UpdateBuffer"]
+
+
+class UpdateBatch:
+    """Coalesced measurement updates.
+
+    Readings are arrays of x and y values by series name in order of
+    arrival, state contains the latest value for every key.
+    """
+
+    __slots__ = (
+        "readings",
+        "readings_updated",
+        "state"
+    )
+
+    def __init__(self, readings: Dict[str, Tuple[np.ndarray, np.ndarray]], readings_updated: bool, state: Dict[str, Any]) -> None:
+        self.readings: Dict[str, Tuple[np.ndarray, np.ndarray]] = readings
+        self.readings_updated: bool = readings_updated
+        self.state: Dict[str, Any] = state
+
+
+class UpdateSegment:
+
+    __slots__ = (
+        "readings",
+        "readings_updated",
+        "state"
+    )
+
+    def __init__(self) -> None:
+        self.readings: Dict[str, Tuple[List[float], List[float]]] = {}
+        self.readings_updated: bool = False
+        self.state: Dict[str, Any] = {}
+
+    def __bool__(self) -> bool:
+        return bool(self.readings or self.readings_updated or self.state)
+
+    def to_batch(self) -> UpdateBatch:
+        readings = {
+            name: (np.array(xs, dtype=float), np.array(ys, dtype=float))
+            for name, (xs, ys) in self.readings.items()
+        }
+        return UpdateBatch(readings, self.readings_updated, self.state)
+
+
+class UpdateBuffer:
+    """Thread safe buffer coalescing readings and state updates until taken
+    as a single batch.
+
+    A barrier separates updates written before and after it. Updates behind
+    a barrier are not taken until the barrier is released, this keeps
+    batches in order with other events queued by the writer.
+
+    >>> buffer = UpdateBuffer()
+    >>> buffer.append_reading("iv", 1.0, 2.0)
+    >>> buffer.update_state({"voltage": 1.0})
+    >>> batch = buffer.take()
+    >>> batch.readings["iv"]
+    (array([1.]), array([2.]))
+    """
+
+    def __init__(self) -> None:
+        self._lock: threading.Lock = threading.Lock()
+        self._segments: List[UpdateSegment] = [UpdateSegment()]
+
+    def append_reading(self, name: str, x: float, y: float) -> None:
+        with self._lock:
+            xs, ys = self._segments[-1].readings.setdefault(name, ([], []))
+            xs.append(x)
+            ys.append(y)
+
+    def update_readings(self) -> None:
+        with self._lock:
+            self._segments[-1].readings_updated = True
+
+    def update_state(self, data: Dict[str, Any]) -> None:
+        with self._lock:
+            self._segments[-1].state.update(data)
+
+    def barrier(self) -> None:
+        """Insert barrier, following updates are held back until the barrier
+        is released by `take(release=True)`."""
+        with self._lock:
+            self._segments.append(UpdateSegment())
+
+    def take(self, release: bool = False) -> Optional[UpdateBatch]:
+        """Return buffered updates in front of the first barrier and clear
+        them, returns `None` if there are no pending updates. If `release`
+        is True the first barrier is removed.
+        """
+        with self._lock:
+            segment = self._segments[0]
+            if release and len(self._segments) > 1:
+                self._segments.pop(0)
+            else:
+                self._segments[0] = UpdateSegment()
+        if segment:
+            return segment.to_batch()
+        return None
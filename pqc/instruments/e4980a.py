@@ -1,4 +1,4 @@
-from typing import Tuple
+from typing import Sequence, Tuple
 
 from comet.driver import Driver
 from comet.driver.iec60488 import IEC60488, lock
@@ -6,6 +6,24 @@ from comet.driver.iec60488 import IEC60488, lock
 __all__ = ["E4980A"]
 
 
+def format_list(values: Sequence[float]) -> str:
+    """Return comma separated list of values.
+
+    >>> format_list([1e3, 1e4])
+    '1.000000E+03,1.000000E+04'
+    """
+    return ",".join(format(value, "E") for value in values)
+
+
+def parse_list(result: str) -> Tuple[float, ...]:
+    """Return tuple of floats from comma separated list.
+
+    >>> parse_list("+1.00000E+03,+1.00000E+04")
+    (1000.0, 10000.0)
+    """
+    return tuple(float(value) for value in result.split(",") if value.strip())
+
+
 class Bias(Driver):
 
     class Current(Driver):
@@ -165,6 +183,13 @@ class Fetch(Driver):
         result = self.resource.query(":FETC?")
         return tuple(map(float, result.split(",")))
 
+    @lock
+    def sweep(self) -> Tuple[Tuple[float, ...], ...]:
+        """Return list sweep results, tuple with four values (primary,
+        secondary, status, comparator) for every sweep point."""
+        values = parse_list(self.resource.query(":FETC?"))
+        return tuple(values[index:index + 4] for index in range(0, len(values), 4))
+
 
 class Frequency(Driver):
 
@@ -179,6 +204,12 @@ class Frequency(Driver):
         self.resource.query("*OPC?")
 
 
+class List(Driver):
+    """List sweep, a single trigger measures all points of the list."""
+
+    MAXIMUM_POINTS: int = 201
+
+
 class System(Driver):
 
     class Beeper(Driver):
@@ -215,4 +246,12 @@ class E4980A(IEC60488):
         self.display = Display(resource)
         self.fetch = Fetch(resource)
         self.frequency = Frequency(resource)
+        self.list = List(resource)
         self.system = System(resource)
+
+    @lock
+    def trg(self) -> Tuple[float, ...]:
+        """Trigger measurement and return tuple with three values, requires
+        trigger source `BUS`."""
+        result = self.resource.query("*TRG")
+        return tuple(map(float, result.split(",")))
@@ -1,8 +1,8 @@
-from typing import Tuple
+from typing import Callable, List, Optional, Sequence, Tuple
 
 from comet.driver.keithley import K2410
 
-from .smu import SMUInstrument
+from .smu import SMUInstrument, parse_sweep_readings
 
 __all__ = ["K2410Instrument"]
 
@@ -11,13 +11,16 @@ class K2410Instrument(SMUInstrument):
 
     def __init__(self, context) -> None:
         super().__init__(K2410(context))
+        self._read_function: Optional[str] = None
 
     def reset(self) -> None:
+        self._read_function = None
         self.context.reset()
         self.context.clear()
         self.context.system.beeper.status = False
 
     def clear(self) -> None:
+        self._read_function = None
         self.context.clear()
 
     def get_error(self) -> Tuple[int, str]:
@@ -192,18 +195,76 @@ class K2410Instrument(SMUInstrument):
 
     # Reading
 
-    def read_current(self) -> float:
-        self.context.format.elements = ["CURRENT"]
+    def _configure_read(self, function: str) -> None:
+        """Configure read format and sense function, skipped if unchanged
+        since last reading."""
+        if self._read_function == function:
+            return
+        self._read_function = None
+        element, sense = {
+            "CURRENT": ("CURRENT", "CURR"),
+            "VOLTAGE": ("VOLTAGE", "VOLT"),
+        }[function]
+        self.context.format.elements = [element]
         self.context.resource.write(":SENS:FUNC:CONC ON")
         self.context.resource.query("*OPC?")
-        self.context.resource.write(":SENS:FUNC:ON 'CURR'")
+        self.context.resource.write(f":SENS:FUNC:ON '{sense}'")
         self.context.resource.query("*OPC?")
+        self._read_function = function
+
+    def read_current(self) -> float:
+        self._configure_read("CURRENT")
         return self.context.read()[0]
 
     def read_voltage(self) -> float:
-        self.context.format.elements = ["VOLTAGE"]
-        self.context.resource.write(":SENS:FUNC:CONC ON")
-        self.context.resource.query("*OPC?")
-        self.context.resource.write(":SENS:FUNC:ON 'VOLT'")
-        self.context.resource.query("*OPC?")
+        self._configure_read("VOLTAGE")
         return self.context.read()[0]
+
+    # Buffered sweep
+
+    SWEEP_POINTS_MAXIMUM: int = 100
+
+    def sweep_voltage(self, voltages: Sequence[float], delay: float, timeout: float = 60.0, stop_requested: Optional[Callable[[], bool]] = None) -> List[Tuple[float, float]]:
+        self.check_sweep_points(voltages)
+        # Sweep changes the read format
+        self._read_function = None
+        resource = self.context.resource
+        source_delay = float(resource.query(":SOUR:DEL?"))
+        source_delay_auto = int(resource.query(":SOUR:DEL:AUTO?"))
+        values = ",".join(format(value, "E") for value in voltages)
+        resource.write(":SOUR:VOLT:MODE LIST")
+        resource.write(f":SOUR:LIST:VOLT {values}")
+        resource.write(f":SOUR:DEL {delay:E}")
+        resource.write(f":TRIG:COUN {len(voltages):d}")
+        resource.write(":FORM:ELEM VOLT,CURR")
+        # Abort sweep on compliance
+        resource.write(":SOUR:SWE:CAB EARL")
+        resource.query("*OPC?")
+        readings: List[Tuple[float, float]] = []
+        try:
+            resource.write("*CLS")
+            resource.write(":INIT")
+            resource.write("*OPC")
+            if self.wait_operation_complete(timeout + len(voltages) * delay, stop_requested):
+                readings = parse_sweep_readings(resource.query(":FETC?"))[:len(voltages)]
+        finally:
+            resource.write(":ABOR")
+            if not readings:
+                readings = self._fetch_sweep_readings(len(voltages))
+            # Return to fixed source mode at the last applied voltage, the
+            # first list point if unknown (one step from the previous level)
+            resource.write(f":SOUR:VOLT:LEV {voltages[max(0, len(readings) - 1)]:E}")
+            resource.write(":SOUR:SWE:CAB NEV")
+            resource.write(":SOUR:VOLT:MODE FIX")
+            resource.write(":TRIG:COUN 1")
+            resource.write(f":SOUR:DEL {source_delay:E}")
+            resource.write(f":SOUR:DEL:AUTO {source_delay_auto:d}")
+            resource.query("*OPC?")
+        return readings
+
+    def _fetch_sweep_readings(self, count: int) -> List[Tuple[float, float]]:
+        """Return readings of an aborted sweep, empty list if none available."""
+        try:
+            return parse_sweep_readings(self.context.resource.query(":FETC?"))[:count]
+        except Exception:
+            return []
@@ -1,8 +1,8 @@
-from typing import Tuple
+from typing import Callable, List, Optional, Sequence, Tuple
 
 from comet.driver import Driver
 
-from .smu import SMUInstrument
+from .smu import SMUInstrument, parse_sweep_readings
 
 __all__ = ["K2470Instrument"]
 
@@ -11,8 +11,10 @@ class K2470Instrument(SMUInstrument):
 
     def __init__(self, context) -> None:
         super().__init__(Driver(context))
+        self._sense_function: Optional[str] = None
 
     def reset(self) -> None:
+        self._sense_function = None
         self.context.resource.write("*RST")
         self.context.resource.query("*OPC?")
         # TODO
@@ -20,6 +22,7 @@ class K2470Instrument(SMUInstrument):
             raise RuntimeError("K2470 instrument not in SCPI mode!")
 
     def clear(self) -> None:
+        self._sense_function = None
         self.context.resource.write("*CLS")
         self.context.resource.query("*OPC?")
 
@@ -218,8 +221,56 @@ class K2470Instrument(SMUInstrument):
 
     # Reading
 
+    def _configure_read(self, function: str) -> None:
+        """Configure sense function, skipped if unchanged since last
+        reading."""
+        if self._sense_function == function:
+            return
+        self._sense_function = None
+        self.context.resource.write(f":SENS:FUNC \"{function}\"")
+        self.context.resource.query("*OPC?")
+        self._sense_function = function
+
     def read_current(self) -> float:
-        return float(self.context.resource.query(":MEAS:CURR?"))
+        self._configure_read("CURR")
+        return float(self.context.resource.query(":READ?"))
 
     def read_voltage(self) -> float:
-        return float(self.context.resource.query(":MEAS:VOLT?"))
+        self._configure_read("VOLT")
+        return float(self.context.resource.query(":READ?"))
+
+    # Buffered sweep
+
+    SWEEP_POINTS_MAXIMUM: int = 1000
+
+    def sweep_voltage(self, voltages: Sequence[float], delay: float, timeout: float = 60.0, stop_requested: Optional[Callable[[], bool]] = None) -> List[Tuple[float, float]]:
+        self.check_sweep_points(voltages)
+        resource = self.context.resource
+        values = ",".join(format(value, "E") for value in voltages)
+        self._sense_function = None
+        resource.write(":SENS:FUNC \"CURR\"")
+        resource.write(":TRAC:CLE \"defbuffer1\"")
+        resource.write(f":SOUR:LIST:VOLT {values}")
+        # Trigger model aborts the sweep if the source limit is exceeded
+        resource.write(f":SOUR:SWE:VOLT:LIST 1, {delay:E}, 1, ON")
+        resource.query("*OPC?")
+        resource.write("*CLS")
+        resource.write(":INIT")
+        resource.write("*OPC")
+        readings: List[Tuple[float, float]] = []
+        try:
+            if not self.wait_operation_complete(timeout + len(voltages) * delay, stop_requested):
+                resource.write(":ABOR")
+            count = min(int(resource.query(":TRAC:ACT? \"defbuffer1\"")), len(voltages))
+            if count:
+                result = resource.query(f":TRAC:DATA? 1, {count:d}, \"defbuffer1\", SOUR, READ")
+                readings = parse_sweep_readings(result)
+        except Exception:
+            resource.write(":ABOR")
+            raise
+        finally:
+            # Keep voltage of last reading as source level
+            if readings:
+                resource.write(f":SOUR:VOLT:LEV {voltages[len(readings) - 1]:E}")
+            resource.query("*OPC?")
+        return readings
@@ -1,8 +1,8 @@
-from typing import Tuple
+from typing import Callable, List, Optional, Sequence, Tuple
 
 from comet.driver.keithley import K2657A
 
-from .smu import SMUInstrument
+from .smu import SMUInstrument, parse_sweep_readings
 
 __all__ = ["K2657AInstrument"]
 
@@ -194,3 +194,67 @@ class K2657AInstrument(SMUInstrument):
 
     def read_voltage(self) -> float:
         return self.context.measure.v()
+
+    # Buffered sweep
+
+    SWEEP_POINTS_MAXIMUM: int = 1000
+
+    SWEEP_LIST_CHUNK: int = 100
+    """Number of voltages loaded into the source list per command."""
+
+    def sweep_voltage(self, voltages: Sequence[float], delay: float, timeout: float = 60.0, stop_requested: Optional[Callable[[], bool]] = None) -> List[Tuple[float, float]]:
+        self.check_sweep_points(voltages)
+        resource = self.context.resource
+        measure_delay = float(resource.query("print(smua.measure.delay)"))
+        # Load source list in chunks to keep command lines short
+        resource.write("pqc_sweep_list = {}")
+        for offset in range(0, len(voltages), self.SWEEP_LIST_CHUNK):
+            values = ", ".join(format(value, "E") for value in voltages[offset:offset + self.SWEEP_LIST_CHUNK])
+            resource.write(f"for _, v in ipairs({{{values}}}) do table.insert(pqc_sweep_list, v) end")
+        resource.write("smua.nvbuffer1.clear()")
+        resource.write("smua.nvbuffer2.clear()")
+        resource.write("smua.trigger.source.listv(pqc_sweep_list)")
+        resource.write("smua.trigger.source.action = smua.ENABLE")
+        resource.write("smua.trigger.measure.iv(smua.nvbuffer1, smua.nvbuffer2)")
+        resource.write("smua.trigger.measure.action = smua.ENABLE")
+        resource.write(f"smua.measure.delay = {delay:E}")
+        resource.write("smua.trigger.endpulse.action = smua.SOURCE_HOLD")
+        resource.write("smua.trigger.endsweep.action = smua.SOURCE_HOLD")
+        resource.write("smua.trigger.arm.count = 1")
+        resource.write(f"smua.trigger.count = {len(voltages):d}")
+        readings: List[Tuple[float, float]] = []
+        try:
+            # The trigger model runs in background, the sweep can be aborted
+            # while polling its state
+            resource.write("smua.trigger.initiate()")
+            if not self.wait_operation_complete(timeout + len(voltages) * delay, stop_requested):
+                resource.write("smua.abort()")
+        except Exception:
+            resource.write("smua.abort()")
+            raise
+        finally:
+            resource.write(f"smua.measure.delay = {measure_delay:E}")
+            count = min(int(float(resource.query("print(smua.nvbuffer1.n)"))), len(voltages))
+            if count:
+                # Voltages in buffer 2, currents in buffer 1
+                result = resource.query(f"printbuffer(1, {count:d}, smua.nvbuffer2.readings, smua.nvbuffer1.readings)")
+                readings = parse_sweep_readings(result)
+            # Output holds the last applied voltage, keep source level in sync
+            resource.write(f"smua.source.levelv = {voltages[max(0, count - 1)]:E}")
+        return readings
+
+    def operation_complete(self) -> bool:
+        """Return True if the trigger model sweep is finished. The 2600B
+        trigger model has no conditional branch, a sweep in compliance is
+        aborted on polling, readings beyond compliance are discarded by the
+        caller."""
+        result = self.context.resource.query(
+            "print(bit.bitand(status.operation.sweeping.condition, status.operation.sweeping.SMUA), smua.source.compliance)"
+        )
+        sweeping, compliance = result.split()
+        if not int(float(sweeping)):
+            return True
+        if compliance == "true":
+            self.context.resource.write("smua.abort()")
+            return True
+        return False
@@ -1,9 +1,10 @@
 from abc import abstractmethod
-from typing import Tuple
+from typing import Callable, List, Optional, Sequence, Tuple
 
+from ..core.backoff import Backoff, poll_until
 from .instrument import Instrument
 
-__all__ = ["SMUInstrument"]
+__all__ = ["SMUInstrument", "parse_sweep_readings"]
 
 
 class SMUInstrument(Instrument):
@@ -229,3 +230,56 @@ class SMUInstrument(Instrument):
     @abstractmethod
     def read_voltage(self) -> float:
         ...
+
+    # Buffered sweep
+
+    SWEEP_POINTS_MAXIMUM: int = 0
+    """Maximum number of points per buffered sweep, zero if not supported.
+
+    Instruments supporting buffered sweeps set this limit and implement
+    `sweep_voltage(voltages, delay, timeout=60.0, stop_requested=None)`,
+    sourcing the list of voltages using the instrument trigger model and
+    returning a list of (voltage, current) readings. The sweep is aborted on
+    compliance or if `stop_requested` returns True, in that case fewer
+    readings than voltages are returned. The source level is left at the
+    voltage of the last reading.
+    """
+
+    def check_sweep_points(self, voltages: Sequence[float]) -> None:
+        if not 0 < len(voltages) <= self.SWEEP_POINTS_MAXIMUM:
+            raise ValueError(f"Invalid number of sweep points: {len(voltages)}, maximum is {self.SWEEP_POINTS_MAXIMUM}")
+
+    def operation_complete(self) -> bool:
+        """Return True if operation complete bit of the event status
+        register is set, requires `*OPC` to be written after initiating the
+        operation."""
+        return bool(int(self.context.resource.query("*ESR?")) & 0x1)
+
+    def wait_operation_complete(self, timeout: float, stop_requested: Optional[Callable[[], bool]] = None, interval: float = 0.050) -> bool:
+        """Poll `operation_complete` until it returns True.
+
+        Returns False if `stop_requested` returned True before the operation
+        completed, the caller is responsible to abort the operation.
+        """
+        stopped = False
+
+        def predicate() -> bool:
+            nonlocal stopped
+            if stop_requested is not None and stop_requested():
+                stopped = True
+                return True
+            return self.operation_complete()
+
+        if not poll_until(predicate, timeout, Backoff(min(0.001, interval), interval)):
+            raise RuntimeError(f"Buffered sweep timeout, exceeded {timeout:G} s")
+        return not stopped
+
+
+def parse_sweep_readings(result: str) -> List[Tuple[float, float]]:
+    """Return list of (voltage, current) pairs from interleaved readings.
+
+    >>> parse_sweep_readings("1.0,2e-9,2.0,4e-9")
+    [(1.0, 2e-09), (2.0, 4e-09)]
+    """
+    values = [float(value) for value in result.split(",")]
+    return list(zip(values[0::2], values[1::2]))
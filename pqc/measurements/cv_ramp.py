@@ -2,7 +2,6 @@ import logging
 import time
 
 import comet
-import numpy as np
 
 from ..core.benchmark import Benchmark
 from ..core.estimate import Estimate
@@ -39,6 +38,7 @@ class CVRampMeasurement(MatrixMeasurement, HVSourceMixin, LCRMixin, EnvironmentM
         self.register_parameter("hvsrc_current_compliance", unit="A", required=True)
         self.register_parameter("hvsrc_accept_compliance", False, type=bool)
         self.register_vsource()
+        self.register_parameter("lcr_frequency", unit="Hz", required=True)
         self.register_lcr()
         self.register_environment()
         self.register_analysis()
@@ -80,6 +80,7 @@ class CVRampMeasurement(MatrixMeasurement, HVSourceMixin, LCRMixin, EnvironmentM
         waiting_time_after = self.get_parameter("waiting_time_after")
         waiting_time_start = self.get_parameter("waiting_time_start")
         waiting_time_end = self.get_parameter("waiting_time_end")
+        lcr_frequency = self.get_parameter("lcr_frequency")
         hvsrc_current_compliance = self.get_parameter("hvsrc_current_compliance")
         hvsrc_accept_compliance = self.get_parameter("hvsrc_accept_compliance")
 
@@ -97,6 +98,7 @@ class CVRampMeasurement(MatrixMeasurement, HVSourceMixin, LCRMixin, EnvironmentM
         self.set_meta("hvsrc_current_compliance", f"{hvsrc_current_compliance:G} A")
         self.set_meta("hvsrc_accept_compliance", hvsrc_accept_compliance)
         self.hvsrc_update_meta()
+        self.set_meta("lcr_frequency", f"{lcr_frequency:G} Hz")
         self.lcr_update_meta()
         self.environment_update_meta()
 
@@ -110,6 +112,8 @@ class CVRampMeasurement(MatrixMeasurement, HVSourceMixin, LCRMixin, EnvironmentM
         self.set_series_unit("temperature_box", "degC")
         self.set_series_unit("temperature_chuck", "degC")
         self.set_series_unit("humidity_box", "%")
+        self.set_series_unit("environment_age", "s")
+        self.set_series_unit("lcr_samples", "1")
 
         # Series
         self.register_series("timestamp")
@@ -121,26 +125,28 @@ class CVRampMeasurement(MatrixMeasurement, HVSourceMixin, LCRMixin, EnvironmentM
         self.register_series("temperature_box")
         self.register_series("temperature_chuck")
         self.register_series("humidity_box")
+        self.register_series("environment_age")
+        self.register_series("lcr_samples")
 
-        # Initialize HV Source
+        # Initialize instruments
 
-        self.hvsrc_reset(hvsrc)
         self.process.set_progress(3, 6)
 
-        self.hvsrc_setup(hvsrc)
-        hvsrc_current_compliance = self.get_parameter("hvsrc_current_compliance")
-        self.hvsrc_set_current_compliance(hvsrc, hvsrc_current_compliance)
+        self.run_concurrent(
+            lambda: self.initialize_hvsrc(hvsrc),
+            lambda: self.initialize_lcr(lcr),
+        )
         self.process.set_progress(4, 6)
 
+        if self.process.stop_requested:
+            return
+
+        # Output enable
+
         self.hvsrc_set_output_state(hvsrc, hvsrc.OUTPUT_ON)
         hvsrc_output_state = self.hvsrc_get_output_state(hvsrc)
         self.process.update_state({"hvsrc_output": hvsrc_output_state})
 
-        # Initialize LCR
-
-        self.lcr_reset(lcr)
-        self.lcr_setup(lcr)
-
         self.process.set_progress(5, 6)
 
         # Ramp to start voltage
@@ -165,6 +171,17 @@ class CVRampMeasurement(MatrixMeasurement, HVSourceMixin, LCRMixin, EnvironmentM
 
         self.process.set_progress(6, 6)
 
+    def initialize_hvsrc(self, hvsrc):
+        hvsrc_current_compliance = self.get_parameter("hvsrc_current_compliance")
+
+        self.hvsrc_reset(hvsrc)
+        self.hvsrc_setup(hvsrc)
+        self.hvsrc_set_current_compliance(hvsrc, hvsrc_current_compliance)
+
+    def initialize_lcr(self, lcr):
+        self.lcr_reset(lcr)
+        self.lcr_setup(lcr, self.get_parameter("lcr_frequency"))
+
     def measure(self, hvsrc, lcr):
         self.process.set_progress(1, 2)
         # Parameters
@@ -181,6 +198,7 @@ class CVRampMeasurement(MatrixMeasurement, HVSourceMixin, LCRMixin, EnvironmentM
         hvsrc_voltage_level = self.hvsrc_get_voltage_level(hvsrc)
 
         ramp = LinearRange(hvsrc_voltage_level, bias_voltage_stop, bias_voltage_step)
+        self.reserve_series(len(ramp) + 1)
         est = Estimate(len(ramp))
         self.process.set_progress(*est.progress)
 
@@ -245,7 +263,9 @@ class CVRampMeasurement(MatrixMeasurement, HVSourceMixin, LCRMixin, EnvironmentM
                     resistance=lcr_sec,
                     temperature_box=self.environment_temperature_box,
                     temperature_chuck=self.environment_temperature_chuck,
-                    humidity_box=self.environment_humidity_box
+                    humidity_box=self.environment_humidity_box,
+                    environment_age=self.environment_age,
+                    lcr_samples=self.lcr_sample_count
                 )
 
                 # Compliance tripped?
@@ -267,8 +287,8 @@ class CVRampMeasurement(MatrixMeasurement, HVSourceMixin, LCRMixin, EnvironmentM
     def analyze(self, **kwargs):
         self.process.set_progress(0, 1)
 
-        v = np.array(self.get_series("voltage_hvsrc"))
-        c = np.array(self.get_series("capacitance"))
+        v = self.get_series("voltage_hvsrc")
+        c = self.get_series("capacitance")
         self.analysis_cv(c, v)
 
         self.process.set_progress(1, 1)
@@ -2,7 +2,6 @@ import logging
 import time
 
 import comet
-import numpy as np
 
 from ..core.benchmark import Benchmark
 from ..core.estimate import Estimate
@@ -36,6 +35,7 @@ class CVRampAltMeasurement(MatrixMeasurement, LCRMixin, EnvironmentMixin, Analys
         self.register_parameter("waiting_time_after", comet.ureg("100 ms"), unit="s")
         self.register_parameter("waiting_time_start", comet.ureg("0 s"), unit="s")
         self.register_parameter("waiting_time_end", comet.ureg("0 s"), unit="s")
+        self.register_parameter("lcr_frequency", unit="Hz", required=True)
         self.register_lcr()
         self.register_environment()
         self.register_analysis()
@@ -76,6 +76,7 @@ class CVRampAltMeasurement(MatrixMeasurement, LCRMixin, EnvironmentMixin, Analys
         waiting_time_after = self.get_parameter("waiting_time_after")
         waiting_time_start = self.get_parameter("waiting_time_start")
         waiting_time_end = self.get_parameter("waiting_time_end")
+        lcr_frequency = self.get_parameter("lcr_frequency")
 
         # Extend meta data
         self.set_meta("bias_voltage_start", f"{bias_voltage_start:G} V")
@@ -88,6 +89,7 @@ class CVRampAltMeasurement(MatrixMeasurement, LCRMixin, EnvironmentMixin, Analys
         self.set_meta("waiting_time_after", f"{waiting_time_after:G} s")
         self.set_meta("waiting_time_start", f"{waiting_time_start:G} s")
         self.set_meta("waiting_time_end", f"{waiting_time_end:G} s")
+        self.set_meta("lcr_frequency", f"{lcr_frequency:G} Hz")
         self.lcr_update_meta()
         self.environment_update_meta()
 
@@ -101,6 +103,8 @@ class CVRampAltMeasurement(MatrixMeasurement, LCRMixin, EnvironmentMixin, Analys
         self.set_series_unit("temperature_box", "degC")
         self.set_series_unit("temperature_chuck", "degC")
         self.set_series_unit("humidity_box", "%")
+        self.set_series_unit("environment_age", "s")
+        self.set_series_unit("lcr_samples", "1")
 
         # Series
         self.register_series("timestamp")
@@ -112,6 +116,8 @@ class CVRampAltMeasurement(MatrixMeasurement, LCRMixin, EnvironmentMixin, Analys
         self.register_series("temperature_box")
         self.register_series("temperature_chuck")
         self.register_series("humidity_box")
+        self.register_series("environment_age")
+        self.register_series("lcr_samples")
 
         # Initialize LCR
 
@@ -119,7 +125,7 @@ class CVRampAltMeasurement(MatrixMeasurement, LCRMixin, EnvironmentMixin, Analys
         self.lcr_reset(lcr)
         self.process.set_progress(5, 6)
 
-        self.lcr_setup(lcr)
+        self.lcr_setup(lcr, self.get_parameter("lcr_frequency"))
         self.process.set_progress(6, 6)
 
         self.lcr_set_bias_voltage_level(lcr, 0)
@@ -162,6 +168,7 @@ class CVRampAltMeasurement(MatrixMeasurement, LCRMixin, EnvironmentMixin, Analys
         lcr_voltage_level = self.lcr_get_bias_voltage_level(lcr)
 
         ramp = LinearRange(lcr_voltage_level, bias_voltage_stop, bias_voltage_step)
+        self.reserve_series(len(ramp) + 1)
         est = Estimate(len(ramp))
         self.process.set_progress(*est.progress)
 
@@ -226,7 +233,9 @@ class CVRampAltMeasurement(MatrixMeasurement, LCRMixin, EnvironmentMixin, Analys
                     resistance=lcr_sec,
                     temperature_box=self.environment_temperature_box,
                     temperature_chuck=self.environment_temperature_chuck,
-                    humidity_box=self.environment_humidity_box
+                    humidity_box=self.environment_humidity_box,
+                    environment_age=self.environment_age,
+                    lcr_samples=self.lcr_sample_count
                 )
 
                 if self.process.stop_requested:
@@ -240,8 +249,8 @@ class CVRampAltMeasurement(MatrixMeasurement, LCRMixin, EnvironmentMixin, Analys
     def analyze(self, **kwargs):
         self.process.set_progress(0, 1)
 
-        v = np.array(self.get_series("voltage_lcr"))
-        c = np.array(self.get_series("capacitance"))
+        v = self.get_series("voltage_lcr")
+        c = self.get_series("capacitance")
         self.analysis_cv(c, v)
 
         self.process.set_progress(1, 1)
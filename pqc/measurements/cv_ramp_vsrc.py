@@ -2,7 +2,6 @@ import logging
 import time
 
 import comet
-import numpy as np
 
 from ..core.benchmark import Benchmark
 from ..core.estimate import Estimate
@@ -39,6 +38,7 @@ class CVRampHVMeasurement(MatrixMeasurement, VSourceMixin, LCRMixin, Environment
         self.register_parameter("vsrc_current_compliance", unit="A", required=True)
         self.register_parameter("vsrc_accept_compliance", False, type=bool)
         self.register_hvsource()
+        self.register_parameter("lcr_frequency", unit="Hz", required=True)
         self.register_lcr()
         self.register_environment()
         self.register_analysis()
@@ -81,6 +81,7 @@ class CVRampHVMeasurement(MatrixMeasurement, VSourceMixin, LCRMixin, Environment
         waiting_time_after = self.get_parameter("waiting_time_after")
         waiting_time_start = self.get_parameter("waiting_time_start")
         waiting_time_end = self.get_parameter("waiting_time_end")
+        lcr_frequency = self.get_parameter("lcr_frequency")
         vsrc_current_compliance = self.get_parameter("vsrc_current_compliance")
         vsrc_accept_compliance = self.get_parameter("vsrc_accept_compliance")
 
@@ -98,6 +99,7 @@ class CVRampHVMeasurement(MatrixMeasurement, VSourceMixin, LCRMixin, Environment
         self.set_meta("vsrc_current_compliance", f"{vsrc_current_compliance:G} A")
         self.set_meta("vsrc_accept_compliance", vsrc_accept_compliance)
         self.vsrc_update_meta()
+        self.set_meta("lcr_frequency", f"{lcr_frequency:G} Hz")
         self.lcr_update_meta()
         self.environment_update_meta()
 
@@ -111,6 +113,8 @@ class CVRampHVMeasurement(MatrixMeasurement, VSourceMixin, LCRMixin, Environment
         self.set_series_unit("temperature_box", "degC")
         self.set_series_unit("temperature_chuck", "degC")
         self.set_series_unit("humidity_box", "%")
+        self.set_series_unit("environment_age", "s")
+        self.set_series_unit("lcr_samples", "1")
 
         # Series
         self.register_series("timestamp")
@@ -122,29 +126,31 @@ class CVRampHVMeasurement(MatrixMeasurement, VSourceMixin, LCRMixin, Environment
         self.register_series("temperature_box")
         self.register_series("temperature_chuck")
         self.register_series("humidity_box")
+        self.register_series("environment_age")
+        self.register_series("lcr_samples")
 
-        # Initialize V Source
+        # Initialize instruments
 
         self.process.set_message("Initialize...")
         self.process.set_progress(2, 6)
 
-        self.vsrc_reset(vsrc)
         self.process.set_progress(3, 6)
 
-        self.vsrc_setup(vsrc)
-        self.vsrc_set_function_voltage(vsrc)
-        self.vsrc_set_current_compliance(vsrc, vsrc_current_compliance)
+        self.run_concurrent(
+            lambda: self.initialize_vsrc(vsrc),
+            lambda: self.initialize_lcr(lcr),
+        )
         self.process.set_progress(4, 6)
 
+        if self.process.stop_requested:
+            return
+
+        # Output enable
+
         self.vsrc_set_output_state(vsrc, vsrc.OUTPUT_ON)
         vsrc_output_state = self.vsrc_get_output_state(vsrc)
         self.process.update_state({"vsrc_output": vsrc_output_state,})
 
-        # Initialize LCR
-
-        self.lcr_reset(lcr)
-        self.lcr_setup(lcr)
-
         self.process.set_progress(5, 6)
 
         # Ramp to start voltage
@@ -169,6 +175,18 @@ class CVRampHVMeasurement(MatrixMeasurement, VSourceMixin, LCRMixin, Environment
 
         self.process.set_progress(6, 6)
 
+    def initialize_vsrc(self, vsrc):
+        vsrc_current_compliance = self.get_parameter("vsrc_current_compliance")
+
+        self.vsrc_reset(vsrc)
+        self.vsrc_setup(vsrc)
+        self.vsrc_set_function_voltage(vsrc)
+        self.vsrc_set_current_compliance(vsrc, vsrc_current_compliance)
+
+    def initialize_lcr(self, lcr):
+        self.lcr_reset(lcr)
+        self.lcr_setup(lcr, self.get_parameter("lcr_frequency"))
+
     def measure(self, vsrc, lcr):
         self.process.set_progress(1, 2)
         # Parameters
@@ -186,6 +204,7 @@ class CVRampHVMeasurement(MatrixMeasurement, VSourceMixin, LCRMixin, Environment
         vsrc_voltage_level = self.vsrc_get_voltage_level(vsrc)
 
         ramp = LinearRange(vsrc_voltage_level, bias_voltage_stop, bias_voltage_step)
+        self.reserve_series(len(ramp) + 1)
         est = Estimate(len(ramp))
         self.process.set_progress(*est.progress)
 
@@ -251,7 +270,9 @@ class CVRampHVMeasurement(MatrixMeasurement, VSourceMixin, LCRMixin, Environment
                     resistance=lcr_sec,
                     temperature_box=self.environment_temperature_box,
                     temperature_chuck=self.environment_temperature_chuck,
-                    humidity_box=self.environment_humidity_box
+                    humidity_box=self.environment_humidity_box,
+                    environment_age=self.environment_age,
+                    lcr_samples=self.lcr_sample_count
                 )
 
                 # Compliance tripped?
@@ -273,8 +294,8 @@ class CVRampHVMeasurement(MatrixMeasurement, VSourceMixin, LCRMixin, Environment
     def analyze(self, **kwargs):
         self.process.set_progress(0, 1)
 
-        v = np.array(self.get_series("voltage_vsrc"))
-        c = np.array(self.get_series("capacitance"))
+        v = self.get_series("voltage_vsrc")
+        c = self.get_series("capacitance")
         self.analysis_cv(c, v)
 
         self.process.set_progress(1, 1)
@@ -1,6 +1,15 @@
 import logging
+import time
 
+import comet
+import numpy as np
+
+from ..core.benchmark import Benchmark
+from ..core.estimate import Estimate
+from ..core.functions import LinearRange
+from ..utils import format_metric
 from .matrix import MatrixMeasurement
+from .measurement import format_estimate
 from .mixins import AnalysisMixin, EnvironmentMixin, HVSourceMixin, LCRMixin
 
 __all__ = ["FrequencyScanMeasurement"]
@@ -8,8 +17,51 @@ __all__ = ["FrequencyScanMeasurement"]
 logger = logging.getLogger(__name__)
 
 
+def frequency_plan(start, stop, steps, spacing="log"):
+    """Return array of `steps + 1` frequencies from start to stop.
+
+    Raise `ValueError` if the plan contains less than two frequencies or
+    for log spacing with start or stop not above zero.
+
+    >>> frequency_plan(1e2, 1e4, 2).tolist()
+    [100.0, 1000.0, 10000.0]
+    """
+    steps = int(steps)
+    if steps < 1 or start == stop:
+        raise ValueError(f"frequency scan requires at least two frequencies: start={start:G} Hz, stop={stop:G} Hz, steps={steps}")
+    if spacing == "log":
+        if start <= 0 or stop <= 0:
+            raise ValueError(f"log frequency scan requires start and stop above 0 Hz: start={start:G} Hz, stop={stop:G} Hz")
+        return np.geomspace(start, stop, steps + 1)
+    return np.linspace(start, stop, steps + 1)
+
+
+def voltage_list(values):
+    """Return list of voltages in volt, plain numbers are taken as volt.
+
+    Raise `ValueError` for values not convertible to volt.
+
+    >>> voltage_list([-5, comet.ureg("-10 V"), comet.ureg("-500 mV")])
+    [-5.0, -10.0, -0.5]
+    """
+    voltages = []
+    for value in values:
+        if isinstance(value, (int, float)):
+            voltages.append(float(value))
+            continue
+        try:
+            voltages.append(float(comet.ureg.Quantity(value).to("V").m))
+        except (AttributeError, TypeError, ValueError) as exc:
+            raise ValueError(f"invalid voltage: {value!r}") from exc
+    return voltages
+
+
 class FrequencyScanMeasurement(MatrixMeasurement, HVSourceMixin, LCRMixin, EnvironmentMixin, AnalysisMixin):
-    """Frequency scan."""
+    """Frequency scan.
+
+    Scans LCR frequencies at one or more HV source bias voltages. Readings
+    are acquired using the LCR list sweep if the soft filter is disabled.
+    """
 
     type = "frequency_scan"
 
@@ -17,29 +69,347 @@ class FrequencyScanMeasurement(MatrixMeasurement, HVSourceMixin, LCRMixin, Envir
 
     def __init__(self, *args, **kwargs):
         super().__init__(*args, **kwargs)
+        self.register_parameter("bias_voltage", None, unit="V")
+        self.register_parameter("bias_voltage_list", [], type=voltage_list)
+        self.register_parameter("bias_voltage_step", comet.ureg("10 V"), unit="V")
+        self.register_parameter("waiting_time", comet.ureg("1 s"), unit="s")
+        self.register_parameter("waiting_time_before", comet.ureg("100 ms"), unit="s")
+        self.register_parameter("waiting_time_after", comet.ureg("100 ms"), unit="s")
+        self.register_parameter("hvsrc_current_compliance", unit="A", required=True)
+        self.register_parameter("lcr_frequency_start", unit="Hz", required=True)
+        self.register_parameter("lcr_frequency_stop", unit="Hz", required=True)
+        self.register_parameter("lcr_frequency_steps", 10, type=int)
+        self.register_parameter("lcr_frequency_spacing", "log", values=("log", "linear"))
+        self.register_parameter("lcr_list_sweep", True, type=bool)
         self.register_vsource()
         self.register_lcr()
         self.register_environment()
         self.register_analysis()
 
+    def validate_parameters(self):
+        super().validate_parameters()
+        if not self.get_parameter("bias_voltage_list") and self.get_parameter("bias_voltage") is None:
+            raise ValueError("missing required parameter: bias_voltage or bias_voltage_list")
+        # Reject invalid frequency plans before any instrument is opened
+        self.frequencies()
+
+    def bias_voltages(self):
+        """Return list of bias voltages, `bias_voltage_list` overrides
+        `bias_voltage` if not empty."""
+        voltages = self.get_parameter("bias_voltage_list")
+        if voltages:
+            return list(voltages)
+        return [self.get_parameter("bias_voltage")]
+
+    def frequencies(self):
+        """Return array of scan frequencies."""
+        return frequency_plan(
+            self.get_parameter("lcr_frequency_start"),
+            self.get_parameter("lcr_frequency_stop"),
+            self.get_parameter("lcr_frequency_steps"),
+            self.get_parameter("lcr_frequency_spacing")
+        )
+
+    def use_list_sweep(self):
+        """Return True if readings are acquired using the LCR list sweep."""
+        return self.get_parameter("lcr_list_sweep") and not self.get_parameter("lcr_soft_filter")
+
+    def quick_ramp_zero(self, hvsrc):
+        """Ramp to zero voltage without measuring current."""
+        self.process.set_message("Ramp to zero...")
+        self.process.set_progress(0, 1)
+
+        bias_voltage_step = self.get_parameter("bias_voltage_step")
+        waiting_time_after = self.get_parameter("waiting_time_after")
+
+        hvsrc_output_state = self.hvsrc_get_output_state(hvsrc)
+        self.process.update_state({"hvsrc_output": hvsrc_output_state})
+        if hvsrc_output_state:
+            hvsrc_voltage_level = self.hvsrc_get_voltage_level(hvsrc)
+            ramp = LinearRange(hvsrc_voltage_level, 0, bias_voltage_step)
+            for step, voltage in enumerate(ramp):
+                self.process.set_progress(step + 1, len(ramp))
+                self.hvsrc_set_voltage_level(hvsrc, voltage)
+                self.process.update_state({"hvsrc_voltage": voltage})
+                time.sleep(waiting_time_after)
+        hvsrc_output_state = self.hvsrc_get_output_state(hvsrc)
+        self.process.update_state({"hvsrc_output": hvsrc_output_state})
+        self.process.set_message("")
+        self.process.set_progress(1, 1)
+
+    def ramp_to(self, hvsrc, bias_voltage):
+        """Ramp HV source to bias voltage, checking compliance."""
+        bias_voltage_step = self.get_parameter("bias_voltage_step")
+        waiting_time_before = self.get_parameter("waiting_time_before")
+
+        hvsrc_voltage_level = self.hvsrc_get_voltage_level(hvsrc)
+
+        logger.info("HV Source ramp to bias voltage: from %E V to %E V with step %E V", hvsrc_voltage_level, bias_voltage, bias_voltage_step)
+        for voltage in LinearRange(hvsrc_voltage_level, bias_voltage, bias_voltage_step):
+            self.process.set_message("Ramp to bias... {}".format(format_metric(voltage, "V")))
+            self.hvsrc_set_voltage_level(hvsrc, voltage)
+            time.sleep(waiting_time_before)
+            self.process.update_state({"hvsrc_voltage": voltage})
+
+            # Compliance tripped?
+            self.hvsrc_check_compliance(hvsrc)
+
+            if self.process.stop_requested:
+                break
+
     def initialize(self, hvsrc, lcr):
-        self.process.set_progress(0, 2)
+        self.process.set_progress(1, 4)
 
-        self.process.update_state({
-            "hvsrc_voltage": self.hvsrc_get_voltage_level(hvsrc),
-            "hvsrc_current": None,
-            "hvsrc_output": self.hvsrc_get_output_state(hvsrc),
-        })
+        # Parameters
+        bias_voltage_step = self.get_parameter("bias_voltage_step")
+        waiting_time = self.get_parameter("waiting_time")
+        waiting_time_before = self.get_parameter("waiting_time_before")
+        waiting_time_after = self.get_parameter("waiting_time_after")
+        hvsrc_current_compliance = self.get_parameter("hvsrc_current_compliance")
+        lcr_frequency_start = self.get_parameter("lcr_frequency_start")
+        lcr_frequency_stop = self.get_parameter("lcr_frequency_stop")
+        lcr_frequency_steps = self.get_parameter("lcr_frequency_steps")
+        lcr_frequency_spacing = self.get_parameter("lcr_frequency_spacing")
+        lcr_list_sweep = self.get_parameter("lcr_list_sweep")
 
-        self.process.set_progress(2, 2)
+        # Extend meta data
+        self.set_meta("bias_voltage", [f"{value:G} V" for value in self.bias_voltages()])
+        self.set_meta("bias_voltage_step", f"{bias_voltage_step:G} V")
+        self.set_meta("waiting_time", f"{waiting_time:G} s")
+        self.set_meta("waiting_time_before", f"{waiting_time_before:G} s")
+        self.set_meta("waiting_time_after", f"{waiting_time_after:G} s")
+        self.set_meta("hvsrc_current_compliance", f"{hvsrc_current_compliance:G} A")
+        self.hvsrc_update_meta()
+        self.set_meta("lcr_frequency_start", f"{lcr_frequency_start:G} Hz")
+        self.set_meta("lcr_frequency_stop", f"{lcr_frequency_stop:G} Hz")
+        self.set_meta("lcr_frequency_steps", lcr_frequency_steps)
+        self.set_meta("lcr_frequency_spacing", lcr_frequency_spacing)
+        self.set_meta("lcr_list_sweep", lcr_list_sweep)
+        self.lcr_update_meta()
+        self.environment_update_meta()
+
+        # Series units
+        self.set_series_unit("timestamp", "s")
+        self.set_series_unit("voltage_hvsrc", "V")
+        self.set_series_unit("current_hvsrc", "A")
+        self.set_series_unit("frequency", "Hz")
+        self.set_series_unit("capacitance", "F")
+        self.set_series_unit("resistance", "Ohm")
+        self.set_series_unit("temperature_box", "degC")
+        self.set_series_unit("temperature_chuck", "degC")
+        self.set_series_unit("humidity_box", "%")
+        self.set_series_unit("environment_age", "s")
+        self.set_series_unit("lcr_samples", "1")
+
+        # Series
+        self.register_series("timestamp")
+        self.register_series("voltage_hvsrc")
+        self.register_series("current_hvsrc")
+        self.register_series("frequency")
+        self.register_series("capacitance")
+        self.register_series("resistance")
+        self.register_series("temperature_box")
+        self.register_series("temperature_chuck")
+        self.register_series("humidity_box")
+        self.register_series("environment_age")
+        self.register_series("lcr_samples")
+
+        # Initialize instruments
+
+        self.process.set_progress(2, 4)
+
+        self.run_concurrent(
+            lambda: self.initialize_hvsrc(hvsrc),
+            lambda: self.initialize_lcr(lcr),
+        )
+        self.process.set_progress(3, 4)
+
+        # Output enable
+
+        self.hvsrc_set_output_state(hvsrc, hvsrc.OUTPUT_ON)
+        hvsrc_output_state = self.hvsrc_get_output_state(hvsrc)
+        self.process.update_state({"hvsrc_output": hvsrc_output_state})
+
+        self.process.set_progress(4, 4)
+
+    def initialize_hvsrc(self, hvsrc):
+        hvsrc_current_compliance = self.get_parameter("hvsrc_current_compliance")
+
+        self.hvsrc_reset(hvsrc)
+        self.hvsrc_setup(hvsrc)
+        self.hvsrc_set_current_compliance(hvsrc, hvsrc_current_compliance)
+
+    def initialize_lcr(self, lcr):
+        self.lcr_reset(lcr)
+        self.lcr_setup(lcr, self.frequencies()[0])
 
     def measure(self, hvsrc, lcr):
-        self.process.set_progress(0, 0)
+        bias_voltages = self.bias_voltages()
+        frequencies = self.frequencies()
+        waiting_time = self.get_parameter("waiting_time")
+
+        if self.process.stop_requested:
+            return
+
+        self.reserve_series(len(bias_voltages) * len(frequencies))
+        est = Estimate(len(bias_voltages) * len(frequencies))
+        self.process.set_progress(*est.progress)
+
+        t0 = time.time()
+
+        self.hvsrc_clear(hvsrc)
+
+        benchmark_sweep = Benchmark("Frequency_Sweep")
+
+        use_list_sweep = self.use_list_sweep()
+        logger.info("LCR Meter frequency scan: %d frequencies from %E Hz to %E Hz, list sweep: %s", len(frequencies), frequencies[0], frequencies[-1], use_list_sweep)
+        try:
+            for bias_voltage in bias_voltages:
+                self.ramp_to(hvsrc, bias_voltage)
+                if self.process.stop_requested:
+                    break
+
+                # Delay
+                time.sleep(waiting_time)
+
+                self.environment_update()
+
+                hvsrc_reading = self.hvsrc_read_current(hvsrc)
+                self.process.update_readings()
+                self.process.update_state({
+                    "hvsrc_voltage": bias_voltage,
+                    "hvsrc_current": hvsrc_reading
+                })
+
+                with benchmark_sweep:
+                    if use_list_sweep:
+                        self.measure_list_sweep(lcr, frequencies, bias_voltage, hvsrc_reading, est, t0)
+                    else:
+                        self.measure_steps(lcr, frequencies, bias_voltage, hvsrc_reading, est, t0)
+
+                # Compliance tripped?
+                self.hvsrc_check_compliance(hvsrc)
+
+                if self.process.stop_requested:
+                    break
+        finally:
+            if use_list_sweep:
+                self.lcr_disable_list_sweep(lcr)
+
+        logger.info(benchmark_sweep)
+
+    def measure_steps(self, lcr, frequencies, bias_voltage, hvsrc_reading, est, t0):
+        """Measure frequencies one by one using the soft filter."""
+        lcr_soft_filter = self.get_parameter("lcr_soft_filter")
+
+        for frequency in frequencies:
+            self.lcr_set_frequency(lcr, frequency)
+            try:
+                if lcr_soft_filter:
+                    lcr_prim, lcr_sec = self.lcr_acquire_filter_reading(lcr)
+                else:
+                    lcr_prim, lcr_sec = self.lcr_acquire_reading(lcr)
+            except Exception as exc:
+                raise RuntimeError(f"Failed to read from LCR: {exc}") from exc
+            self.append_point(time.time() - t0, bias_voltage, hvsrc_reading, frequency, lcr_prim, lcr_sec)
+            est.advance()
+            self.process.set_message("{} | HV Source {} | LCR {}".format(format_estimate(est), format_metric(bias_voltage, "V"), format_metric(frequency, "Hz")))
+            self.process.set_progress(*est.progress)
+
+            if self.process.stop_requested:
+                break
+
+    def measure_list_sweep(self, lcr, frequencies, bias_voltage, hvsrc_reading, est, t0):
+        """Measure frequencies in blocks using the LCR list sweep, timestamps
+        are interpolated across each block."""
+        frequencies = frequencies.tolist()
+        block_size = lcr.list.MAXIMUM_POINTS
+        for offset in range(0, len(frequencies), block_size):
+            block = frequencies[offset:offset + block_size]
+
+            self.lcr_setup_list_sweep(lcr, frequencies=block)
+            t_begin = time.time() - t0
+            try:
+                readings = self.lcr_acquire_list_readings(lcr)
+            except Exception as exc:
+                raise RuntimeError(f"Failed to read from LCR: {exc}") from exc
+            t_end = time.time() - t0
+
+            for index, (frequency, (lcr_prim, lcr_sec)) in enumerate(zip(block, readings)):
+                td = t_begin + (t_end - t_begin) * (index + 1) / len(readings)
+                self.append_point(td, bias_voltage, hvsrc_reading, frequency, lcr_prim, lcr_sec)
+                est.advance()
+
+            self.process.set_message("{} | HV Source {} | LCR {}".format(format_estimate(est), format_metric(bias_voltage, "V"), format_metric(block[-1], "Hz")))
+            self.process.set_progress(*est.progress)
+
+            if self.process.stop_requested:
+                break
+
+    def append_point(self, timestamp, bias_voltage, hvsrc_reading, frequency, lcr_prim, lcr_sec):
+        self.process.append_reading("lcr", frequency, lcr_prim)
+
+        # Append series data
+        self.append_series(
+            timestamp=timestamp,
+            voltage_hvsrc=bias_voltage,
+            current_hvsrc=hvsrc_reading,
+            frequency=frequency,
+            capacitance=lcr_prim,
+            resistance=lcr_sec,
+            temperature_box=self.environment_temperature_box,
+            temperature_chuck=self.environment_temperature_chuck,
+            humidity_box=self.environment_humidity_box,
+            environment_age=self.environment_age,
+            lcr_samples=self.lcr_sample_count
+        )
+
+    def cv_per_frequency(self):
+        """Return tuple of frequencies, bias voltages and capacitance matrix
+        with one row per frequency and one column per bias voltage, missing
+        points are NaN."""
+        v = self.get_series("voltage_hvsrc")
+        f = self.get_series("frequency")
+        c = self.get_series("capacitance")
+        voltages, columns = np.unique(v, return_inverse=True)
+        frequencies, rows = np.unique(f, return_inverse=True)
+        matrix = np.full((len(frequencies), len(voltages)), np.nan)
+        matrix[rows, columns] = c
+        return frequencies, voltages, matrix
+
+    def analyze(self, **kwargs):
+        self.process.set_progress(0, 1)
+
+        frequencies, voltages, matrix = self.cv_per_frequency()
+        if len(frequencies):
+            self.set_analysis("cv_per_frequency", {
+                "frequency": frequencies.tolist(),
+                "voltage": voltages.tolist(),
+                "capacitance": np.where(np.isnan(matrix), None, matrix).tolist()
+            })
+            # Analyze CV curve at lowest scan frequency, using only measured
+            # bias voltages of an incomplete scan
+            measured = ~np.isnan(matrix[0])
+            if np.count_nonzero(measured) > 1:
+                self.analysis_cv(matrix[0][measured], voltages[measured])
+
         self.process.set_progress(1, 1)
 
     def finalize(self, hvsrc, lcr):
-        self.process.set_progress(0, 0)
+        self.process.set_progress(1, 2)
+
+        self.process.update_state({"hvsrc_current": None})
+
+        self.quick_ramp_zero(hvsrc)
 
         self.hvsrc_set_output_state(hvsrc, hvsrc.OUTPUT_OFF)
+        hvsrc_output_state = self.hvsrc_get_output_state(hvsrc)
+        self.process.update_state({"hvsrc_output": hvsrc_output_state})
 
-        self.process.set_progress(1, 1)
+        self.process.update_state({
+            "env_chuck_temperature": None,
+            "env_box_temperature": None,
+            "env_box_humidity": None
+        })
+
+        self.process.set_progress(2, 2)
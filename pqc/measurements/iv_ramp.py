@@ -2,13 +2,12 @@ import logging
 import time
 
 import comet
-import numpy as np
 
 from ..core.estimate import Estimate
 from ..core.functions import LinearRange
 from ..utils import format_metric
 from .matrix import MatrixMeasurement
-from .measurement import format_estimate
+from .measurement import ComplianceError, format_estimate
 from .mixins import AnalysisMixin, EnvironmentMixin, HVSourceMixin
 
 __all__ = ["IVRampMeasurement"]
@@ -46,6 +45,8 @@ class IVRampMeasurement(MatrixMeasurement, HVSourceMixin, EnvironmentMixin, Anal
         self.register_parameter("waiting_time_end", comet.ureg("0 s"), unit="s")
         self.register_parameter("hvsrc_current_compliance", unit="A", required=True)
         self.register_parameter("hvsrc_accept_compliance", False, type=bool)
+        self.register_parameter("hvsrc_buffered_sweep", False, type=bool)
+        self.register_parameter("hvsrc_buffered_sweep_size", 100, type=int)
         self.register_vsource()
         self.register_environment()
         self.register_analysis()
@@ -66,6 +67,7 @@ class IVRampMeasurement(MatrixMeasurement, HVSourceMixin, EnvironmentMixin, Anal
         waiting_time_end = self.get_parameter("waiting_time_end")
         hvsrc_current_compliance = self.get_parameter("hvsrc_current_compliance")
         hvsrc_accept_compliance = self.get_parameter("hvsrc_accept_compliance")
+        hvsrc_buffered_sweep = self.get_parameter("hvsrc_buffered_sweep")
 
         # Extend meta data
         self.set_meta("voltage_start", f"{voltage_start:G} V")
@@ -80,6 +82,7 @@ class IVRampMeasurement(MatrixMeasurement, HVSourceMixin, EnvironmentMixin, Anal
         self.set_meta("waiting_time_end", f"{waiting_time_end:G} s")
         self.set_meta("hvsrc_current_compliance", f"{hvsrc_current_compliance:G} A")
         self.set_meta("hvsrc_accept_compliance", hvsrc_accept_compliance)
+        self.set_meta("hvsrc_buffered_sweep", hvsrc_buffered_sweep)
 
         self.hvsrc_update_meta()
         self.environment_update_meta()
@@ -91,6 +94,7 @@ class IVRampMeasurement(MatrixMeasurement, HVSourceMixin, EnvironmentMixin, Anal
         self.set_series_unit("temperature_box", "degC")
         self.set_series_unit("temperature_chuck", "degC")
         self.set_series_unit("humidity_box", "%")
+        self.set_series_unit("environment_age", "s")
 
         # Series
         self.register_series("timestamp")
@@ -99,6 +103,7 @@ class IVRampMeasurement(MatrixMeasurement, HVSourceMixin, EnvironmentMixin, Anal
         self.register_series("temperature_box")
         self.register_series("temperature_chuck")
         self.register_series("humidity_box")
+        self.register_series("environment_age")
 
         self.process.update_state({
             "hvsrc_voltage": self.hvsrc_get_voltage_level(hvsrc),
@@ -158,6 +163,7 @@ class IVRampMeasurement(MatrixMeasurement, HVSourceMixin, EnvironmentMixin, Anal
         voltage_step = self.get_parameter("voltage_step")
         waiting_time = self.get_parameter("waiting_time")
         hvsrc_accept_compliance = self.get_parameter("hvsrc_accept_compliance")
+        hvsrc_buffered_sweep = self.get_parameter("hvsrc_buffered_sweep")
 
         if self.process.stop_requested:
             return
@@ -167,10 +173,18 @@ class IVRampMeasurement(MatrixMeasurement, HVSourceMixin, EnvironmentMixin, Anal
         t0 = time.time()
 
         ramp = LinearRange(voltage, voltage_stop, voltage_step)
+        self.reserve_series(len(ramp) + 1)
         est = Estimate(len(ramp))
         self.process.set_progress(*est.progress)
 
         logger.info("HV Source ramp to end voltage: from %E V to %E V with step %E V", voltage, ramp.end, ramp.step)
+        if hvsrc_buffered_sweep:
+            if self.hvsrc_buffered_sweep_supported(hvsrc):
+                self.measure_buffered_sweep(hvsrc, ramp, est, t0)
+                self.process.set_progress(0, 0)
+                return
+            logger.warning("HV Source does not support buffered sweeps, falling back to single steps.")
+
         for voltage in ramp:
             self.hvsrc_set_voltage_level(hvsrc, voltage)
 
@@ -196,7 +210,8 @@ class IVRampMeasurement(MatrixMeasurement, HVSourceMixin, EnvironmentMixin, Anal
                 current_hvsrc=reading_current,
                 temperature_box=self.environment_temperature_box,
                 temperature_chuck=self.environment_temperature_chuck,
-                humidity_box=self.environment_humidity_box
+                humidity_box=self.environment_humidity_box,
+                environment_age=self.environment_age
             )
             est.advance()
             self.process.set_message("{} | HV Source {}".format(format_estimate(est), format_metric(voltage, "V")))
@@ -215,11 +230,82 @@ class IVRampMeasurement(MatrixMeasurement, HVSourceMixin, EnvironmentMixin, Anal
 
         self.process.set_progress(0, 0)
 
+    def measure_buffered_sweep(self, hvsrc, ramp, est, t0):
+        """Measure ramp in blocks using the instrument source list and buffer.
+
+        Environment is updated once per block and timestamps are
+        interpolated across each block. The instrument aborts a block on
+        compliance or stop request, readings beyond the first point in
+        compliance are discarded.
+        """
+        waiting_time = self.get_parameter("waiting_time")
+        hvsrc_current_compliance = self.get_parameter("hvsrc_current_compliance")
+        hvsrc_accept_compliance = self.get_parameter("hvsrc_accept_compliance")
+        block_size = max(1, min(self.get_parameter("hvsrc_buffered_sweep_size"), hvsrc.SWEEP_POINTS_MAXIMUM))
+
+        voltages = ramp.to_array().tolist()
+        for offset in range(0, len(voltages), block_size):
+            block = voltages[offset:offset + block_size]
+
+            self.environment_update()
+
+            t_begin = time.time() - t0
+            readings = self.hvsrc_sweep_voltage(hvsrc, block, waiting_time)[:len(block)]
+            t_end = time.time() - t0
+
+            # Truncate readings at first point in compliance, a block aborted
+            # by stop request is not in compliance
+            compliance_reached = len(readings) < len(block) and not self.process.stop_requested
+            for index, (_, reading_current) in enumerate(readings):
+                if abs(reading_current) >= hvsrc_current_compliance:
+                    readings = readings[:index + 1]
+                    compliance_reached = True
+                    break
+
+            voltage, reading_current = block[0], float("nan")
+            for index, (_, reading_current) in enumerate(readings):
+                td = t_begin + (t_end - t_begin) * (index + 1) / len(readings)
+                voltage = block[index]
+                self.process.append_reading("hvsrc", abs(voltage) if ramp.step < 0 else voltage, reading_current)
+
+                # Append series data
+                self.append_series(
+                    timestamp=td,
+                    voltage=voltage,
+                    current_hvsrc=reading_current,
+                    temperature_box=self.environment_temperature_box,
+                    temperature_chuck=self.environment_temperature_chuck,
+                    humidity_box=self.environment_humidity_box,
+                    environment_age=self.environment_age
+                )
+                est.advance()
+
+            self.process.update_readings()
+            self.process.update_state({
+                "hvsrc_voltage": voltage,
+                "hvsrc_current": reading_current,
+            })
+            self.process.set_message("{} | HV Source {}".format(format_estimate(est), format_metric(voltage, "V")))
+            self.process.set_progress(*est.progress)
+
+            # Compliance tripped?
+            if hvsrc_accept_compliance:
+                if compliance_reached or self.hvsrc_compliance_tripped(hvsrc):
+                    logger.info("HV Source compliance tripped, gracefully stopping measurement.")
+                    break
+            else:
+                if compliance_reached:
+                    raise ComplianceError("HV Source in compliance!")
+                self.hvsrc_check_compliance(hvsrc)
+
+            if self.process.stop_requested:
+                break
+
     def analyze(self, **kwargs):
         self.process.set_progress(0, 1)
 
-        i = np.array(self.get_series("current_hvsrc"))
-        v = np.array(self.get_series("voltage"))
+        i = self.get_series("current_hvsrc")
+        v = self.get_series("voltage")
         self.analysis_iv(i, v)
 
         self.process.set_progress(1, 1)
@@ -2,7 +2,6 @@ import logging
 import time
 
 import comet
-import numpy as np
 
 from ..core.estimate import Estimate
 from ..core.functions import LinearRange
@@ -112,6 +111,7 @@ class IVRamp4WireBiasMeasurement(MatrixMeasurement, HVSourceMixin, VSourceMixin,
         self.set_series_unit("temperature_box", "degC")
         self.set_series_unit("temperature_chuck", "degC")
         self.set_series_unit("humidity_box", "%")
+        self.set_series_unit("environment_age", "s")
 
         # Series
         self.register_series("timestamp")
@@ -121,6 +121,7 @@ class IVRamp4WireBiasMeasurement(MatrixMeasurement, HVSourceMixin, VSourceMixin,
         self.register_series("temperature_box")
         self.register_series("temperature_chuck")
         self.register_series("humidity_box")
+        self.register_series("environment_age")
 
         # Initialize HV Source
 
@@ -231,6 +232,7 @@ class IVRamp4WireBiasMeasurement(MatrixMeasurement, HVSourceMixin, VSourceMixin,
         current = self.vsrc_get_current_level(vsrc)
 
         ramp = LinearRange(current, current_stop, current_step)
+        self.reserve_series(len(ramp) + 1)
         est = Estimate(len(ramp))
         self.process.set_progress(*est.progress)
 
@@ -266,7 +268,8 @@ class IVRamp4WireBiasMeasurement(MatrixMeasurement, HVSourceMixin, VSourceMixin,
                 bias_voltage=bias_voltage,
                 temperature_box=self.environment_temperature_box,
                 temperature_chuck=self.environment_temperature_chuck,
-                humidity_box=self.environment_humidity_box
+                humidity_box=self.environment_humidity_box,
+                environment_age=self.environment_age
             )
 
             # Compliance tripped?
@@ -283,8 +286,8 @@ class IVRamp4WireBiasMeasurement(MatrixMeasurement, HVSourceMixin, VSourceMixin,
     def analyze(self, **kwargs):
         self.process.set_progress(0, 1)
 
-        i = np.array(self.get_series("current"))
-        v = np.array(self.get_series("voltage_vsrc"))
+        i = self.get_series("current")
+        v = self.get_series("voltage_vsrc")
         self.analysis_iv(i, v)
 
         self.process.set_progress(1, 1)
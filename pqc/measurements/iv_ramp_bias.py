@@ -2,7 +2,6 @@ import logging
 import time
 
 import comet
-import numpy as np
 
 from ..core.estimate import Estimate
 from ..core.functions import LinearRange
@@ -46,6 +45,7 @@ class IVRampBiasMeasurement(MatrixMeasurement, HVSourceMixin, VSourceMixin, Envi
         self.register_parameter("hvsrc_accept_compliance", False, type=bool)
         self.register_parameter("vsrc_current_compliance", unit="A", required=True)
         self.register_parameter("vsrc_accept_compliance", False, type=bool)
+        self.register_parameter("concurrent_readout", False, type=bool)
         self.register_vsource()
         self.register_hvsource()
         self.register_environment()
@@ -100,6 +100,7 @@ class IVRampBiasMeasurement(MatrixMeasurement, HVSourceMixin, VSourceMixin, Envi
         self.set_series_unit("temperature_box", "degC")
         self.set_series_unit("temperature_chuck", "degC")
         self.set_series_unit("humidity_box", "%")
+        self.set_series_unit("environment_age", "s")
 
         # Series
         self.register_series("timestamp")
@@ -109,12 +110,17 @@ class IVRampBiasMeasurement(MatrixMeasurement, HVSourceMixin, VSourceMixin, Envi
         self.register_series("temperature_box")
         self.register_series("temperature_chuck")
         self.register_series("humidity_box")
+        self.register_series("environment_age")
 
-        # Initialize HV Source
+        # Initialize instruments
 
-        self.hvsrc_reset(hvsrc)
-        self.hvsrc_setup(hvsrc)
-        self.hvsrc_set_current_compliance(hvsrc, hvsrc_current_compliance)
+        self.run_concurrent(
+            lambda: self.initialize_hvsrc(hvsrc),
+            lambda: self.initialize_vsrc(vsrc),
+        )
+
+        if self.process.stop_requested:
+            return
 
         self.process.update_state({
             "hvsrc_voltage": self.hvsrc_get_voltage_level(hvsrc),
@@ -122,22 +128,6 @@ class IVRampBiasMeasurement(MatrixMeasurement, HVSourceMixin, VSourceMixin, Envi
             "hvsrc_output": self.hvsrc_get_output_state(hvsrc),
         })
 
-        if self.process.stop_requested:
-            return
-
-        # Initialize V Source
-
-        self.vsrc_reset(vsrc)
-        self.vsrc_setup(vsrc)
-
-        # Voltage source
-        self.vsrc_set_function_voltage(vsrc)
-
-        self.vsrc_set_current_compliance(vsrc, vsrc_current_compliance)
-
-        if self.process.stop_requested:
-            return
-
         # Output enable
 
         self.hvsrc_set_output_state(hvsrc, hvsrc.OUTPUT_ON)
@@ -190,6 +180,24 @@ class IVRampBiasMeasurement(MatrixMeasurement, HVSourceMixin, VSourceMixin, Envi
 
         self.process.set_progress(5, 5)
 
+    def initialize_hvsrc(self, hvsrc):
+        hvsrc_current_compliance = self.get_parameter("hvsrc_current_compliance")
+
+        self.hvsrc_reset(hvsrc)
+        self.hvsrc_setup(hvsrc)
+        self.hvsrc_set_current_compliance(hvsrc, hvsrc_current_compliance)
+
+    def initialize_vsrc(self, vsrc):
+        vsrc_current_compliance = self.get_parameter("vsrc_current_compliance")
+
+        self.vsrc_reset(vsrc)
+        self.vsrc_setup(vsrc)
+
+        # Voltage source
+        self.vsrc_set_function_voltage(vsrc)
+
+        self.vsrc_set_current_compliance(vsrc, vsrc_current_compliance)
+
     def measure(self, hvsrc, vsrc):
         self.process.set_progress(1, 2)
 
@@ -202,6 +210,7 @@ class IVRampBiasMeasurement(MatrixMeasurement, HVSourceMixin, VSourceMixin, Envi
         bias_mode = self.get_parameter("bias_mode")
         hvsrc_accept_compliance = self.get_parameter("hvsrc_accept_compliance")
         vsrc_accept_compliance = self.get_parameter("vsrc_accept_compliance")
+        concurrent_readout = self.get_parameter("concurrent_readout")
 
         if self.process.stop_requested:
             return
@@ -209,6 +218,7 @@ class IVRampBiasMeasurement(MatrixMeasurement, HVSourceMixin, VSourceMixin, Envi
         voltage = self.hvsrc_get_voltage_level(hvsrc)
 
         ramp = LinearRange(voltage, voltage_stop, voltage_step)
+        self.reserve_series(len(ramp) + 1)
         est = Estimate(len(ramp))
         self.process.set_progress(*est.progress)
 
@@ -234,13 +244,17 @@ class IVRampBiasMeasurement(MatrixMeasurement, HVSourceMixin, VSourceMixin, Envi
 
             self.environment_update()
 
-            # read V Source
-            vsrc_reading = self.vsrc_read_current(vsrc)
+            # read V Source and HV Source
+            if concurrent_readout:
+                vsrc_reading, hvsrc_reading = self.run_concurrent(
+                    lambda: self.vsrc_read_current(vsrc),
+                    lambda: self.hvsrc_read_current(hvsrc)
+                )
+            else:
+                vsrc_reading = self.vsrc_read_current(vsrc)
+                hvsrc_reading = self.hvsrc_read_current(hvsrc)
             self.process.append_reading("vsrc", abs(voltage) if ramp.step < 0 else voltage, vsrc_reading)
 
-            # read HV Source
-            hvsrc_reading = self.hvsrc_read_current(hvsrc)
-
             self.process.update_readings()
             self.process.update_state({
                 "hvsrc_current": hvsrc_reading,
@@ -255,7 +269,8 @@ class IVRampBiasMeasurement(MatrixMeasurement, HVSourceMixin, VSourceMixin, Envi
                 bias_voltage=bias_voltage,
                 temperature_box=self.environment_temperature_box,
                 temperature_chuck=self.environment_temperature_chuck,
-                humidity_box=self.environment_humidity_box
+                humidity_box=self.environment_humidity_box,
+                environment_age=self.environment_age
             )
 
             # Compliance tripped?
@@ -280,8 +295,8 @@ class IVRampBiasMeasurement(MatrixMeasurement, HVSourceMixin, VSourceMixin, Envi
     def analyze(self, **kwargs):
         self.process.set_progress(0, 1)
 
-        i = np.array(self.get_series("current_vsrc"))
-        v = np.array(self.get_series("voltage"))
+        i = self.get_series("current_vsrc")
+        v = self.get_series("voltage")
         self.analysis_iv(i, v)
 
         self.process.set_progress(1, 1)
@@ -2,7 +2,6 @@ import logging
 import time
 
 import comet
-import numpy as np
 
 from ..core.benchmark import Benchmark
 from ..core.estimate import Estimate
@@ -57,6 +56,7 @@ class IVRampBiasElmMeasurement(MatrixMeasurement, HVSourceMixin, VSourceMixin, E
         self.register_parameter("elm_current_autorange_enable", False, type=bool)
         self.register_parameter("elm_current_autorange_minimum", comet.ureg("20 pA"), unit="A")
         self.register_parameter("elm_current_autorange_maximum", comet.ureg("20 mA"), unit="A")
+        self.register_parameter("concurrent_readout", False, type=bool)
         self.register_vsource()
         self.register_hvsource()
         self.register_elm()
@@ -139,6 +139,7 @@ class IVRampBiasElmMeasurement(MatrixMeasurement, HVSourceMixin, VSourceMixin, E
         self.set_series_unit("temperature_box", "degC")
         self.set_series_unit("temperature_chuck", "degC")
         self.set_series_unit("humidity_box", "%")
+        self.set_series_unit("environment_age", "s")
 
         # Series
         self.register_series("timestamp")
@@ -150,12 +151,18 @@ class IVRampBiasElmMeasurement(MatrixMeasurement, HVSourceMixin, VSourceMixin, E
         self.register_series("temperature_box")
         self.register_series("temperature_chuck")
         self.register_series("humidity_box")
+        self.register_series("environment_age")
 
-        # Initialize HV Source
+        # Initialize instruments
 
-        self.hvsrc_reset(hvsrc)
-        self.hvsrc_setup(hvsrc)
-        self.hvsrc_set_current_compliance(hvsrc, hvsrc_current_compliance)
+        self.run_concurrent(
+            lambda: self.initialize_hvsrc(hvsrc),
+            lambda: self.initialize_vsrc(vsrc),
+            lambda: self.initialize_elm(elm),
+        )
+
+        if self.process.stop_requested:
+            return
 
         self.process.update_state({
             "hvsrc_voltage": self.hvsrc_get_voltage_level(hvsrc),
@@ -163,60 +170,6 @@ class IVRampBiasElmMeasurement(MatrixMeasurement, HVSourceMixin, VSourceMixin, E
             "hvsrc_output": self.hvsrc_get_output_state(hvsrc),
         })
 
-        if self.process.stop_requested:
-            return
-
-        # Initialize V Source
-
-        self.vsrc_reset(vsrc)
-        self.vsrc_setup(vsrc)
-
-        # Voltage source
-        self.vsrc_set_function_voltage(vsrc)
-
-        self.vsrc_set_current_compliance(vsrc, vsrc_current_compliance)
-
-        if self.process.stop_requested:
-            return
-
-        # Initialize Electrometer
-
-        self.elm_safe_write(elm, "*RST")
-        self.elm_safe_write(elm, "*CLS")
-
-        # Filter
-        self.elm_safe_write(elm, f":SENS:CURR:AVER:COUN {elm_filter_count:d}")
-
-        if elm_filter_type == "repeat":
-            self.elm_safe_write(elm, ":SENS:CURR:AVER:TCON REP")
-        elif elm_filter_type == "moving":
-            self.elm_safe_write(elm, ":SENS:CURR:AVER:TCON MOV")
-
-        if elm_filter_enable:
-            self.elm_safe_write(elm, ":SENS:CURR:AVER:STATE ON")
-        else:
-            self.elm_safe_write(elm, ":SENS:CURR:AVER:STATE OFF")
-
-        nplc = elm_integration_rate / 10.
-        self.elm_safe_write(elm, f":SENS:CURR:NPLC {nplc:02f}")
-
-        self.elm_set_zero_check(elm, True)
-        assert self.elm_get_zero_check(elm) is True, "failed to enable zero check"
-
-        self.elm_safe_write(elm, ":SENS:FUNC 'CURR'") # note the quotes!
-        assert elm.resource.query(":SENS:FUNC?") == '"CURR:DC"', "failed to set sense function to current"
-
-        self.elm_safe_write(elm, f":SENS:CURR:RANG {elm_current_range:E}")
-        if elm_zero_correction:
-            self.elm_safe_write(elm, ":SYST:ZCOR ON") # perform zero correction
-        # Auto range
-        self.elm_safe_write(elm, f":SENS:CURR:RANG:AUTO {elm_current_autorange_enable:d}")
-        self.elm_safe_write(elm, f":SENS:CURR:RANG:AUTO:LLIM {elm_current_autorange_minimum:E}")
-        self.elm_safe_write(elm, f":SENS:CURR:RANG:AUTO:ULIM {elm_current_autorange_maximum:E}")
-
-        self.elm_set_zero_check(elm, False)
-        assert self.elm_get_zero_check(elm) is False, "failed to disable zero check"
-
         self.process.set_message("Ramp to start...")
 
         # Output enable
@@ -269,6 +222,71 @@ class IVRampBiasElmMeasurement(MatrixMeasurement, HVSourceMixin, VSourceMixin, E
 
         self.process.set_progress(5, 5)
 
+    def initialize_hvsrc(self, hvsrc):
+        hvsrc_current_compliance = self.get_parameter("hvsrc_current_compliance")
+
+        self.hvsrc_reset(hvsrc)
+        self.hvsrc_setup(hvsrc)
+        self.hvsrc_set_current_compliance(hvsrc, hvsrc_current_compliance)
+
+    def initialize_vsrc(self, vsrc):
+        vsrc_current_compliance = self.get_parameter("vsrc_current_compliance")
+
+        self.vsrc_reset(vsrc)
+        self.vsrc_setup(vsrc)
+
+        # Voltage source
+        self.vsrc_set_function_voltage(vsrc)
+
+        self.vsrc_set_current_compliance(vsrc, vsrc_current_compliance)
+
+    def initialize_elm(self, elm):
+        elm_filter_enable = self.get_parameter("elm_filter_enable")
+        elm_filter_count = self.get_parameter("elm_filter_count")
+        elm_filter_type = self.get_parameter("elm_filter_type")
+        elm_zero_correction = self.get_parameter("elm_zero_correction")
+        elm_integration_rate = self.get_parameter("elm_integration_rate")
+        elm_current_range = self.get_parameter("elm_current_range")
+        elm_current_autorange_enable = self.get_parameter("elm_current_autorange_enable")
+        elm_current_autorange_minimum = self.get_parameter("elm_current_autorange_minimum")
+        elm_current_autorange_maximum = self.get_parameter("elm_current_autorange_maximum")
+
+        self.elm_safe_write(elm, "*RST")
+        self.elm_safe_write(elm, "*CLS")
+
+        # Filter
+        self.elm_safe_write(elm, f":SENS:CURR:AVER:COUN {elm_filter_count:d}")
+
+        if elm_filter_type == "repeat":
+            self.elm_safe_write(elm, ":SENS:CURR:AVER:TCON REP")
+        elif elm_filter_type == "moving":
+            self.elm_safe_write(elm, ":SENS:CURR:AVER:TCON MOV")
+
+        if elm_filter_enable:
+            self.elm_safe_write(elm, ":SENS:CURR:AVER:STATE ON")
+        else:
+            self.elm_safe_write(elm, ":SENS:CURR:AVER:STATE OFF")
+
+        nplc = elm_integration_rate / 10.
+        self.elm_safe_write(elm, f":SENS:CURR:NPLC {nplc:02f}")
+
+        self.elm_set_zero_check(elm, True)
+        assert self.elm_get_zero_check(elm) is True, "failed to enable zero check"
+
+        self.elm_safe_write(elm, ":SENS:FUNC 'CURR'") # note the quotes!
+        assert elm.resource.query(":SENS:FUNC?") == '"CURR:DC"', "failed to set sense function to current"
+
+        self.elm_safe_write(elm, f":SENS:CURR:RANG {elm_current_range:E}")
+        if elm_zero_correction:
+            self.elm_safe_write(elm, ":SYST:ZCOR ON") # perform zero correction
+        # Auto range
+        self.elm_safe_write(elm, f":SENS:CURR:RANG:AUTO {elm_current_autorange_enable:d}")
+        self.elm_safe_write(elm, f":SENS:CURR:RANG:AUTO:LLIM {elm_current_autorange_minimum:E}")
+        self.elm_safe_write(elm, f":SENS:CURR:RANG:AUTO:ULIM {elm_current_autorange_maximum:E}")
+
+        self.elm_set_zero_check(elm, False)
+        assert self.elm_get_zero_check(elm) is False, "failed to disable zero check"
+
     def measure(self, hvsrc, vsrc, elm):
         self.process.set_progress(1, 2)
 
@@ -282,6 +300,7 @@ class IVRampBiasElmMeasurement(MatrixMeasurement, HVSourceMixin, VSourceMixin, E
         hvsrc_accept_compliance = self.get_parameter("hvsrc_accept_compliance")
         vsrc_accept_compliance = self.get_parameter("vsrc_accept_compliance")
         elm_read_timeout = self.get_parameter("elm_read_timeout")
+        concurrent_readout = self.get_parameter("concurrent_readout")
 
         if self.process.stop_requested:
             return
@@ -294,6 +313,7 @@ class IVRampBiasElmMeasurement(MatrixMeasurement, HVSourceMixin, VSourceMixin, E
         voltage = self.hvsrc_get_voltage_level(hvsrc)
 
         ramp = LinearRange(voltage, voltage_stop, voltage_step)
+        self.reserve_series(len(ramp) + 1)
         est = Estimate(len(ramp))
         self.process.set_progress(*est.progress)
 
@@ -305,6 +325,18 @@ class IVRampBiasElmMeasurement(MatrixMeasurement, HVSourceMixin, VSourceMixin, E
         benchmark_vsrc = Benchmark("Read_V_Source")
         benchmark_environ = Benchmark("Read_Environment")
 
+        def read_vsrc():
+            with benchmark_vsrc:
+                return self.vsrc_read_current(vsrc)
+
+        def read_hvsrc():
+            with benchmark_hvsrc:
+                return self.hvsrc_read_current(hvsrc)
+
+        def read_elm():
+            with benchmark_elm:
+                return self.elm_read_current(elm, timeout=elm_read_timeout)
+
         logger.info("HV Source ramp to end voltage: from %E V to %E V with step %E V", voltage, ramp.end, ramp.step)
         for voltage in ramp:
             with benchmark_step:
@@ -326,26 +358,16 @@ class IVRampBiasElmMeasurement(MatrixMeasurement, HVSourceMixin, VSourceMixin, E
 
                 self.environment_update()
 
-                # read V Source
-                with benchmark_vsrc:
-                    vsrc_reading = self.vsrc_read_current(vsrc)
+                # read V Source, HV Source and ELM
+                if concurrent_readout:
+                    vsrc_reading, hvsrc_reading, elm_reading = self.run_concurrent(read_vsrc, read_hvsrc, read_elm)
+                else:
+                    vsrc_reading = read_vsrc()
+                    hvsrc_reading = read_hvsrc()
+                    elm_reading = read_elm()
 
                 self.process.update_state({"vsrc_current": vsrc_reading})
-
-                # read HV Source
-                with benchmark_hvsrc:
-                    hvsrc_reading = self.hvsrc_read_current(hvsrc)
-
                 self.process.update_state({"hvsrc_current": hvsrc_reading})
-
-                # read ELM
-                with benchmark_elm:
-                    try:
-                        elm_reading = self.elm_read(elm, timeout=elm_read_timeout)
-                    except Exception as exc:
-                        raise RuntimeError(f"Failed to read from ELM: {exc}") from exc
-                self.elm_check_error(elm)
-                logger.info("ELM reading: %s", format_metric(elm_reading, "A"))
                 self.process.append_reading("elm", abs(voltage) if ramp.step < 0 else voltage, elm_reading)
 
                 self.process.update_readings()
@@ -361,7 +383,8 @@ class IVRampBiasElmMeasurement(MatrixMeasurement, HVSourceMixin, VSourceMixin, E
                     bias_voltage=bias_voltage,
                     temperature_box=self.environment_temperature_box,
                     temperature_chuck=self.environment_temperature_chuck,
-                    humidity_box=self.environment_humidity_box
+                    humidity_box=self.environment_humidity_box,
+                    environment_age=self.environment_age
                 )
 
                 # Compliance tripped?
@@ -392,8 +415,8 @@ class IVRampBiasElmMeasurement(MatrixMeasurement, HVSourceMixin, VSourceMixin, E
     def analyze(self, **kwargs):
         self.process.set_progress(0, 1)
 
-        i = np.array(self.get_series("current_elm"))
-        v = np.array(self.get_series("voltage"))
+        i = self.get_series("current_elm")
+        v = self.get_series("voltage")
         self.analysis_iv(i, v)
 
         self.process.set_progress(1, 1)
@@ -2,7 +2,6 @@ import logging
 import time
 
 import comet
-import numpy as np
 
 from ..core.benchmark import Benchmark
 from ..core.estimate import Estimate
@@ -61,6 +60,7 @@ class IVRampElmMeasurement(MatrixMeasurement, HVSourceMixin, ElectrometerMixin,
         self.register_parameter("elm_current_autorange_enable", False, type=bool)
         self.register_parameter("elm_current_autorange_minimum", comet.ureg("20 pA"), unit="A")
         self.register_parameter("elm_current_autorange_maximum", comet.ureg("20 mA"), unit="A")
+        self.register_parameter("concurrent_readout", False, type=bool)
         self.register_vsource()
         self.register_elm()
         self.register_environment()
@@ -128,6 +128,7 @@ class IVRampElmMeasurement(MatrixMeasurement, HVSourceMixin, ElectrometerMixin,
         self.set_series_unit("temperature_box", "degC")
         self.set_series_unit("temperature_chuck", "degC")
         self.set_series_unit("humidity_box", "%")
+        self.set_series_unit("environment_age", "s")
 
         # Series
         self.register_series("timestamp")
@@ -137,6 +138,7 @@ class IVRampElmMeasurement(MatrixMeasurement, HVSourceMixin, ElectrometerMixin,
         self.register_series("temperature_box")
         self.register_series("temperature_chuck")
         self.register_series("humidity_box")
+        self.register_series("environment_age")
 
         self.hvsrc_reset(hvsrc)
         self.hvsrc_setup(hvsrc)
@@ -228,6 +230,7 @@ class IVRampElmMeasurement(MatrixMeasurement, HVSourceMixin, ElectrometerMixin,
         waiting_time = self.get_parameter("waiting_time")
         hvsrc_accept_compliance = self.get_parameter("hvsrc_accept_compliance")
         elm_read_timeout = self.get_parameter("elm_read_timeout")
+        concurrent_readout = self.get_parameter("concurrent_readout")
 
         if self.process.stop_requested:
             return
@@ -240,6 +243,7 @@ class IVRampElmMeasurement(MatrixMeasurement, HVSourceMixin, ElectrometerMixin,
         self.elm_check_error(elm)
 
         ramp = LinearRange(voltage, voltage_stop, voltage_step)
+        self.reserve_series(len(ramp) + 1)
         est = Estimate(len(ramp))
         self.process.set_progress(*est.progress)
 
@@ -250,6 +254,14 @@ class IVRampElmMeasurement(MatrixMeasurement, HVSourceMixin, ElectrometerMixin,
         benchmark_hvsrc = Benchmark("Read_HV_Source")
         benchmark_environ = Benchmark("Read_Environment")
 
+        def read_hvsrc():
+            with benchmark_hvsrc:
+                return self.hvsrc_read_current(hvsrc)
+
+        def read_elm():
+            with benchmark_elm:
+                return self.elm_read_current(elm, timeout=elm_read_timeout)
+
         logger.info("HV Source ramp to end voltage: from %E V to %E V with step %E V", voltage, ramp.end, ramp.step)
         for voltage in ramp:
             with benchmark_step:
@@ -266,19 +278,14 @@ class IVRampElmMeasurement(MatrixMeasurement, HVSourceMixin, ElectrometerMixin,
 
                 self.environment_update()
 
-                # read HV Source
-                with benchmark_hvsrc:
-                    hvsrc_reading = self.hvsrc_read_current(hvsrc)
-                self.process.append_reading("hvsrc", abs(voltage) if ramp.step < 0 else voltage, hvsrc_reading)
+                # read HV Source and ELM
+                if concurrent_readout:
+                    hvsrc_reading, elm_reading = self.run_concurrent(read_hvsrc, read_elm)
+                else:
+                    hvsrc_reading = read_hvsrc()
+                    elm_reading = read_elm()
 
-                # read ELM
-                with benchmark_elm:
-                    try:
-                        elm_reading = self.elm_read(elm, timeout=elm_read_timeout)
-                    except Exception as exc:
-                        raise RuntimeError(f"Failed to read from ELM: {exc}") from exc
-                self.elm_check_error(elm)
-                logger.info("ELM reading: %s", format_metric(elm_reading, "A"))
+                self.process.append_reading("hvsrc", abs(voltage) if ramp.step < 0 else voltage, hvsrc_reading)
                 self.process.append_reading("elm", abs(voltage) if ramp.step < 0 else voltage, elm_reading)
 
                 self.process.update_readings()
@@ -296,7 +303,8 @@ class IVRampElmMeasurement(MatrixMeasurement, HVSourceMixin, ElectrometerMixin,
                     current_elm=elm_reading,
                     temperature_box=self.environment_temperature_box,
                     temperature_chuck=self.environment_temperature_chuck,
-                    humidity_box=self.environment_humidity_box
+                    humidity_box=self.environment_humidity_box,
+                    environment_age=self.environment_age
                 )
 
                 # Compliance tripped?
@@ -320,8 +328,8 @@ class IVRampElmMeasurement(MatrixMeasurement, HVSourceMixin, ElectrometerMixin,
     def analyze(self, **kwargs):
         self.process.set_progress(0, 1)
 
-        i = np.array(self.get_series("current_elm"))
-        v = np.array(self.get_series("voltage"))
+        i = self.get_series("current_elm")
+        v = self.get_series("voltage")
         self.analysis_iv(i, v)
 
         self.process.set_progress(1, 1)
@@ -3,13 +3,18 @@ import json
 import logging
 import math
 import time
+import types
+from collections.abc import Mapping
+from concurrent.futures import ThreadPoolExecutor, wait
 from datetime import timedelta
-from typing import Callable, List, Optional
+from typing import Any, Callable, List, Optional
 
 import comet
 import numpy as np
 
 from ..core.formatter import PQCFormatter
+from ..core.serialize import NumpyEncoder, serialize_npz
+from ..core.series import SeriesStore
 
 __all__ = ["Measurement"]
 
@@ -21,13 +26,6 @@ KEY_SERIES_UNITS = "series_units"
 KEY_ANALYSIS = "analysis"
 
 
-class NumpyEncoder(json.JSONEncoder):
-    def default(self, obj):
-        if isinstance(obj, np.ndarray):
-            return obj.tolist()
-        return super().default(obj)
-
-
 class ComplianceError(ValueError):
     """Compliance tripped error."""
 
@@ -83,13 +81,7 @@ def serialize_txt(data: dict, fp) -> None:
     # Write header
     fmt.write_header()
     # Write series
-    if columns:
-        size = len(series.get(columns[0]))
-        for i in range(size):
-            row = {}
-            for key in columns:
-                row[key] = series.get(key)[i]
-            fmt.write_row(row)
+    fmt.write_columns(series)
     fmt.flush()
 
 
@@ -120,14 +112,21 @@ class Measurement:
         self._data: dict = {}
         self._data[KEY_META] = {}
         self._data[KEY_SERIES_UNITS] = {}
-        self._data[KEY_SERIES] = {}
+        self._data[KEY_SERIES] = SeriesStore()
         self._data[KEY_ANALYSIS] = {}
+        self._parameters: Optional[Mapping] = None
+        self._stream = None
+        self._executor: Optional[ThreadPoolExecutor] = None
 
     @property
     def data(self):
         """Measurement data property."""
         return self._data
 
+    def set_stream(self, stream) -> None:
+        """Set stream writer receiving data as it is produced, `None` to disable."""
+        self._stream = stream
+
     def register_parameter(self, key, default=None, *, values=None, unit=None, type=None,
                            required=False):
         """Register measurement parameter."""
@@ -136,8 +135,14 @@ class Measurement:
         self.registered_parameters[key] = ParameterType(
             key, default, values, unit, type, required
         )
+        self._parameters = None
 
-    def validate_parameters(self):  # TODO
+    def validate_parameters(self):
+        """Validate and convert all registered parameters once, subsequent
+        calls of `get_parameter` read from the resulting read only snapshot.
+
+        Raise `ValueError` on missing required or invalid parameters.
+        """
         for key in self.measurement_default_parameters.keys():
             if key not in self.registered_parameters:
                 logger.warning("Unknown parameter: %s", key)
@@ -147,21 +152,27 @@ class Measurement:
                 if key not in self.measurement_parameters:
                     missing_keys.append(key)
         if missing_keys:
-            ValueError(f"missing required parameter(s): {missing_keys}")
+            raise ValueError(f"missing required parameter(s): {missing_keys}")
+        parameters = {}
+        for key, parameter in self.registered_parameters.items():
+            parameters[key] = self._resolve_parameter(parameter)
+        self._parameters = types.MappingProxyType(parameters)
 
-    def get_parameter(self, key):  # TODO
-        """Get measurement parameter."""
-        if key not in self.registered_parameters:
-            raise KeyError(f"no such parameter: {key}")
-        parameter = self.registered_parameters[key]
+    def _resolve_parameter(self, parameter):
+        """Return validated and converted parameter value."""
+        key = parameter.key
         if key not in self.measurement_parameters:
             if parameter.required:
                 raise ValueError(f"missing required parameter: {key}")
         value = self.measurement_parameters.get(key, parameter.default)
         if parameter.unit:
-            ### TODO !!!
-            ### return comet.ureg(value).to(spec.unit).m
-            return value.to(parameter.unit).m
+            # Plain default values are given in parameter unit
+            if value is None or (key not in self.measurement_parameters and not isinstance(value, comet.ureg.Quantity)):
+                return value
+            try:
+                return value.to(parameter.unit).m
+            except (AttributeError, TypeError) as exc:
+                raise ValueError(f"invalid parameter value: {key}: {value!r}") from exc
         if callable(parameter.type):
             value = parameter.type(value)
         if parameter.values:
@@ -169,31 +180,49 @@ class Measurement:
                 raise ValueError(f"invalid parameter value: {value}")
         return value
 
+    def get_parameter(self, key):
+        """Get measurement parameter."""
+        parameters = self._parameters
+        if parameters is not None:
+            try:
+                return parameters[key]
+            except KeyError:
+                raise KeyError(f"no such parameter: {key}") from None
+        if key not in self.registered_parameters:
+            raise KeyError(f"no such parameter: {key}")
+        return self._resolve_parameter(self.registered_parameters[key])
+
     def set_meta(self, key, value):
         logger.info("Meta %s: %s", key, value)
         self.data.get(KEY_META)[key] = value
+        if self._stream is not None:
+            self._stream.write_meta(key, value)
 
     def set_series_unit(self, key, value):
         self.data.get(KEY_SERIES_UNITS)[key] = value
+        if self._stream is not None:
+            self._stream.write_series_unit(key, value)
 
     def register_series(self, key):
-        series = self.data.get(KEY_SERIES)
-        if key in series:
-            raise KeyError(f"Series already exists: {key}")
-        series[key] = []
+        self.data.get(KEY_SERIES).register(key)
+
+    def reserve_series(self, count):
+        """Preallocate series storage for `count` rows."""
+        self.data.get(KEY_SERIES).reserve(count)
 
     def get_series(self, key):
-        return self.data.get(KEY_SERIES).get(key, [])
+        """Return read only array view of series."""
+        return self.data.get(KEY_SERIES).get(key, np.empty(0))
 
     def set_analysis(self, key, value):
         self.data.get(KEY_ANALYSIS)[key] = value
+        if self._stream is not None:
+            self._stream.write_analysis(key, value)
 
     def append_series(self, **kwargs):
-        series = self.data.get(KEY_SERIES)
-        if sorted(series.keys()) != sorted(kwargs.keys()):
-            raise KeyError("Inconsistent series keys")
-        for key, value in kwargs.items():
-            series.get(key).append(value)
+        self.data.get(KEY_SERIES).append(**kwargs)
+        if self._stream is not None:
+            self._stream.write_row(kwargs)
 
     def wait(self, seconds, interval=1.0):
         logger.info("Waiting %s s...", seconds)
@@ -213,8 +242,31 @@ class Measurement:
         logger.info("Waiting %s s... done.", seconds)
         self.process.set_message("")
 
+    def run_concurrent(self, *tasks: Callable[[], Any]) -> List[Any]:
+        """Run independent tasks concurrently, wait for all of them to
+        complete and return their results in order of tasks, e.g. setup or
+        readout of instruments using distinct resources.
+
+        Exceptions are raised in order of tasks, so the first failing task
+        raises as in serial execution. Steps requiring a defined order, like
+        enabling outputs, must be executed after this call.
+        """
+        if len(tasks) < 2:
+            return [task() for task in tasks]
+        if self._executor is None:
+            self._executor = ThreadPoolExecutor(thread_name_prefix="measurement")
+        futures = [self._executor.submit(task) for task in tasks]
+        wait(futures)
+        return [future.result() for future in futures]
+
+    def shutdown_executor(self) -> None:
+        if self._executor is not None:
+            self._executor.shutdown()
+            self._executor = None
+
     def before_initialize(self, **kwargs):
-        self.validate_parameters()
+        if self._parameters is None:
+            self.validate_parameters()
 
     def initialize(self, **kwargs):
         ...
@@ -269,14 +321,17 @@ class Measurement:
         """Run measurement.
 
         If initialize, measure or analyze fails, finalize is executed before
-        raising any exception.
+        raising any exception. Parameters are validated before any
+        instrument is opened.
         """
+        self.validate_parameters()
         with contextlib.ExitStack() as es:
             kwargs = {}
             for key in type(self).required_instruments:
                 cls = station.create_instrument(key)
                 resource = station.resources.get(key)
                 kwargs.update({key: cls(es.enter_context(resource))})
+            es.callback(self.shutdown_executor)
             try:
                 self._initialize(**kwargs)
                 self._measure(**kwargs)
@@ -1,12 +1,14 @@
+import contextlib
 import logging
 import math
-import time
+import threading
 
 import analysis_pqc
 import comet
 
-from ..core.filters import std_mean_filter
-from ..core.timer import Timer
+from ..core.backoff import Backoff, poll_until
+from ..core.filters import RunningStatistics
+from ..instruments.e4980a import format_list
 from ..instruments.k2657a import K2657AInstrument
 from ..settings import settings
 from ..utils import format_metric
@@ -27,6 +29,54 @@ logger = logging.getLogger(__name__)
 class Mixin:
     """Base class for measurement mixins."""
 
+    _deferred_error_devices: frozenset = frozenset()
+    _deferred_error_lock: threading.Lock = threading.Lock()
+
+    def error_check_deferred(self, device) -> bool:
+        """Return True if error checks for device are deferred."""
+        return id(device) in self._deferred_error_devices
+
+    @contextlib.contextmanager
+    def deferred_error_check(self, device, check_error, clear_error):
+        """Context for setup sequences, error checks of the device are
+        deferred and the error queue is checked only once on exit.
+
+        Steps are executed using the returned callable. If an error is found
+        on exit, the error queue is cleared and the recorded steps are
+        repeated with immediate error checks to attribute the error to the
+        command that caused it. Use only for steps that can safely be
+        repeated, e.g. configuration setters.
+
+        >>> with self.deferred_error_check(hvsrc, self.hvsrc_check_error, self.hvsrc_clear) as step:
+        ...     step(self.hvsrc_set_filter_count, hvsrc, 10)
+        ...     step(self.hvsrc_set_filter_enable, hvsrc, True)
+        """
+        steps = []
+
+        def step(f, *args):
+            steps.append((f, args))
+            return f(*args)
+
+        with self._deferred_error_lock:
+            self._deferred_error_devices = self._deferred_error_devices | {id(device)}
+        try:
+            yield step
+        finally:
+            with self._deferred_error_lock:
+                self._deferred_error_devices = self._deferred_error_devices - {id(device)}
+        try:
+            check_error(device)
+        except Exception as exc:
+            logger.warning("Deferred error check failed, repeating %d steps to locate error...", len(steps))
+            clear_error(device)
+            for f, args in steps:
+                try:
+                    f(*args)
+                except Exception:
+                    logger.error("Error caused by step: %s(%s)", f.__name__, ", ".join(map(repr, args[1:])))
+                    raise
+            raise exc
+
 
 class HVSourceMixin(Mixin):
 
@@ -60,6 +110,8 @@ class HVSourceMixin(Mixin):
 
     def hvsrc_check_error(self, hvsrc):
         """Test for error."""
+        if self.error_check_deferred(hvsrc):
+            return
         code, message = hvsrc.get_error()
         if code != 0:
             message = message.strip("\"")
@@ -87,17 +139,18 @@ class HVSourceMixin(Mixin):
         hvsrc_source_voltage_autorange_enable = self.get_parameter("hvsrc_source_voltage_autorange_enable")
         hvsrc_source_voltage_range = self.get_parameter("hvsrc_source_voltage_range")
 
-        self.hvsrc_set_route_terminal(hvsrc, hvsrc_route_terminal)
-        self.hvsrc_set_sense_mode(hvsrc, hvsrc_sense_mode)
-        self.hvsrc_set_auto_range(hvsrc, True)
-        self.hvsrc_set_filter_type(hvsrc, hvsrc_filter_type)
-        self.hvsrc_set_filter_count(hvsrc, hvsrc_filter_count)
-        self.hvsrc_set_filter_enable(hvsrc, hvsrc_filter_enable)
-        if hvsrc_source_voltage_autorange_enable:
-            self.hvsrc_set_source_voltage_autorange_enable(hvsrc, hvsrc_source_voltage_autorange_enable)
-        else:
-            # This will overwrite autorange in Keithley 2400 series
-            self.hvsrc_set_source_voltage_range(hvsrc, hvsrc_source_voltage_range)
+        with self.deferred_error_check(hvsrc, self.hvsrc_check_error, self.hvsrc_clear) as step:
+            step(self.hvsrc_set_route_terminal, hvsrc, hvsrc_route_terminal)
+            step(self.hvsrc_set_sense_mode, hvsrc, hvsrc_sense_mode)
+            step(self.hvsrc_set_auto_range, hvsrc, True)
+            step(self.hvsrc_set_filter_type, hvsrc, hvsrc_filter_type)
+            step(self.hvsrc_set_filter_count, hvsrc, hvsrc_filter_count)
+            step(self.hvsrc_set_filter_enable, hvsrc, hvsrc_filter_enable)
+            if hvsrc_source_voltage_autorange_enable:
+                step(self.hvsrc_set_source_voltage_autorange_enable, hvsrc, hvsrc_source_voltage_autorange_enable)
+            else:
+                # This will overwrite autorange in Keithley 2400 series
+                step(self.hvsrc_set_source_voltage_range, hvsrc, hvsrc_source_voltage_range)
 
     def hvsrc_set_function_voltage(self, hvsrc):
         hvsrc.set_source_function(hvsrc.SOURCE_FUNCTION_VOLTAGE)
@@ -192,6 +245,16 @@ class HVSourceMixin(Mixin):
         logger.info("HV Source current reading: %s", format_metric(current, "A"))
         return current
 
+    def hvsrc_buffered_sweep_supported(self, hvsrc):
+        return hvsrc.SWEEP_POINTS_MAXIMUM > 0
+
+    def hvsrc_sweep_voltage(self, hvsrc, voltages, delay):
+        """Return list of (voltage, current) readings of buffered sweep."""
+        logger.info("HV Source buffered sweep: %d points from %s to %s", len(voltages), format_metric(voltages[0], "V"), format_metric(voltages[-1], "V"))
+        readings = hvsrc.sweep_voltage(voltages, delay, stop_requested=lambda: self.process.stop_requested)
+        self.hvsrc_check_error(hvsrc)
+        return readings
+
 
 class VSourceMixin(Mixin):
 
@@ -225,6 +288,8 @@ class VSourceMixin(Mixin):
 
     def vsrc_check_error(self, vsrc):
         """Test for error."""
+        if self.error_check_deferred(vsrc):
+            return
         code, message = vsrc.get_error()
         if code != 0:
             logger.error(f"V Source error {code}: {message}")
@@ -259,16 +324,17 @@ class VSourceMixin(Mixin):
         vsrc_source_voltage_autorange_enable = self.get_parameter("vsrc_source_voltage_autorange_enable")
         vsrc_source_voltage_range = self.get_parameter("vsrc_source_voltage_range")
 
-        self.vsrc_set_sense_mode(vsrc, vsrc_sense_mode)
-        self.vsrc_set_route_terminal(vsrc, vsrc_route_terminal)
-        self.vsrc_set_filter_type(vsrc, vsrc_filter_type)
-        self.vsrc_set_filter_count(vsrc, vsrc_filter_count)
-        self.vsrc_set_filter_enable(vsrc, vsrc_filter_enable)
-        if vsrc_source_voltage_autorange_enable:
-            self.vsrc_set_source_voltage_autorange_enable(vsrc, vsrc_source_voltage_autorange_enable)
-        else:
-            # This will overwrite autorange
-            self.vsrc_set_source_voltage_range(vsrc, vsrc_source_voltage_range)
+        with self.deferred_error_check(vsrc, self.vsrc_check_error, self.vsrc_clear) as step:
+            step(self.vsrc_set_sense_mode, vsrc, vsrc_sense_mode)
+            step(self.vsrc_set_route_terminal, vsrc, vsrc_route_terminal)
+            step(self.vsrc_set_filter_type, vsrc, vsrc_filter_type)
+            step(self.vsrc_set_filter_count, vsrc, vsrc_filter_count)
+            step(self.vsrc_set_filter_enable, vsrc, vsrc_filter_enable)
+            if vsrc_source_voltage_autorange_enable:
+                step(self.vsrc_set_source_voltage_autorange_enable, vsrc, vsrc_source_voltage_autorange_enable)
+            else:
+                # This will overwrite autorange
+                step(self.vsrc_set_source_voltage_range, vsrc, vsrc_source_voltage_range)
 
     def vsrc_set_route_terminal(self, vsrc, route_terminals):
         logger.info("V Source set route terminals: %r", route_terminals)
@@ -373,6 +439,8 @@ class ElectrometerMixin(Mixin):
         """Update meta data parameters."""
 
     def elm_check_error(self, elm):
+        if self.error_check_deferred(elm):
+            return
         try:
             result = elm.resource.query(":SYST:ERR?")
         except Exception as exc:
@@ -393,6 +461,8 @@ class ElectrometerMixin(Mixin):
             elm.resource.write(message)
         except Exception as exc:
             raise RuntimeError(f"Failed to write to ELM: {message!r}, {exc}") from exc
+        if self.error_check_deferred(elm):
+            return
         try:
             elm.resource.query("*OPC?")
         except Exception as exc:
@@ -400,27 +470,38 @@ class ElectrometerMixin(Mixin):
         self.elm_check_error(elm)
 
     def elm_read(self, elm, timeout=60.0, interval=0.25):
-        """Perform electrometer reading with timeout."""
+        """Perform electrometer reading with timeout.
+
+        Operation complete is polled with exponentially growing intervals
+        starting at 1 ms, bound to `interval`.
+        """
         # Request operation complete
         elm.resource.write("*CLS")
         elm.resource.write("*OPC")
         # Initiate measurement
         logger.info("Initiate ELM measurement...")
         elm.resource.write(":INIT")
-        t = Timer()
-        interval = min(timeout, interval)
+        backoff = Backoff(min(0.001, interval), min(timeout, interval))
         logger.info("Poll ELM event status register...")
-        while t.delta() < timeout:
-            # Read event status
-            if int(elm.resource.query("*ESR?")) & 0x1:
-                logger.info("Fetch ELM reading...")
-                try:
-                    result = elm.resource.query(":FETCH?")
-                    return float(result.split(",")[0])
-                except Exception as exc:
-                    raise RuntimeError(f"Failed to fetch ELM reading: {exc}") from exc
-            time.sleep(interval)
-        raise RuntimeError(f"Electrometer reading timeout, exceeded {timeout:G} s")
+        # Read event status
+        if not poll_until(lambda: bool(int(elm.resource.query("*ESR?")) & 0x1), timeout, backoff):
+            raise RuntimeError(f"Electrometer reading timeout, exceeded {timeout:G} s")
+        logger.info("Fetch ELM reading...")
+        try:
+            result = elm.resource.query(":FETCH?")
+            return float(result.split(",")[0])
+        except Exception as exc:
+            raise RuntimeError(f"Failed to fetch ELM reading: {exc}") from exc
+
+    def elm_read_current(self, elm, timeout=60.0):
+        """Return electrometer current reading, test for errors."""
+        try:
+            reading = self.elm_read(elm, timeout=timeout)
+        except Exception as exc:
+            raise RuntimeError(f"Failed to read from ELM: {exc}") from exc
+        self.elm_check_error(elm)
+        logger.info("ELM reading: %s", format_metric(reading, "A"))
+        return reading
 
     def elm_get_zero_check(self, elm):
         try:
@@ -438,10 +519,16 @@ class ElectrometerMixin(Mixin):
 
 class LCRMixin(Mixin):
 
+    lcr_sample_count: int = 0
+    """Number of samples acquired for the last LCR reading."""
+
     def register_lcr(self):
         self.register_parameter("lcr_soft_filter", True, type=bool)
+        self.register_parameter("lcr_soft_filter_size", 2, type=int)
+        self.register_parameter("lcr_soft_filter_threshold", 0.005, type=float)
+        self.register_parameter("lcr_soft_filter_maximum", 64, type=int)
+        self.register_parameter("lcr_soft_filter_predict", False, type=bool)
         self.register_parameter("lcr_amplitude", unit="V", required=True)
-        self.register_parameter("lcr_frequency", unit="Hz", required=True)
         self.register_parameter("lcr_integration_time", "medium", values=("short", "medium", "long"))
         self.register_parameter("lcr_averaging_rate", 1, type=int)
         self.register_parameter("lcr_auto_level_control", True, type=bool)
@@ -451,25 +538,33 @@ class LCRMixin(Mixin):
     def lcr_update_meta(self):
         """Update meta data parameters."""
         lcr_amplitude = self.get_parameter("lcr_amplitude")
-        lcr_frequency = self.get_parameter("lcr_frequency")
         lcr_integration_time = self.get_parameter("lcr_integration_time")
         lcr_averaging_rate = self.get_parameter("lcr_averaging_rate")
         lcr_auto_level_control = self.get_parameter("lcr_auto_level_control")
         lcr_open_correction_mode = self.get_parameter("lcr_open_correction_mode")
         lcr_open_correction_channel = self.get_parameter("lcr_open_correction_channel")
         lcr_soft_filter = self.get_parameter("lcr_soft_filter")
+        lcr_soft_filter_size = self.get_parameter("lcr_soft_filter_size")
+        lcr_soft_filter_threshold = self.get_parameter("lcr_soft_filter_threshold")
+        lcr_soft_filter_maximum = self.get_parameter("lcr_soft_filter_maximum")
+        lcr_soft_filter_predict = self.get_parameter("lcr_soft_filter_predict")
 
         self.set_meta("lcr_amplitude", f"{lcr_amplitude:G} V")
-        self.set_meta("lcr_frequency", f"{lcr_frequency:G} Hz")
         self.set_meta("lcr_integration_time", lcr_integration_time)
         self.set_meta("lcr_averaging_rate", lcr_averaging_rate)
         self.set_meta("lcr_auto_level_control", lcr_auto_level_control)
         self.set_meta("lcr_open_correction_mode", lcr_open_correction_mode)
         self.set_meta("lcr_open_correction_channel", lcr_open_correction_channel)
         self.set_meta("lcr_soft_filter", lcr_soft_filter)
+        self.set_meta("lcr_soft_filter_size", lcr_soft_filter_size)
+        self.set_meta("lcr_soft_filter_threshold", lcr_soft_filter_threshold)
+        self.set_meta("lcr_soft_filter_maximum", lcr_soft_filter_maximum)
+        self.set_meta("lcr_soft_filter_predict", lcr_soft_filter_predict)
 
     def lcr_check_error(self, device):
         """Test for error."""
+        if self.error_check_deferred(device):
+            return
         code, message = device.resource.query(":SYST:ERR?").split(",", 1)
         code = int(code)
         if code != 0:
@@ -481,63 +576,146 @@ class LCRMixin(Mixin):
         """Write, wait for operation complete, test for error."""
         logger.info(f"safe write: {device.__class__.__name__}: {message}")
         device.resource.write(message)
+        if self.error_check_deferred(device):
+            return
         device.resource.query("*OPC?")
         self.lcr_check_error(device)
 
+    def lcr_clear(self, lcr):
+        lcr.clear()
+
+    def lcr_clear_sample_count(self):
+        self.lcr_sample_count = 0
+
     def lcr_reset(self, lcr):
+        self.lcr_clear_sample_count()
         lcr.reset()
         lcr.clear()
         self.lcr_check_error(lcr)
         lcr.system.beeper.state = False
         self.lcr_check_error(lcr)
 
-    def lcr_setup(self, lcr):
+    def lcr_setup(self, lcr, frequency=None):
+        """Configure LCR meter, measurement frequency is only set if not
+        `None`."""
         lcr_amplitude = self.get_parameter("lcr_amplitude")
-        lcr_frequency = self.get_parameter("lcr_frequency")
         lcr_integration_time = self.get_parameter("lcr_integration_time")
         lcr_averaging_rate = self.get_parameter("lcr_averaging_rate")
         lcr_auto_level_control = self.get_parameter("lcr_auto_level_control")
         lcr_open_correction_mode = self.get_parameter("lcr_open_correction_mode")
         lcr_open_correction_channel = self.get_parameter("lcr_open_correction_channel")
 
-        self.lcr_safe_write(lcr, f":AMPL:ALC {lcr_auto_level_control:d}")
-        self.lcr_safe_write(lcr, f":VOLT {lcr_amplitude:E}V")
-        self.lcr_safe_write(lcr, f":FREQ {lcr_frequency:.0f}HZ")
-        self.lcr_safe_write(lcr, ":FUNC:IMP:RANG:AUTO ON")
-        self.lcr_safe_write(lcr, ":FUNC:IMP:TYPE CPRP")
         integration = {"short": "SHOR", "medium": "MED", "long": "LONG"}[lcr_integration_time]
-        self.lcr_safe_write(lcr, f":APER {integration},{lcr_averaging_rate:d}")
-        self.lcr_safe_write(lcr, ":INIT:CONT OFF")
-        self.lcr_safe_write(lcr, ":TRIG:SOUR BUS")
         method = {"single": "SING", "multi": "MULT"}[lcr_open_correction_mode]
-        self.lcr_safe_write(lcr, f":CORR:METH {method}")
-        self.lcr_safe_write(lcr, f":CORR:USE:CHAN {lcr_open_correction_channel:d}")
+
+        with self.deferred_error_check(lcr, self.lcr_check_error, self.lcr_clear) as step:
+            step(self.lcr_safe_write, lcr, f":AMPL:ALC {lcr_auto_level_control:d}")
+            step(self.lcr_safe_write, lcr, f":VOLT {lcr_amplitude:E}V")
+            if frequency is not None:
+                step(self.lcr_safe_write, lcr, f":FREQ {frequency:.0f}HZ")
+            step(self.lcr_safe_write, lcr, ":FUNC:IMP:RANG:AUTO ON")
+            step(self.lcr_safe_write, lcr, ":FUNC:IMP:TYPE CPRP")
+            step(self.lcr_safe_write, lcr, f":APER {integration},{lcr_averaging_rate:d}")
+            step(self.lcr_safe_write, lcr, ":INIT:CONT OFF")
+            step(self.lcr_safe_write, lcr, ":TRIG:SOUR BUS")
+            step(self.lcr_safe_write, lcr, f":CORR:METH {method}")
+            step(self.lcr_safe_write, lcr, f":CORR:USE:CHAN {lcr_open_correction_channel:d}")
 
     def lcr_acquire_reading(self, lcr):
-        """Return primary and secondary LCR reading."""
-        self.lcr_safe_write(lcr, "TRIG:IMM")
-        prim, sec = lcr.fetch()[:2]
+        """Return primary and secondary LCR reading.
+
+        Measurement is triggered and fetched using a single `*TRG` query.
+        """
+        prim, sec = lcr.trg()[:2]
+        self.lcr_check_error(lcr)
         logger.info("LCR Meter reading: %s-%s", prim, sec)
+        self.lcr_sample_count = 1
         return prim, sec
 
-    def lcr_acquire_filter_reading(self, lcr, maximum=64, threshold=0.005, size=2):
+    def lcr_setup_list_sweep(self, lcr, frequencies, step_delay=0.0):
+        """Configure sequential list sweep of frequencies, limited to
+        `lcr.list.MAXIMUM_POINTS` points.
+        """
+        points = list(frequencies)
+        if not 0 < len(points) <= lcr.list.MAXIMUM_POINTS:
+            raise ValueError(f"LCR list sweep requires 1 to {lcr.list.MAXIMUM_POINTS} points, got {len(points)}")
+        values = format_list(points)
+        logger.info("LCR Meter setup list sweep with %d points", len(points))
+        with self.deferred_error_check(lcr, self.lcr_check_error, self.lcr_clear) as step:
+            step(self.lcr_safe_write, lcr, ":DISP:PAGE LIST")
+            step(self.lcr_safe_write, lcr, ":LIST:CLE:ALL")
+            step(self.lcr_safe_write, lcr, ":LIST:MODE SEQ")
+            step(self.lcr_safe_write, lcr, f":TRIG:SDEL {step_delay:E}")
+            step(self.lcr_safe_write, lcr, f":LIST:FREQ {values}")
+
+    def lcr_acquire_list_readings(self, lcr, timeout=60.0, interval=0.25):
+        """Return list of primary and secondary LCR readings for all points of
+        the configured list sweep, acquired by a single trigger.
+
+        Operation complete is polled with exponentially growing intervals
+        starting at 1 ms, bound to `interval`.
+        """
+        lcr.resource.write("*CLS")
+        lcr.resource.write(":TRIG:IMM")
+        lcr.resource.write("*OPC")
+        backoff = Backoff(min(0.001, interval), min(timeout, interval))
+        if not poll_until(lambda: bool(int(lcr.resource.query("*ESR?")) & 0x1), timeout, backoff):
+            raise RuntimeError(f"LCR list sweep timeout, exceeded {timeout:G} s")
+        readings = [(result[0], result[1]) for result in lcr.fetch.sweep()]
+        self.lcr_check_error(lcr)
+        logger.info("LCR Meter list sweep readings: %d", len(readings))
+        self.lcr_sample_count = 1
+        return readings
+
+    def lcr_disable_list_sweep(self, lcr):
+        """Return to single point measurement display page."""
+        self.lcr_safe_write(lcr, ":DISP:PAGE MEAS")
+
+    def lcr_acquire_filter_reading(self, lcr, maximum=None, threshold=None, size=None):
         """Aquire readings until standard deviation (sample) / mean < threshold.
 
         Size is the number of samples to be used for filter calculation.
+        Arguments default to the `lcr_soft_filter_*` parameters.
+
+        If `lcr_soft_filter_predict` is enabled, acquisition also stops as
+        soon as the standard error of the mean of all samples, relative to
+        the absolute mean, is below threshold. The mean values are returned
+        instead of the last reading in that case.
+
+        The number of acquired samples is stored in `lcr_sample_count`.
         """
-        samples = []
+        if maximum is None:
+            maximum = self.get_parameter("lcr_soft_filter_maximum")
+        if threshold is None:
+            threshold = self.get_parameter("lcr_soft_filter_threshold")
+        if size is None:
+            size = self.get_parameter("lcr_soft_filter_size")
+        predict = self.get_parameter("lcr_soft_filter_predict")
+        maximum = max(1, maximum)
+        window = RunningStatistics(max(1, size))
+        prim_total = RunningStatistics(maximum)
+        sec_total = RunningStatistics(maximum)
         prim = 0.
         sec = 0.
-        for _ in range(maximum):
+        for count in range(1, maximum + 1):
             prim, sec = self.lcr_acquire_reading(lcr)
-            samples.append(prim)
-            samples = samples[-size:]
-            if len(samples) >= size:
-                if std_mean_filter(samples, threshold):
-                    return prim, sec
+            self.lcr_sample_count = count
+            window.push(prim)
+            if window.full and window.ratio < threshold:
+                return prim, sec
+            if predict:
+                prim_total.push(prim)
+                sec_total.push(sec)
+                if prim_total.count >= max(2, window.size) and prim_total.sem < threshold * abs(prim_total.mean):
+                    logger.info("LCR Meter mean converged after %d samples", count)
+                    return prim_total.mean, sec_total.mean
         logger.warning("maximum sample count reached: %d", maximum)
         return prim, sec
 
+    def lcr_set_frequency(self, lcr, frequency):
+        logger.info("LCR Meter set frequency: %s", format_metric(frequency, "Hz"))
+        self.lcr_safe_write(lcr, f":FREQ {frequency:E}HZ")
+
     def lcr_get_bias_voltage_level(self, lcr):
         return lcr.bias.voltage.level
 
@@ -563,6 +741,7 @@ class LCRMixin(Mixin):
 class EnvironmentMixin(Mixin):
 
     def register_environment(self):
+        self.register_parameter("environment_max_age", comet.ureg("5 s"), unit="s")
         self.environment_clear()
 
     def environment_update_meta(self):
@@ -572,18 +751,34 @@ class EnvironmentMixin(Mixin):
         self.environment_temperature_box = float("nan")
         self.environment_temperature_chuck = float("nan")
         self.environment_humidity_box = float("nan")
+        self.environment_age = float("nan")
 
     def environment_update(self):
+        """Update environment values from the most recent PC data, a fresh
+        readout is requested if cached data is older than parameter
+        `environment_max_age` or the last readout failed. The time since the
+        data was read is stored in `environment_age`.
+        """
         self.environment_clear()
         if self.process.config.get("use_environ"):
-            with self.process.station.environ_worker as environ_worker:
-                pc_data = environ_worker.pc_data()
+            environ_worker = self.process.station.environ_worker
+            state = environ_worker.snapshot()
+            if state.pc_data is None or state.error is not None or state.field_age("pc_data") > self.get_parameter("environment_max_age"):
+                with environ_worker:
+                    environ_worker.pc_data(cached=False)
+                state = environ_worker.snapshot()
+            pc_data = state.pc_data
             self.environment_temperature_box = pc_data.box_temperature
-            logger.info("Box temperature: %.2f degC", self.environment_temperature_box)
             self.environment_temperature_chuck = pc_data.chuck_temperature
-            logger.info("Chuck temperature: %.2f degC", self.environment_temperature_chuck)
             self.environment_humidity_box = pc_data.box_humidity
-            logger.info("Box humidity: %.2f %%rH", self.environment_humidity_box)
+            self.environment_age = state.field_age("pc_data")
+            logger.info(
+                "Box temperature: %.2f degC, chuck temperature: %.2f degC, box humidity: %.2f %%rH (%.1f s)",
+                self.environment_temperature_box,
+                self.environment_temperature_chuck,
+                self.environment_humidity_box,
+                self.environment_age,
+            )
         self.process.update_state({
             "env_chuck_temperature": self.environment_temperature_chuck,
             "env_box_temperature": self.environment_temperature_box,
@@ -109,7 +109,7 @@ class WebAPIWorker(comet.Process):
         table_worker = self.station.table_worker
         if table_worker and table_worker.running:
             if table_worker.enabled:
-                x, y, z = table_worker.get_cached_position()
+                x, y, z = table_worker.snapshot().position
         return {
             "x": metric(x, "mm"),
             "y": metric(y, "mm"),
@@ -169,6 +169,28 @@ class Settings(SettingsMixin):
     def table_control_dodge_height(self, value):
         self.settings["table_control_dodge_height"] = to_table_unit(value)
 
+    default_table_safe_clearance = 0  # micron, disabled
+
+    @property
+    def table_safe_clearance(self):
+        """Z clearance for short hops in millimeters, zero for full retreat."""
+        return from_table_unit(safe_int(self.settings.get("table_safe_clearance"), self.default_table_safe_clearance))
+
+    @table_safe_clearance.setter
+    def table_safe_clearance(self, value):
+        self.settings["table_safe_clearance"] = to_table_unit(value)
+
+    default_table_short_hop_distance = 5000  # micron
+
+    @property
+    def table_short_hop_distance(self):
+        """Maximum X/Y distance for short hops in millimeters."""
+        return from_table_unit(safe_int(self.settings.get("table_short_hop_distance"), self.default_table_short_hop_distance))
+
+    @table_short_hop_distance.setter
+    def table_short_hop_distance(self, value):
+        self.settings["table_short_hop_distance"] = to_table_unit(value)
+
     @property
     def table_contact_delay(self) -> float:
         return safe_float(self.settings.get("table_contact_delay"), 0)
@@ -288,6 +310,25 @@ class Settings(SettingsMixin):
     def retry_contact_overdrive(self, value):
         self.settings["retry_contact_overdrive"] = to_table_unit(value)
 
+    @property
+    def optimize_contact_route(self) -> bool:
+        return bool(self.settings.get("optimize_contact_route", False))
+
+    @optimize_contact_route.setter
+    def optimize_contact_route(self, value: bool) -> None:
+        self.settings["optimize_contact_route"] = bool(value)
+
+    @property
+    def contact_route_pin(self) -> str:
+        value = self.settings.get("contact_route_pin", "none")
+        if value not in ("none", "first", "last", "first_last"):
+            return "none"
+        return value
+
+    @contact_route_pin.setter
+    def contact_route_pin(self, value: str) -> None:
+        self.settings["contact_route_pin"] = str(value)
+
     @property
     def export_json(self) -> bool:
         return bool(self.settings.get("export_json", True))
@@ -304,6 +345,34 @@ class Settings(SettingsMixin):
     def export_txt(self, value: bool) -> None:
         self.settings["export_txt"] = bool(value)
 
+    @property
+    def export_npz(self) -> bool:
+        return bool(self.settings.get("export_npz", False))
+
+    @export_npz.setter
+    def export_npz(self, value: bool) -> None:
+        self.settings["export_npz"] = bool(value)
+
+    @property
+    def stream_data(self) -> bool:
+        """Stream measurement data to a partial file while measuring."""
+        return bool(self.settings.get("stream_data", True))
+
+    @stream_data.setter
+    def stream_data(self, value: bool) -> None:
+        self.settings["stream_data"] = bool(value)
+
+    default_stream_fsync_interval = 1.0
+
+    @property
+    def stream_fsync_interval(self) -> float:
+        """Interval in seconds for syncing partial measurement data to disk."""
+        return safe_float(self.settings.get("stream_fsync_interval"), self.default_stream_fsync_interval)
+
+    @stream_fsync_interval.setter
+    def stream_fsync_interval(self, value: float) -> None:
+        self.settings["stream_fsync_interval"] = float(value)
+
     @property
     def png_analysis(self) -> bool:
         return bool(self.settings.get("png_analysis", False))
@@ -1,4 +1,5 @@
 import logging
+import math
 import os
 import time
 import traceback
@@ -11,8 +12,10 @@ from comet.resource import ResourceError
 import analysis_pqc
 
 from . import __version__
+from .core.route import plan_route, route_length
+from .core.stream import StreamWriter
 from .measurements import measurement_factory
-from .measurements.measurement import ComplianceError, serialize_json, serialize_txt
+from .measurements.measurement import ComplianceError, NumpyEncoder, serialize_json, serialize_npz, serialize_txt
 from .measurements.mixins import AnalysisError
 from .view.sequence import GroupTreeItem, SampleTreeItem
 
@@ -26,6 +29,87 @@ def timestamp_iso(timestamp: float) -> str:
     return datetime.fromtimestamp(timestamp).strftime("%Y-%m-%dT%H:%M:%S")
 
 
+def route_start(position):
+    """Return XY of table position or `None` if unknown."""
+    if position is None:
+        return None
+    x, y, *_ = tuple(position)
+    if math.isnan(x) or math.isnan(y):
+        return None
+    return x, y
+
+
+def sample_position(sample_item):
+    """Return XY centroid of enabled contacts of a sample or `None` if not
+    applicable.
+    """
+    if not isinstance(sample_item, SampleTreeItem):
+        return None
+    points = [
+        contact_item.position[:2] for contact_item in sample_item.children()
+        if contact_item.isEnabled() and contact_item.hasPosition()
+    ]
+    if not points:
+        return None
+    return (
+        sum(x for x, _ in points) / len(points),
+        sum(y for _, y in points) / len(points),
+    )
+
+
+def route_enabled(config: dict) -> bool:
+    """Return `True` if route optimization applies to table movements."""
+    return bool(config.get("optimize_contact_route") and config.get("move_to_contact"))
+
+
+def optimize_route(config: dict, items: list, positions: list, name: str, table_position=None) -> list:
+    """Return items reordered for the shortest table path starting at the
+    current table position."""
+    if len(items) < 2:
+        return items
+    pin = config.get("contact_route_pin", "none")
+    start = route_start(table_position)
+    points = [(position[0], position[1]) for position in positions]
+    order = plan_route(
+        points,
+        start=start,
+        pin_first=pin in ("first", "first_last"),
+        pin_last=pin in ("last", "first_last"),
+    )
+    planned = route_length(points, order, start)
+    original = route_length(points, range(len(points)), start)
+    logger.info("Planned %s route: %.3f mm (tree order: %.3f mm)", name, planned, original)
+    return [items[index] for index in order]
+
+
+def sample_route(config: dict, children: list, table_position=None) -> list:
+    """Return children of a sequence or group in processing order. Samples
+    are only reordered if all enabled children are samples with positions.
+    """
+    children = list(children)
+    if not route_enabled(config):
+        return children
+    enabled = [child for child in children if child.isEnabled()]
+    positions = [sample_position(child) for child in enabled]
+    if any(position is None for position in positions):
+        return children
+    return optimize_route(config, enabled, positions, "sample", table_position)
+
+
+def contact_route(config: dict, children: list, table_position=None) -> list:
+    """Return contacts of a sample in processing order. Measurement order
+    within a contact is not affected.
+    """
+    children = list(children)
+    if not route_enabled(config):
+        return children
+    enabled = [child for child in children if child.isEnabled() and child.hasPosition()]
+    if len(enabled) != len([child for child in children if child.isEnabled()]):
+        return children
+    positions = [child.position for child in enabled]
+    return optimize_route(config, enabled, positions, "contact", table_position)
+
+
 class LogFileWriter:
     """Context manager for log files."""
 
@@ -62,6 +146,40 @@ class LogFileWriter:
         return False
 
 
+class StreamFileWriter:
+    """Context manager for partial data stream files.
+
+    The stream file is kept if the context exits without calling `discard`,
+    preserving data written before a crash.
+    """
+
+    def __init__(self, filename=None, fsync_interval: float = 1.0) -> None:
+        self.filename = filename
+        self.fsync_interval: float = fsync_interval
+        self.fp = None
+        self.stream = None
+
+    def discard(self) -> None:
+        """Close and remove stream file."""
+        if self.fp is not None:
+            self.fp.close()
+            self.fp = None
+            os.remove(self.filename)
+
+    def __enter__(self):
+        if self.filename:
+            self.fp = open(self.filename, "w")
+            self.stream = StreamWriter(self.fp, self.fsync_interval, cls=NumpyEncoder)
+        return self
+
+    def __exit__(self, *exc):
+        if self.fp is not None:
+            self.stream.sync()
+            self.fp.close()
+            self.fp = None
+        return False
+
+
 class InitializeStrategy:
     """Strategy applied before a sequence."""
 
@@ -142,7 +260,7 @@ class SequenceStrategy:
                                 sample_name = contact_item.sample.name()
                                 contact_name = contact_item.name()
                                 raise RuntimeError(f"No contact position assigned for {sample_name} -> {contact_name}")
-        for sample_item in sequence_item.children():
+        for sample_item in sample_route(self.context.config, sequence_item.children(), self.context.table_position()):
             if self.context.stop_requested:
                 break
             if not sample_item.isEnabled():
@@ -174,7 +292,7 @@ class GroupStrategy:
         self.context.set_message("Process group...")
         self.context.set_item_state(group_item, group_item.ProcessingState)
         results = []
-        for child in group_item.children():
+        for child in sample_route(self.context.config, group_item.children(), self.context.table_position()):
             if self.context.stop_requested:
                 break
             if not child.isEnabled():
@@ -217,7 +335,7 @@ class SampleStrategy:
                     contact_name = contact_item.name()
                     raise RuntimeError(f"No contact position assigned for {sample_name} -> {contact_name}")
         results = []
-        for contact_item in sample_item.children():
+        for contact_item in contact_route(self.context.config, sample_item.children(), self.context.table_position()):
             if self.context.stop_requested:
                 break
             if not contact_item.isEnabled():
@@ -287,8 +405,11 @@ class ContactStrategy:
             if retry_contact:
                 z = self.context.add_retry_overdrive(z)
                 x, y = self.context.add_retry_offset(x, y)
-            # Move table to position
-            self.context.safe_move_table((x, y, z))
+            # Move table to position, table is on same sample if it was last
+            # moved to a contact of this sample
+            same_sample = self.context.table_contact_sample is contact_item.sample
+            self.context.safe_move_table((x, y, z), same_sample=same_sample)
+            self.context.table_contact_sample = contact_item.sample
             self.context.apply_contact_delay()
 
     def process_measurement_sequence(self, measurement_items) -> list:
@@ -351,30 +472,33 @@ class MeasurementStrategy:
             measurement_default_parameters=measurement_item.default_parameters,
             timestamp=timestamp
         )
-        meta = {
-            "uuid": format(uuid.uuid4()),
-            "sample_name": sample_name,
-            "sample_type": sample_type,
-            "sample_position": sample_position,
-            "sample_comment": sample_comment,
-            "contact_name": measurement_item.contact.name(),
-            "measurement_name": measurement_item.name(),
-            "measurement_type": measurement.type,
-            "measurement_tags": measurement_item.tags(),
-            "table_position": tuple(self.context.config.get("table_position") or []),
-            "start_timestamp": timestamp_iso(timestamp),
-            "operator": self.context.config.get("operator", ""),
-            "pqc_version": __version__,
-            "analysis_pqc_version": analysis_pqc.__version__,
-        }
-        for key, value in meta.items():
-            measurement.set_meta(key, value)
-
         write_logfiles = self.context.config.get("write_logfiles")
         log_filename = self.create_filename(measurement_item, suffix=".log") if write_logfiles else None
         plot_filename = self.create_filename(measurement_item, suffix=".png")
+        stream_filename = self.create_filename(measurement_item, suffix=".partial") if self.context.config.get("stream_data") else None
+        stream_fsync_interval = self.context.config.get("stream_fsync_interval", 1.0)
+
+        with LogFileWriter(log_filename), StreamFileWriter(stream_filename, stream_fsync_interval) as stream_writer:
+            measurement.set_stream(stream_writer.stream)
+            meta = {
+                "uuid": format(uuid.uuid4()),
+                "sample_name": sample_name,
+                "sample_type": sample_type,
+                "sample_position": sample_position,
+                "sample_comment": sample_comment,
+                "contact_name": measurement_item.contact.name(),
+                "measurement_name": measurement_item.name(),
+                "measurement_type": measurement.type,
+                "measurement_tags": measurement_item.tags(),
+                "table_position": tuple(self.context.config.get("table_position") or []),
+                "start_timestamp": timestamp_iso(timestamp),
+                "operator": self.context.config.get("operator", ""),
+                "pqc_version": __version__,
+                "analysis_pqc_version": analysis_pqc.__version__,
+            }
+            for key, value in meta.items():
+                measurement.set_meta(key, value)
 
-        with LogFileWriter(log_filename):
             state = ""
             try:
                 measurement.run(self.context.station)
@@ -423,6 +547,11 @@ class MeasurementStrategy:
                     # See https://docs.python.org/3/library/csv.html#csv.DictWriter
                     with open(self.create_filename(measurement_item, suffix=".txt"), "w", newline="") as fp:
                         serialize_txt(measurement.data, fp)
+                if self.context.config.get("serialize_npz"):
+                    with open(self.create_filename(measurement_item, suffix=".npz"), "wb") as fp:
+                        serialize_npz(measurement.data, fp)
+                # Data is safely serialized, remove partial stream file
+                stream_writer.discard()
 
     def apply_before_measurement_delay(self) -> None:
         before_measurement_delay = self.context.config.get("before_measurement_delay", 0)
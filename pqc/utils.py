@@ -1,8 +1,7 @@
 import math
 from typing import Iterable, List, Optional, Union
 
-from comet import ureg
-
+from .core.units import scale_factor
 from .core.utils import make_path
 
 __all__ = [
@@ -74,14 +73,18 @@ def format_table_unit(value: float) -> str:
     return f"{value:.3f} mm"
 
 
+_UM_TO_MM: float = scale_factor("um", "mm")
+_MM_TO_UM: float = scale_factor("mm", "um")
+
+
 def from_table_unit(value: float) -> float:
     """Convert table unit (micron) to millimeters."""
-    return round((value * ureg("um")).to("mm").m, 3)
+    return round(value * _UM_TO_MM, 3)
 
 
 def to_table_unit(value: float) -> float:
     """Convert millimeters to table unit (micron)."""
-    return round((value * ureg("mm")).to("um").m, 0)
+    return round(value * _MM_TO_UM, 0)
 
 
 def getcal(value: float) -> Union[int, float]:
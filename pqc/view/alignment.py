@@ -4,7 +4,6 @@ import logging
 import math
 from typing import List, Optional, Tuple
 
-from comet import ureg
 from PyQt5 import QtCore, QtGui, QtWidgets, QtChart
 
 from .components import (
@@ -15,6 +14,7 @@ from .components import (
 )
 from .sequence import GroupTreeItem, SampleTreeItem
 from ..core.position import Position
+from ..core.units import convert
 from ..core.utils import LinearTransform
 from ..settings import TablePosition, settings
 from ..utils import format_metric, caldone_valid, format_switch
@@ -915,11 +915,11 @@ class OptionsWidget(QtWidgets.QWidget):
 
     def dodgeHeight(self) -> float:
         """Return dodge height in millimeters."""
-        return (self.dodgeHeightSpinBox.value() * ureg("um")).to("mm").m
+        return convert(self.dodgeHeightSpinBox.value(), "um", "mm")
 
     def setDodgeHeight(self, height: float) -> None:
         """Set dodge height in millimeters."""
-        self.dodgeHeightSpinBox.setValue((height * ureg("mm")).to("um").m)
+        self.dodgeHeightSpinBox.setValue(convert(height, "mm", "um"))
 
     def isLcrResetOnMove(self) -> bool:
         return self.lcrResetOnMoveCheckBox.isChecked()
@@ -929,10 +929,10 @@ class OptionsWidget(QtWidgets.QWidget):
 
     def stepUpDelay(self) -> float:
         """Return step up delay in seconds."""
-        return (self.stepUpDelaySpinBox.value() * ureg("ms")).to("s").m
+        return convert(self.stepUpDelaySpinBox.value(), "ms", "s")
 
     def setStepUpDelay(self, seconds: float) -> None:
-        self.stepUpDelaySpinBox.setValue((seconds * ureg("s")).to("ms").m)
+        self.stepUpDelaySpinBox.setValue(convert(seconds, "s", "ms"))
 
     def stepUpMultiply(self) -> int:
         """Return step up delay in seconds."""
@@ -943,10 +943,10 @@ class OptionsWidget(QtWidgets.QWidget):
 
     def lcrUpdateInterval(self) -> float:
         """LCR update interval in seconds."""
-        return (self.lcrUpdateIntervalSpinBox.value() * ureg("ms")).to("s").m
+        return convert(self.lcrUpdateIntervalSpinBox.value(), "ms", "s")
 
     def setLcrUpdateInterval(self, seconds: float) -> None:
-        self.lcrUpdateIntervalSpinBox.setValue((seconds * ureg("s")).to("ms").m)
+        self.lcrUpdateIntervalSpinBox.setValue(convert(seconds, "s", "ms"))
 
     def lcrMatrixChannels(self) -> List[str]:
         """Matrix channels used for LCR readings."""
@@ -1085,15 +1085,15 @@ class AlignmentDialog(QtWidgets.QDialog):
 
         # Create step width radio buttons
         for item in self.load_table_step_sizes():
-            step_size = item.get("step_size") * ureg("um")
+            step_size = item.get("step_size")
             step_color = item.get("step_color")
-            step_size_label = format_metric(step_size.to("m").m, "m", decimals=1)
+            step_size_label = format_metric(convert(step_size, "um", "m"), "m", decimals=1)
             button = QtWidgets.QRadioButton(self)
             button.setText(step_size_label)
             button.setToolTip(f"Move in {step_size_label} steps.")
             button.setStyleSheet(f"QRadioButton:enabled{{color:{step_color};}}")
             button.setChecked(len(self.stepWidthButtonGroup.buttons()) == 0)
-            button.setProperty("step", step_size.to("mm").m)
+            button.setProperty("step", convert(step_size, "um", "mm"))
             button.setProperty("color", step_color)
             self.stepWidthButtonGroup.addButton(button)
             stepWidthGroupBoxLayout.addWidget(button)
@@ -1417,7 +1417,7 @@ class AlignmentDialog(QtWidgets.QDialog):
             else:
                 z_enabled = self.stepWidth() <= self.maximum_z_step_size
         self.zAddButton.setEnabled(z_enabled)
-        step_up_limit = ureg("10.0 um").to("mm").m
+        step_up_limit = convert(10.0, "um", "mm")
         self.stepUpButton.setEnabled(z_enabled and (self.stepWidth() <= step_up_limit))  # TODO
 
     def relative_move_xy(self, x, y) -> None:
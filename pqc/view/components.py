@@ -1,10 +1,12 @@
 import math
 import os
-from typing import Iterable, List, Optional
+from typing import Dict, Iterable, List, Optional, Set, Tuple
 
 from comet import ui
-from PyQt5 import QtCore, QtGui, QtWidgets
+from PyQt5 import QtChart, QtCore, QtGui, QtWidgets
 
+from ..core.bounds import Bounds
+from ..core.decimate import DecimatedSeries
 from ..core.position import Position
 from ..core.utils import make_path, user_home
 from ..settings import settings
@@ -407,12 +409,29 @@ class PositionsComboBox(QtWidgets.QComboBox):
 
 
 class PlotWidget(QtWidgets.QWidget):
-    """Transitional wrapper for plots."""
+    """Transitional wrapper for plots.
+
+    Series data passed by `setData` and `appendData` is kept in full
+    resolution and rendered as min/max decimated view limited to two points
+    per pixel of plot width, re-decimated on zoom and resize.
+    """
+
+    MinimumRenderPoints: int = 256
 
     def __init__(self, parent: Optional[QtWidgets.QWidget] = None) -> None:
         super().__init__(parent)
 
         self._plot = ui.Plot(height=300, legend="right")
+        self._bounds: Dict[str, Bounds] = {}
+        self._seriesAxes: Dict[str, Tuple[str, str]] = {}
+        self._data: Dict[str, DecimatedSeries] = {}
+        self._decimated: Dict[str, Optional[int]] = {}
+        self._views: Dict[str, Tuple] = {}
+        self._renderAxes: Set[str] = set()
+
+        self._renderTimer = QtCore.QTimer(self)
+        self._renderTimer.setSingleShot(True)
+        self._renderTimer.timeout.connect(self._renderDecimated)
 
         layout = QtWidgets.QVBoxLayout(self)
         layout.setContentsMargins(0, 0, 0, 0)
@@ -423,7 +442,110 @@ class PlotWidget(QtWidgets.QWidget):
 
     def addSeries(self, name: str, xaxis: str, yaxis: str, *, text: str, color=None) -> None:
         self._plot.add_series(name, xaxis, yaxis, text=text, color=color)
-        return self._plot.series.get(name)
+        series = self._plot.series.get(name)
+        self._bounds[name] = Bounds.track(series.qt)
+        self._seriesAxes[name] = xaxis, yaxis
+        self._data[name] = DecimatedSeries()
+        self._decimated[name] = None
+        if xaxis not in self._renderAxes:
+            self._renderAxes.add(xaxis)
+            self._plot.axes.get(xaxis).qt.rangeChanged.connect(self._scheduleRender)
+        return series
+
+    def renderPoints(self) -> int:
+        """Return maximum number of rendered points per series."""
+        width = self.chart().plotArea().width() or self.width()
+        return max(self.MinimumRenderPoints, int(width) * 2)
+
+    def setData(self, name: str, x, y) -> None:
+        """Replace full resolution data of series and render it."""
+        data = self._data[name]
+        data.clear()
+        data.extend(x, y)
+        self._views.pop(name, None)
+        self._render(name)
+
+    def appendData(self, name: str, x, y) -> None:
+        """Append scalar or array points to full resolution data of series.
+
+        New points are appended to the plot series directly as long as the
+        series fits the render limit or the tail appended since the last
+        decimation is short, else the series is decimated again.
+        """
+        data = self._data[name]
+        count = len(data)
+        data.extend(x, y)
+        points = self.renderPoints()
+        decimated = self._decimated[name]
+        if decimated is None:
+            direct = len(data) <= points
+        else:
+            direct = len(data) - decimated <= points // 8
+        if direct:
+            series = self._plot.series.get(name)
+            for x_value, y_value in zip(data.x[count:].tolist(), data.y[count:].tolist()):
+                series.append(x_value, y_value)
+        else:
+            self._render(name)
+
+    def _zoomRange(self, name: str) -> Tuple[float, float]:
+        axis = self._plot.axes.get(self._seriesAxes[name][0]).qt
+        if isinstance(axis, QtChart.QDateTimeAxis):
+            return axis.min().toMSecsSinceEpoch() / 1e3, axis.max().toMSecsSinceEpoch() / 1e3
+        return axis.min(), axis.max()
+
+    def _render(self, name: str) -> None:
+        """Render decimated view of series data if changed."""
+        data = self._data[name]
+        points = self.renderPoints()
+        x_range = self._zoomRange(name) if self._plot.zoomed else None
+        key = len(data), x_range, points
+        if self._views.get(name) == key:
+            return
+        self._views[name] = key
+        x, y = data.view(points, x_range)
+        self._decimated[name] = len(data) if len(x) < len(data) else None
+        self._plot.series.get(name).replace(list(zip(x.tolist(), y.tolist())))
+
+    def _scheduleRender(self, *args) -> None:
+        if any(decimated is not None for decimated in self._decimated.values()):
+            self._renderTimer.start()
+
+    def _renderDecimated(self) -> None:
+        for name, decimated in self._decimated.items():
+            if decimated is not None:
+                self._render(name)
+
+    def resizeEvent(self, event: QtGui.QResizeEvent) -> None:
+        super().resizeEvent(event)
+        self._scheduleRender()
+
+    def _fitBounds(self) -> None:
+        """Fit axes to incrementally maintained series bounds, falls back to
+        a full fit for empty or singular ranges."""
+        axesBounds: Dict[str, Bounds] = {}
+        for name, (xaxis, yaxis) in self._seriesAxes.items():
+            bounds = self._bounds[name]
+            axesBounds.setdefault(xaxis, Bounds()).update(bounds)
+            axesBounds.setdefault(yaxis, Bounds()).update(bounds)
+        ranges = {}
+        for name, (xaxis, yaxis) in self._seriesAxes.items():
+            x_range = axesBounds[xaxis].x_range
+            y_range = axesBounds[yaxis].y_range
+            if not x_range or not y_range or x_range[0] == x_range[1] or y_range[0] == y_range[1]:
+                self._plot.fit()
+                return
+            ranges[xaxis] = x_range
+            ranges[yaxis] = y_range
+        for name, (minimum, maximum) in ranges.items():
+            axis = self._plot.axes.get(name).qt
+            if isinstance(axis, QtChart.QDateTimeAxis):
+                axis.setRange(
+                    QtCore.QDateTime.fromMSecsSinceEpoch(int(minimum)),
+                    QtCore.QDateTime.fromMSecsSinceEpoch(int(maximum))
+                )
+            else:
+                axis.setRange(minimum, maximum)
 
     def axes(self) -> dict:
         return self._plot.axes
@@ -437,7 +559,7 @@ class PlotWidget(QtWidgets.QWidget):
         else:
             if hack:
                 self._plot.qt.chart().zoomOut() # HACK
-            self._plot.fit()
+            self._fitBounds()
 
     def fit(self) -> None:
         self._plot.fit()
@@ -448,6 +570,10 @@ class PlotWidget(QtWidgets.QWidget):
     def clear(self) -> None:
         for series in self._plot.series.values():
             series.clear()
+        for name, data in self._data.items():
+            data.clear()
+            self._decimated[name] = None
+        self._views.clear()
 
     def chart(self):
         return self._plot.qt.chart()
@@ -760,9 +760,14 @@ class Dashboard(QtWidgets.QWidget, ProcessMixin):
             "retry_contact_overdrive": settings.retry_contact_overdrive,
             "retry_contact_count": settings.retry_contact_count,
             "retry_measurement_count": settings.retry_measurement_count,
+            "optimize_contact_route": settings.optimize_contact_route,
+            "contact_route_pin": settings.contact_route_pin,
             "write_logfiles": self.write_logfiles(),
             "serialize_json": settings.export_json,
             "serialize_txt": settings.export_txt,
+            "serialize_npz": settings.export_npz,
+            "stream_data": settings.stream_data,
+            "stream_fsync_interval": settings.stream_fsync_interval,
             "use_environ": self.isEnvironmentEnabled(),
             "use_table": self.isTableEnabled(),
             "move_to_contact": move_to_contact,
@@ -783,31 +788,27 @@ class Dashboard(QtWidgets.QWidget, ProcessMixin):
         worker.item_hidden.connect(self.hideItem)
         worker.save_to_image.connect(self.safeToImage)
         worker.measurement_finished.connect(self.measurementFinished)
-        worker.reading_appended.connect(self.appendReading)
-        worker.readings_updated.connect(self.updateReadings)
+        worker.updates_flushed.connect(self.applyUpdates)
         worker.analysis_appended.connect(self.appendAnalysis)
-        worker.state_changed.connect(self.updateState)
         self.aborting.connect(worker.abort)
 
         self.measure_thread = threading.Thread(target=worker)
         self.measure_thread.start()
 
-    def appendReading(self, name, x, y):
+    def applyUpdates(self, batch):
+        """Apply coalesced readings and state updates to current panel."""
         if self._panel:
-            self._panel.appendReading(name, x, y)
-
-    def updateReadings(self):
-        if self._panel:
-            self._panel.updateReadings()
+            for name, (x, y) in batch.readings.items():
+                self._panel.appendReadings(name, x, y)
+            if batch.readings_updated:
+                self._panel.updateReadings()
+            if batch.state:
+                self._panel.updateState(batch.state)
 
     def appendAnalysis(self, key, value):
         if self._panel:
             self._panel.appendAnalysis(key, value)
 
-    def updateState(self, *args):
-        if self._panel:
-            self._panel.updateState(*args)
-
     def setItemState(self, item, state) -> None:
         item.setState(state)
         item.setExpanded(True)
@@ -905,12 +906,11 @@ class Dashboard(QtWidgets.QWidget, ProcessMixin):
         dialog.loadSequence(self.sequenceTreeWidget.sequenceItems())
         if self.isEnvironmentEnabled():
             # TODO !!!
-            with self.environ_worker as environ_worker:
-                pc_data = environ_worker.pc_data()
-                dialog.updateSafety(pc_data.relay_states.laser_sensor)
-                dialog.update_probecard_light(pc_data.relay_states.probecard_light)
-                dialog.update_microscope_light(pc_data.relay_states.microscope_light)
-                dialog.update_box_light(pc_data.relay_states.box_light)
+            pc_data = self.environ_worker.pc_data()
+            dialog.updateSafety(pc_data.relay_states.laser_sensor)
+            dialog.update_probecard_light(pc_data.relay_states.probecard_light)
+            dialog.update_microscope_light(pc_data.relay_states.microscope_light)
+            dialog.update_box_light(pc_data.relay_states.box_light)
             dialog.update_lights_enabled(True)
             dialog.probecardLightToggled.connect(self.on_probecard_light_toggled)
             dialog.microscopeLightToggled.connect(self.on_microscope_light_toggled)
@@ -1,9 +1,10 @@
 import logging
 import math
-from typing import Optional
+from typing import Dict, Optional
 
-from PyQt5 import QtWidgets, QtChart
+from PyQt5 import QtGui, QtWidgets
 
+from ..core.decimate import StreamDecimator
 from .components import PlotWidget
 
 __all__ = ["EnvironmentWidget"]
@@ -21,10 +22,12 @@ class EnvironmentWidget(QtWidgets.QWidget):
     def __init__(self, parent: Optional[QtWidgets.QWidget] = None) -> None:
         super().__init__(parent)
 
-        # Data series
-        self.box_temperature_series = []
-        self.chuck_temperature_series = []
-        self.box_humidity_series = []
+        # Data series, decimated to plot width
+        self.decimators: Dict[str, StreamDecimator] = {
+            "box_temperature": StreamDecimator(self.SampleCount),
+            "chuck_temperature": StreamDecimator(self.SampleCount),
+            "box_humidity": StreamDecimator(self.SampleCount),
+        }
 
         # Plot
         self.plotWidget = PlotWidget()
@@ -70,10 +73,18 @@ class EnvironmentWidget(QtWidgets.QWidget):
         layout.addWidget(self.boxDoorLineEdit)
         layout.addStretch(1)
 
-    def truncateData(self) -> None:
-        self.box_temperature_series = self.box_temperature_series[-self.SampleCount:]
-        self.chuck_temperature_series = self.chuck_temperature_series[-self.SampleCount:]
-        self.box_humidity_series = self.box_humidity_series[-self.SampleCount:]
+    def bucketSize(self) -> int:
+        """Return number of samples reduced to one min/max pair, limiting
+        plotted points to two per pixel of plot width."""
+        width = max(1, self.plotWidget.width())
+        return max(1, math.ceil(self.SampleCount / width))
+
+    def resizeEvent(self, event: QtGui.QResizeEvent) -> None:
+        super().resizeEvent(event)
+        bucketSize = self.bucketSize()
+        for name, decimator in self.decimators.items():
+            if decimator.bucket_size != bucketSize:
+                self.plotWidget.series().get(name).replace(decimator.rebuild(bucketSize))
 
     def appendData(self, t, pc_data) -> None:
         # Prevent crashed due to invalid time stamps
@@ -84,16 +95,23 @@ class EnvironmentWidget(QtWidgets.QWidget):
             self.boxLuxLineEdit.setText(f"{pc_data.box_lux:.1f} Lux")
             self.boxLightLineEdit.setText(format(self.LightStates.get(pc_data.box_light_state)))
             self.boxDoorLineEdit.setText(format(self.DoorStates.get(pc_data.box_door_state)))
-            self.box_temperature_series.append((t, pc_data.box_temperature))
-            self.chuck_temperature_series.append((t, pc_data.chuck_temperature))
-            self.box_humidity_series.append((t, pc_data.box_humidity))
-            self.truncateData()
+            self.appendPoint("box_temperature", t, pc_data.box_temperature)
+            self.appendPoint("chuck_temperature", t, pc_data.chuck_temperature)
+            self.appendPoint("box_humidity", t, pc_data.box_humidity)
             self.updatePlot()
 
+    def appendPoint(self, name: str, x: float, y: float) -> None:
+        """Push point to history, applying only changed points to series."""
+        series = self.plotWidget.series().get(name)
+        front, back, points = self.decimators[name].push(x, y)
+        if front:
+            series.qt.removePoints(0, front)
+        if back:
+            series.qt.removePoints(series.qt.count() - back, back)
+        for point in points:
+            series.append(*point)
+
     def updatePlot(self) -> None:
-        self.plotWidget.series().get("box_temperature").replace(self.box_temperature_series)
-        self.plotWidget.series().get("chuck_temperature").replace(self.chuck_temperature_series)
-        self.plotWidget.series().get("box_humidity").replace(self.box_humidity_series)
         # Suppress invalid float crashes
         try:
             self.plotWidget.smartFit()
@@ -2,11 +2,11 @@ from typing import Optional
 
 from PyQt5 import QtWidgets
 
-import comet
-
+from pqc.core.units import scale_factor
 from ..components import PlotWidget
 from .matrix import MatrixPanel
 from .mixins import EnvironmentMixin, LCRMixin, VSourceMixin
+from .panel import scale_transform
 
 __all__ = ["CVRampHVPanel"]
 
@@ -121,23 +121,17 @@ class CVRampHVPanel(MatrixPanel):
         layout.addWidget(vSourceGroupBox, 1)
         layout.addWidget(lcrGroupBox, 1)
 
-        fahrad = comet.ureg("F")
-        volt = comet.ureg("V")
-
-        self.series_transform["lcr"] = lambda x, y: ((x * volt).to("V").m, (y * fahrad).to("pF").m)
+        self.series_transform["lcr"] = scale_transform(y=scale_factor("F", "pF"))
 
     def mount(self, measurement):
         super().mount(measurement)
         self.plotWidget.clear()
         self.plotWidget2.clear()
         for name, points in measurement.series.items():
-            tr = self.series_transform.get(name, self.series_transform_default)
             if name == "lcr":
-                for x, y in points:
-                    self.plotWidget.series().get(name).append(*tr(x, y))
+                self.plotWidget.setData(name, *self.transformedSeries(name, points))
             elif name == "lcr2":
-                for x, y in points:
-                    self.plotWidget2.series().get(name).append(*tr(x, y))
+                self.plotWidget2.setData(name, *self.transformedSeries(name, points))
         self.plotWidget.fit()
         self.plotWidget2.fit()
 
@@ -148,13 +142,13 @@ class CVRampHVPanel(MatrixPanel):
                 if name not in self.measurement.series:
                     self.measurement.series[name] = []
                 self.measurement.series[name].append((x, y))
-                self.plotWidget.series().get(name).append(*tr(x, y))
+                self.plotWidget.appendData(name, *tr(x, y))
                 self.plotWidget.smartFit()
             elif name == "lcr2":
                 if name not in self.measurement.series:
                     self.measurement.series[name] = []
                 self.measurement.series[name].append((x, y))
-                self.plotWidget2.series().get(name).append(*tr(x, y))
+                self.plotWidget2.appendData(name, *tr(x, y))
                 self.plotWidget2.smartFit()
 
     def clearReadings(self) -> None:
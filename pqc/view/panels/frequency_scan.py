@@ -2,17 +2,17 @@ from typing import Optional
 
 from PyQt5 import QtWidgets
 
-import comet
-
+from pqc.core.units import scale_factor
 from ..components import PlotWidget
 from .matrix import MatrixPanel
 from .mixins import EnvironmentMixin, HVSourceMixin, LCRMixin
+from .panel import scale_transform
 
 __all__ = ["FrequencyScanPanel"]
 
 
 class FrequencyScanPanel(MatrixPanel):
-    """Frequency scan with log10 steps."""
+    """Panel for frequency scan measurements."""
 
     def __init__(self, parent: Optional[QtWidgets.QWidget] = None) -> None:
         super().__init__(parent)
@@ -23,10 +23,10 @@ class FrequencyScanPanel(MatrixPanel):
         EnvironmentMixin(self)
 
         self.plotWidget = PlotWidget(self)
-        self.plotWidget.addAxis("x", align="bottom", text="Voltage [V] (abs)")
+        self.plotWidget.addAxis("x", align="bottom", text="Frequency [Hz]")
         self.plotWidget.addAxis("y", align="right", text="Capacitance [pF]")
-        self.plotWidget.addSeries("lcr", "x", "y", text="LCR", color="blue")
-        self.dataTabWidget.insertTab(0, self.plotWidget, "CV Curve")
+        self.plotWidget.addSeries("lcr", "x", "y", text="LCR Cp", color="blue")
+        self.dataTabWidget.insertTab(0, self.plotWidget, "Cf Curve")
 
         self.biasVoltageSpinBox = QtWidgets.QDoubleSpinBox(self)
         self.biasVoltageSpinBox.setDecimals(3)
@@ -51,6 +51,9 @@ class FrequencyScanPanel(MatrixPanel):
         self.lcFrequencyStepsSpinBox = QtWidgets.QSpinBox(self)
         self.lcFrequencyStepsSpinBox.setRange(1, 1000)
 
+        self.lcrFrequencySpacingComboBox = QtWidgets.QComboBox(self)
+        self.lcrFrequencySpacingComboBox.addItems(["log", "linear"])
+
         self.lcrAmplitudeSpinBox = QtWidgets.QDoubleSpinBox(self)
         self.lcrAmplitudeSpinBox.setDecimals(3)
         self.lcrAmplitudeSpinBox.setRange(0, float("inf"))
@@ -61,6 +64,7 @@ class FrequencyScanPanel(MatrixPanel):
         self.bind("lcr_frequency_start", self.lcFrequencyStartSpinBox, 0, unit="Hz")
         self.bind("lcr_frequency_stop", self.lcFrequencyStopSpinBox, 0, unit="MHz")
         self.bind("lcr_frequency_steps", self.lcFrequencyStepsSpinBox, 1)
+        self.bind("lcr_frequency_spacing", self.lcrFrequencySpacingComboBox, "log")
         self.bind("lcr_amplitude", self.lcrAmplitudeSpinBox, 0, unit="mV")
 
         hvsrcGroupBox = QtWidgets.QGroupBox(self)
@@ -81,8 +85,10 @@ class FrequencyScanPanel(MatrixPanel):
         lcrGroupBoxLayout.addWidget(self.lcFrequencyStartSpinBox)
         lcrGroupBoxLayout.addWidget(QtWidgets.QLabel("AC Frequency Stop"))
         lcrGroupBoxLayout.addWidget(self.lcFrequencyStopSpinBox)
-        lcrGroupBoxLayout.addWidget(QtWidgets.QLabel("AC Frequency Steps (log10)"))
+        lcrGroupBoxLayout.addWidget(QtWidgets.QLabel("AC Frequency Steps"))
         lcrGroupBoxLayout.addWidget(self.lcFrequencyStepsSpinBox)
+        lcrGroupBoxLayout.addWidget(QtWidgets.QLabel("AC Frequency Spacing"))
+        lcrGroupBoxLayout.addWidget(self.lcrFrequencySpacingComboBox)
         lcrGroupBoxLayout.addWidget(QtWidgets.QLabel("AC Amplitude"))
         lcrGroupBoxLayout.addWidget(self.lcrAmplitudeSpinBox)
         lcrGroupBoxLayout.addStretch()
@@ -92,8 +98,30 @@ class FrequencyScanPanel(MatrixPanel):
         layout.addWidget(lcrGroupBox, 1)
         layout.addStretch(1)
 
-        fahrad = comet.ureg("F")
-        volt = comet.ureg("V")
-
-        self.series_transform["lcr"] = lambda x, y: ((x * volt).to("V").m, (y * fahrad).to("pF").m)
-        self.series_transform["xfit"] = self.series_transform.get("lcr")
+        self.series_transform["lcr"] = scale_transform(y=scale_factor("F", "pF"))
+
+    def mount(self, measurement):
+        super().mount(measurement)
+        self.plotWidget.clear()
+        for name, points in measurement.series.items():
+            if name == "lcr":
+                self.plotWidget.setData(name, *self.transformedSeries(name, points))
+        self.plotWidget.fit()
+
+    def appendReading(self, name: str, x: float, y: float) -> None:
+        if self.measurement:
+            tr = self.series_transform.get(name, self.series_transform_default)
+            if name == "lcr":
+                if name not in self.measurement.series:
+                    self.measurement.series[name] = []
+                self.measurement.series[name].append((x, y))
+                self.plotWidget.appendData(name, *tr(x, y))
+                self.plotWidget.smartFit()
+
+    def clearReadings(self) -> None:
+        super().clearReadings()
+        self.plotWidget.clear()
+        if self.measurement:
+            for name, points in self.measurement.series.items():
+                self.measurement.series[name] = []
+        self.plotWidget.fit()
@@ -2,12 +2,12 @@ from typing import Optional
 
 from PyQt5 import QtWidgets
 
-import comet
-
+from pqc.core.units import scale_factor
 from ..components import PlotWidget
 from ..components import Metric
 from .matrix import MatrixPanel
 from .mixins import EnvironmentMixin, HVSourceMixin
+from .panel import scale_transform
 
 __all__ = ["IVRampPanel"]
 
@@ -94,19 +94,14 @@ class IVRampPanel(MatrixPanel):
         layout.addWidget(hvsrcGroupBox, 1)
         layout.addStretch(1)
 
-        ampere = comet.ureg("A")
-        volt = comet.ureg("V")
-
-        self.series_transform["hvsrc"] = lambda x, y: ((x * volt).to("V").m, (y * ampere).to("uA").m)
+        self.series_transform["hvsrc"] = scale_transform(y=scale_factor("A", "uA"))
         self.series_transform["xfit"] = self.series_transform.get("hvsrc")
 
     def mount(self, measurement):
         super().mount(measurement)
         self.plotWidget.clear()
         for name, points in measurement.series.items():
-            tr = self.series_transform.get(name, self.series_transform_default)
-            for x, y in points:
-                self.plotWidget.series().get(name).append(*tr(x, y))
+            self.plotWidget.setData(name, *self.transformedSeries(name, points))
         self.updateReadings()
 
     def appendReading(self, name: str, x: float, y: float) -> None:
@@ -117,7 +112,7 @@ class IVRampPanel(MatrixPanel):
                 self.measurement.series[name].append((x, y))
                 tr = self.series_transform.get(name, self.series_transform_default)
                 series = self.plotWidget.series().get(name)
-                series.append(*tr(x, y))
+                self.plotWidget.appendData(name, *tr(x, y))
                 series.qt.setVisible(True)
 
     def updateReadings(self) -> None:
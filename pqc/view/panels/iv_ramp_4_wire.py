@@ -2,11 +2,11 @@ from typing import Optional
 
 from PyQt5 import QtCore, QtWidgets, QtChart
 
-import comet
-
+from pqc.core.units import scale_factor
 from ..components import PlotWidget
 from .matrix import MatrixPanel
 from .mixins import EnvironmentMixin, VSourceMixin
+from .panel import scale_transform
 
 __all__ = ["IVRamp4WirePanel"]
 
@@ -93,10 +93,7 @@ class IVRamp4WirePanel(MatrixPanel):
         layout.addWidget(vsrcGroupBox, 1)
         layout.addStretch(1)
 
-        ampere = comet.ureg("A")
-        volt = comet.ureg("V")
-
-        self.series_transform["vsrc"] = lambda x, y: ((x * ampere).to("uA").m, (y * volt).to("V").m)
+        self.series_transform["vsrc"] = scale_transform(x=scale_factor("A", "uA"))
         self.series_transform["xfit"] = self.series_transform.get("vsrc")
 
     def mount(self, measurement):
@@ -104,11 +101,8 @@ class IVRamp4WirePanel(MatrixPanel):
         self.plotWidget.series().get("xfit").qt.setVisible(False)
         self.plotWidget.clear()
         for name, points in measurement.series.items():
-            tr = self.series_transform.get(name, self.series_transform_default)
-            series = self.plotWidget.series().get(name)
-            for x, y in points:
-                series.append(*tr(x, y))
-            series.qt.setVisible(True)
+            self.plotWidget.setData(name, *self.transformedSeries(name, points))
+            self.plotWidget.series().get(name).qt.setVisible(True)
         self.updateReadings()
 
     def appendReading(self, name: str, x: float, y: float) -> None:
@@ -119,7 +113,7 @@ class IVRamp4WirePanel(MatrixPanel):
                 self.measurement.series[name].append((x, y))
                 tr = self.series_transform.get(name, self.series_transform_default)
                 series = self.plotWidget.series().get(name)
-                series.append(*tr(x, y))
+                self.plotWidget.appendData(name, *tr(x, y))
                 series.qt.setVisible(True)
 
     def updateReadings(self) -> None:
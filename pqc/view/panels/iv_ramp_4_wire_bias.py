@@ -2,12 +2,12 @@ from typing import Optional
 
 from PyQt5 import QtWidgets
 
-import comet
-
+from pqc.core.units import scale_factor
 from ..components import PlotWidget
 from ..components import Metric
 from .matrix import MatrixPanel
 from .mixins import EnvironmentMixin, HVSourceMixin, VSourceMixin
+from .panel import scale_transform
 
 __all__ = ["IVRamp4WireBiasPanel"]
 
@@ -130,10 +130,7 @@ class IVRamp4WireBiasPanel(MatrixPanel):
         layout.addWidget(hvsrcBiasGroupBox, 1)
         layout.addWidget(vsrcGroupBox, 1)
 
-        ampere = comet.ureg("A")
-        volt = comet.ureg("V")
-
-        self.series_transform["vsrc"] = lambda x, y: ((x * ampere).to("uA").m, (y * volt).to("V").m)
+        self.series_transform["vsrc"] = scale_transform(x=scale_factor("A", "uA"))
         self.series_transform["xfit"] = self.series_transform.get("vsrc")
 
     def mount(self, measurement):
@@ -141,9 +138,7 @@ class IVRamp4WireBiasPanel(MatrixPanel):
         self.plotWidget.series().get("xfit").qt.setVisible(False)
         self.plotWidget.clear()
         for name, points in measurement.series.items():
-            tr = self.series_transform.get(name, self.series_transform_default)
-            for x, y in points:
-                self.plotWidget.series().get(name).append(*tr(x, y))
+            self.plotWidget.setData(name, *self.transformedSeries(name, points))
             self.plotWidget.series().get(name).qt.setVisible(True)
         self.updateReadings()
 
@@ -154,7 +149,7 @@ class IVRamp4WireBiasPanel(MatrixPanel):
                     self.measurement.series[name] = []
                 self.measurement.series[name].append((x, y))
                 tr = self.series_transform.get(name, self.series_transform_default)
-                self.plotWidget.series().get(name).append(*tr(x, y))
+                self.plotWidget.appendData(name, *tr(x, y))
                 self.plotWidget.series().get(name).qt.setVisible(True)
 
     def updateReadings(self) -> None:
@@ -2,8 +2,7 @@ from typing import Optional
 
 from PyQt5 import QtWidgets
 
-import comet
-
+from pqc.core.units import scale_factor
 from ..components import PlotWidget
 from .matrix import MatrixPanel
 from .mixins import (
@@ -12,6 +11,7 @@ from .mixins import (
     HVSourceMixin,
     VSourceMixin,
 )
+from .panel import scale_transform
 
 __all__ = ["IVRampBiasElmPanel"]
 
@@ -131,10 +131,7 @@ class IVRampBiasElmPanel(MatrixPanel):
         layout.addWidget(vsrcBiasGroupBox, 1)
         layout.addWidget(hvsrcGroupBox, 1)
 
-        ampere = comet.ureg("A")
-        volt = comet.ureg("V")
-
-        self.series_transform["elm"] = lambda x, y: ((x * volt).to("V").m, (y * ampere).to("uA").m)
+        self.series_transform["elm"] = scale_transform(y=scale_factor("A", "uA"))
         self.series_transform["xfit"] = self.series_transform.get("elm")
 
     def mount(self, measurement):
@@ -142,13 +139,11 @@ class IVRampBiasElmPanel(MatrixPanel):
         self.plotWidget.clear()
         for name, points in measurement.series.items():
             if name in self.plotWidget.series():
-                tr = self.series_transform.get(name, self.series_transform_default)
                 if points[0][0] > points[-1][0]:
                     self.plotWidget.axes().get("x").qt.setReverse(True)
                 else:
                     self.plotWidget.axes().get("x").qt.setReverse(False)
-                for x, y in points:
-                    self.plotWidget.series().get(name).append(*tr(x, y))
+                self.plotWidget.setData(name, *self.transformedSeries(name, points))
         self.updateReadings()
 
     def appendReading(self, name: str, x: float, y: float) -> None:
@@ -162,7 +157,7 @@ class IVRampBiasElmPanel(MatrixPanel):
                 else:
                     self.plotWidget.axes().get("x").qt.setReverse(False)
                 tr = self.series_transform.get(name, self.series_transform_default)
-                self.plotWidget.series().get(name).append(*tr(x, y))
+                self.plotWidget.appendData(name, *tr(x, y))
                 self.plotWidget.series().get(name).qt.setVisible(True)
 
     def updateReadings(self) -> None:
@@ -1,5 +1,6 @@
-from typing import Callable, Dict, Optional
+from typing import Callable, Dict, Iterable, Optional, Tuple
 
+import numpy as np
 from PyQt5 import QtCore, QtWidgets
 from QCharted import ChartView
 
@@ -9,7 +10,18 @@ from pqc.settings import settings
 from ..components import PlotWidget
 from ..components import Metric, stitch_pixmaps
 
-__all__ = ["PanelStub", "BasicPanel", "Panel"]
+__all__ = ["scale_transform", "PanelStub", "BasicPanel", "Panel"]
+
+
+def scale_transform(x: float = 1.0, y: float = 1.0) -> Callable:
+    """Return series transform applying constant scale factors, works on
+    scalars and NumPy arrays.
+
+    >>> tr = scale_transform(y=1e12)  # F to pF
+    """
+    def transform(x_value, y_value):
+        return x_value * x, y_value * y
+    return transform
 
 
 class PanelStub(QtWidgets.QWidget):
@@ -258,9 +270,20 @@ class Panel(BasicPanel):
         for handler in self.state_handlers:
             handler(data)
 
+    def transformedSeries(self, name: str, points) -> Tuple[np.ndarray, np.ndarray]:
+        """Return series points as transformed x and y arrays."""
+        data = np.asarray(points, dtype=float).reshape(-1, 2)
+        tr = self.series_transform.get(name, self.series_transform_default)
+        return tr(data[:, 0], data[:, 1])
+
     def appendReading(self, name: str, x: float, y: float) -> None:
         ...
 
+    def appendReadings(self, name: str, x: Iterable[float], y: Iterable[float]) -> None:
+        """Append batch of readings, calls `appendReading` for every point."""
+        for x_value, y_value in zip(x, y):
+            self.appendReading(name, float(x_value), float(y_value))
+
     def updateReadings(self) -> None:
         ...
 
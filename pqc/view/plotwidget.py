@@ -1,7 +1,9 @@
-from typing import List, Optional, Tuple
+from typing import Dict, List, Optional, Tuple
 
 from PyQt5 import QtCore, QtGui, QtWidgets, QtChart
 
+from ..core.bounds import Bounds
+
 __all__ = [
     "IVPlotWidget",
     "VIPlotWidget",
@@ -91,6 +93,8 @@ class XYPlotWidget(PlotWidget):
         self.xAxisDefaultRange: Tuple[float, float] = 0, 1
         self.yAxisDefaultRange: Tuple[float, float] = 0, 1
 
+        self.seriesBounds: Dict[QtChart.QXYSeries, Bounds] = {}
+
         self.dynamicXAxis = QtChart.QValueAxis()
         self.chart.addAxis(self.dynamicXAxis, QtCore.Qt.AlignBottom)
 
@@ -127,26 +131,32 @@ class XYPlotWidget(PlotWidget):
         self.chart.addSeries(series)
         series.attachAxis(self.xAxis)
         series.attachAxis(self.yAxis)
+        self.seriesBounds[series] = Bounds.track(series)
 
     def clear(self) -> None:
         for series in self.series():
             series.clear()
+            if series in self.seriesBounds:
+                self.seriesBounds[series].clear()
 
-    def resizeAxes(self) -> None:
-        x = []
-        y = []
+    def bounds(self) -> Bounds:
+        """Return bounds of all series, updated incrementally."""
+        bounds = Bounds()
         for series in self.series():
-            for p in series.pointsVector():
-                x.append(p.x())
-                y.append(p.y())
-        if x:
-            a, b  = min(x), max(x)
+            if series in self.seriesBounds:
+                bounds.update(self.seriesBounds[series])
+        return bounds
+
+    def resizeAxes(self) -> None:
+        bounds = self.bounds()
+        if bounds.x_range:
+            a, b = bounds.x_range
             self.xAxis.setRange(a, b)
         else:
             a, b = self.xAxisDefaultRange
             self.xAxis.setRange(a, b)
-        if y:
-            a, b = min(y), max(y)
+        if bounds.y_range:
+            a, b = bounds.y_range
             with QtCore.QSignalBlocker(self.yAxis):
                 self.yAxis.setRange(a, b)
             self.yAxis.applyNiceNumbers()
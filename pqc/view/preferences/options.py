@@ -28,6 +28,13 @@ class OptionsWidget(QtWidgets.QWidget):
         self.exportTxtCheckBox = QtWidgets.QCheckBox(self)
         self.exportTxtCheckBox.setText("Write plain text data (*.txt)")
 
+        self.exportNpzCheckBox = QtWidgets.QCheckBox(self)
+        self.exportNpzCheckBox.setText("Write binary data (*.npz)")
+
+        self.streamDataCheckBox = QtWidgets.QCheckBox(self)
+        self.streamDataCheckBox.setText("Stream partial data while measuring (*.partial)")
+        self.streamDataCheckBox.setToolTip("Partial data files are kept if a measurement fails.")
+
         self.writeLogfilesCheckBox = QtWidgets.QCheckBox(self)
         self.writeLogfilesCheckBox.setText("Write measurement log files (*.log)")
 
@@ -47,6 +54,17 @@ class OptionsWidget(QtWidgets.QWidget):
         self.retryContactSpinBox.setSuffix("x")
         self.retryContactSpinBox.setToolTip("Number of re-contact retries for measurements with failed analysis.")
 
+        self.optimizeRouteCheckBox = QtWidgets.QCheckBox(self)
+        self.optimizeRouteCheckBox.setText("Optimize order of contacts and samples")
+        self.optimizeRouteCheckBox.setToolTip("Reorder enabled contacts and samples for the shortest table path.")
+
+        self.routePinComboBox = QtWidgets.QComboBox(self)
+        self.routePinComboBox.addItem("None", "none")
+        self.routePinComboBox.addItem("First", "first")
+        self.routePinComboBox.addItem("Last", "last")
+        self.routePinComboBox.addItem("First and Last", "first_last")
+        self.routePinComboBox.setToolTip("Keep first and/or last item of the sequence in place.")
+
         # Plots
 
         self.plotsGroupBox = QtWidgets.QGroupBox(self)
@@ -74,6 +92,8 @@ class OptionsWidget(QtWidgets.QWidget):
         formatsGroupBoxLayout = QtWidgets.QGridLayout(self.formatsGroupBox)
         formatsGroupBoxLayout.addWidget(self.exportJsonCheckBox, 0, 0)
         formatsGroupBoxLayout.addWidget(self.exportTxtCheckBox, 1, 0)
+        formatsGroupBoxLayout.addWidget(self.exportNpzCheckBox, 2, 0)
+        formatsGroupBoxLayout.addWidget(self.streamDataCheckBox, 3, 0)
 
         # Logfiles
 
@@ -109,6 +129,17 @@ class OptionsWidget(QtWidgets.QWidget):
         autoRetryGroupBoxLayout.addWidget(self.retryContactSpinBox, 1, 1)
         autoRetryGroupBoxLayout.setColumnStretch(2, 1)
 
+        # Contact Route
+
+        self.contactRouteGroupBox = QtWidgets.QGroupBox(self)
+        self.contactRouteGroupBox.setTitle("Contact Route")
+
+        contactRouteGroupBoxLayout = QtWidgets.QGridLayout(self.contactRouteGroupBox)
+        contactRouteGroupBoxLayout.addWidget(self.optimizeRouteCheckBox, 0, 0, 1, 2)
+        contactRouteGroupBoxLayout.addWidget(QtWidgets.QLabel("Keep in Place"), 1, 0)
+        contactRouteGroupBoxLayout.addWidget(self.routePinComboBox, 1, 1)
+        contactRouteGroupBoxLayout.setColumnStretch(2, 1)
+
         # Layout
 
         firstRowLayout = QtWidgets.QHBoxLayout()
@@ -124,6 +155,7 @@ class OptionsWidget(QtWidgets.QWidget):
         layout.addLayout(secondRowLayout)
         layout.addWidget(self.instrumentsGroupBox)
         layout.addWidget(self.autoRetryGroupBox)
+        layout.addWidget(self.contactRouteGroupBox)
         layout.addStretch(1)
 
     def readSettings(self) -> None:
@@ -134,6 +166,8 @@ class OptionsWidget(QtWidgets.QWidget):
         self.pngAnalysisCheckBox.setChecked(settings.png_analysis)
         self.exportJsonCheckBox.setChecked(settings.export_json)
         self.exportTxtCheckBox.setChecked(settings.export_txt)
+        self.exportNpzCheckBox.setChecked(settings.export_npz)
+        self.streamDataCheckBox.setChecked(settings.stream_data)
         write_logfiles = bool(settings.settings.get("write_logfiles", True))
         self.writeLogfilesCheckBox.setChecked(write_logfiles)
         vsrc_instrument = str(settings.settings.get("vsrc_instrument", "K2657A"))
@@ -144,6 +178,9 @@ class OptionsWidget(QtWidgets.QWidget):
         self.hvsrcComboBox.setCurrentIndex(index)
         self.retryMeasurementSpinBox.setValue(int(settings.retry_measurement_count))
         self.retryContactSpinBox.setValue(int(settings.retry_contact_count))
+        self.optimizeRouteCheckBox.setChecked(settings.optimize_contact_route)
+        index = self.routePinComboBox.findData(settings.contact_route_pin)
+        self.routePinComboBox.setCurrentIndex(max(0, index))
 
     def writeSettings(self) -> None:
         settings.settings["png_plots"] = self.pngPlotsCheckBox.isChecked()
@@ -151,8 +188,12 @@ class OptionsWidget(QtWidgets.QWidget):
         settings.png_analysis = self.pngAnalysisCheckBox.isChecked()
         settings.export_json = self.exportJsonCheckBox.isChecked()
         settings.export_txt = self.exportTxtCheckBox.isChecked()
+        settings.export_npz = self.exportNpzCheckBox.isChecked()
+        settings.stream_data = self.streamDataCheckBox.isChecked()
         settings.settings["write_logfiles"] = self.writeLogfilesCheckBox.isChecked()
         settings.settings["vsrc_instrument"] = self.vsrcComboBox.currentText()
         settings.settings["hvsrc_instrument"] = self.hvsrcComboBox.currentText()
         settings.retry_measurement_count = self.retryMeasurementSpinBox.value()
         settings.retry_contact_count = self.retryContactSpinBox.value()
+        settings.optimize_contact_route = self.optimizeRouteCheckBox.isChecked()
+        settings.contact_route_pin = self.routePinComboBox.currentData()
@@ -205,6 +205,21 @@ class TableWidget(QtWidgets.QWidget):
         self.recontactDistanceSpinBox.setSuffix(" mm")
         self.recontactDistanceSpinBox.setToolTip("Minimum distance to all previous re-contact positions")
 
+        self.safeClearanceSpinBox = QtWidgets.QDoubleSpinBox(self)
+        self.safeClearanceSpinBox.setDecimals(3)
+        self.safeClearanceSpinBox.setRange(0, 10)
+        self.safeClearanceSpinBox.setSingleStep(0.1)
+        self.safeClearanceSpinBox.setSuffix(" mm")
+        self.safeClearanceSpinBox.setSpecialValueText("Disabled")
+        self.safeClearanceSpinBox.setToolTip("Retreat Z axis only by this clearance for short X/Y hops, disabled for full retreat")
+
+        self.shortHopDistanceSpinBox = QtWidgets.QDoubleSpinBox(self)
+        self.shortHopDistanceSpinBox.setDecimals(3)
+        self.shortHopDistanceSpinBox.setRange(0, 100)
+        self.shortHopDistanceSpinBox.setSingleStep(1)
+        self.shortHopDistanceSpinBox.setSuffix(" mm")
+        self.shortHopDistanceSpinBox.setToolTip("Maximum X/Y distance for short hops")
+
         # Control Steps
 
         self.stepsGroupBox = QtWidgets.QGroupBox(self)
@@ -281,9 +296,22 @@ class TableWidget(QtWidgets.QWidget):
         recontactGroupBoxLayout.addWidget(self.recontactDistanceSpinBox, 1, 2)
         recontactGroupBoxLayout.setColumnStretch(3, 1)
 
+        # Short Hops
+
+        self.shortHopGroupBox = QtWidgets.QGroupBox(self)
+        self.shortHopGroupBox.setTitle("Short Hops")
+
+        shortHopGroupBoxLayout = QtWidgets.QGridLayout(self.shortHopGroupBox)
+        shortHopGroupBoxLayout.addWidget(QtWidgets.QLabel("Z-Clearance"), 0, 0)
+        shortHopGroupBoxLayout.addWidget(self.safeClearanceSpinBox, 1, 0)
+        shortHopGroupBoxLayout.addWidget(QtWidgets.QLabel("Max. Distance"), 0, 1)
+        shortHopGroupBoxLayout.addWidget(self.shortHopDistanceSpinBox, 1, 1)
+        shortHopGroupBoxLayout.setColumnStretch(2, 1)
+
         bottomLayout = QtWidgets.QHBoxLayout()
         bottomLayout.addWidget(self.probecardGroupBox, 0)
         bottomLayout.addWidget(self.recontactGroupBox, 1)
+        bottomLayout.addWidget(self.shortHopGroupBox, 1)
 
         layout = QtWidgets.QVBoxLayout(self)
         layout.addWidget(self.stepsGroupBox, 1)
@@ -359,6 +387,8 @@ class TableWidget(QtWidgets.QWidget):
         self.recontactOverdriveSpinBox.setValue(settings.retry_contact_overdrive)
         self.recontactRadiusSpinBox.setValue(settings.retry_contact_radius)
         self.recontactDistanceSpinBox.setValue(settings.retry_contact_distance)
+        self.safeClearanceSpinBox.setValue(settings.table_safe_clearance)
+        self.shortHopDistanceSpinBox.setValue(settings.table_short_hop_distance)
 
     def writeSettings(self) -> None:
         table_step_sizes = []
@@ -388,3 +418,5 @@ class TableWidget(QtWidgets.QWidget):
         settings.retry_contact_overdrive = self.recontactOverdriveSpinBox.value()
         settings.retry_contact_radius = self.recontactRadiusSpinBox.value()
         settings.retry_contact_distance = self.recontactDistanceSpinBox.value()
+        settings.table_safe_clearance = self.safeClearanceSpinBox.value()
+        settings.table_short_hop_distance = self.shortHopDistanceSpinBox.value()
@@ -2,6 +2,7 @@ import logging
 
 from comet.driver.hephy import EnvironmentBox
 
+from ..core.snapshot import EnvironmentState, StateCell
 from .resource import ResourceWorker
 
 __all__ = ["EnvironmentWorker"]
@@ -18,18 +19,28 @@ class EnvironmentWorker(ResourceWorker):
     def __init__(self, resource, name, pc_data_updated=None):
         super().__init__(resource=resource, name=name)
         self.pc_data_updated = pc_data_updated
-        self._cached_pc_data = None
+        self._state = StateCell(EnvironmentState())
+
+    def snapshot(self) -> EnvironmentState:
+        """Return latest environment state, safe to call from any thread."""
+        return self._state.get()
 
     def pc_data(self, cached=True):
-        if not self._cached_pc_data or not cached:
-            self.request_pc_data().get()
-        return self._cached_pc_data
+        pc_data = self.snapshot().pc_data
+        if pc_data is None or not cached:
+            pc_data = self.request_pc_data().get()
+        return pc_data
 
     def request_pc_data(self):
         def request(context):
-            self._cached_pc_data = context.pc_data
-            self.emit("pc_data_updated", self._cached_pc_data)
-            return self._cached_pc_data
+            try:
+                pc_data = context.pc_data
+            except Exception as exc:
+                self._state.publish(error=format(exc))
+                raise
+            self._state.publish(pc_data=pc_data, error=None)
+            self.emit("pc_data_updated", pc_data)
+            return pc_data
         return self.async_request(request)
 
     def has_lights(self):
@@ -7,6 +7,7 @@ from PyQt5 import QtCore
 
 from ..core.functions import LinearRange
 from ..core.request import RequestTimeout
+from ..core.updates import UpdateBuffer
 from ..core.utils import points_in_circle
 from ..settings import settings
 from ..strategy import InitializeStrategy, FinalizeStrategy, SequenceStrategy, GroupStrategy, SampleStrategy, ContactStrategy, MeasurementStrategy
@@ -40,10 +41,10 @@ class MeasureWorker(QtCore.QObject):
     save_to_image = QtCore.pyqtSignal(object, str)
     measurement_finished = QtCore.pyqtSignal(dict)
 
-    reading_appended = QtCore.pyqtSignal(str, float, float)
-    readings_updated = QtCore.pyqtSignal()
     analysis_appended = QtCore.pyqtSignal(str, dict)
-    state_changed = QtCore.pyqtSignal(dict)
+    updates_flushed = QtCore.pyqtSignal(object)
+
+    flush_requested = QtCore.pyqtSignal()
 
     def __init__(self, station, config, item):
         super().__init__()
@@ -52,6 +53,7 @@ class MeasureWorker(QtCore.QObject):
         self.config: dict = {}
         self.sequence_item = item
         self.retry_offset_generators: dict = {}
+        self.table_contact_sample = None
         # Set default configuration
         self.config.update({
             "before_measurement_delay": 0.0,
@@ -62,9 +64,22 @@ class MeasureWorker(QtCore.QObject):
             "table_move_timeout": 120.0,
             "serialize_json": True,
             "serialize_txt": False,
+            "serialize_npz": False,
+            "stream_data": True,
+            "stream_fsync_interval": 1.0,
+            "update_interval": 0.050,
         })
         # Update custom configuration
         self.config.update(config)
+        # Readings and state updates are coalesced and flushed by the GUI
+        # thread at a bounded rate.
+        self._update_buffer: UpdateBuffer = UpdateBuffer()
+        self._update_timer = QtCore.QTimer(self)
+        self._update_timer.setInterval(int(self.config.get("update_interval") * 1e3))
+        self._update_timer.timeout.connect(self.flush_updates)
+        self._update_timer.start()
+        self.flush_requested.connect(self.release_updates)
+        self.finished.connect(self._update_timer.stop)
 
     def abort(self):
         """Stop running measurements."""
@@ -77,28 +92,52 @@ class MeasureWorker(QtCore.QObject):
         self.progress_changed.emit(value, maximum)
 
     def set_item_state(self, item, state) -> None:
+        self.request_flush()
         self.item_state_changed.emit(item, state)
 
     def reset_measurement_item(self, item) -> None:
+        self.request_flush()
         self.item_reset.emit(item)
 
     def show_measurement_item(self, item) -> None:
+        self.request_flush()
         self.item_visible.emit(item)
 
     def hide_measurement_item(self, item) -> None:
+        self.request_flush()
         self.item_hidden.emit(item)
 
     def append_reading(self, name, x, y) -> None:
-        self.reading_appended.emit(name, x, y)
+        self._update_buffer.append_reading(name, x, y)
 
     def update_readings(self) -> None:
-        self.readings_updated.emit()
+        self._update_buffer.update_readings()
 
     def append_analysis(self, key: str, values: dict) -> None:
+        self.request_flush()
         self.analysis_appended.emit(key, values)
 
     def update_state(self, data: dict) -> None:
-        self.state_changed.emit(data)
+        self._update_buffer.update_state(data)
+
+    def request_flush(self) -> None:
+        """Flush buffered updates in order with following signals."""
+        self._update_buffer.barrier()
+        self.flush_requested.emit()
+
+    def flush_updates(self) -> None:
+        """Emit buffered readings and state updates as a single batch, to be
+        called from the GUI thread only."""
+        batch = self._update_buffer.take()
+        if batch is not None:
+            self.updates_flushed.emit(batch)
+
+    def release_updates(self) -> None:
+        """Emit buffered updates up to the next barrier and release it, to be
+        called from the GUI thread only."""
+        batch = self._update_buffer.take(release=True)
+        if batch is not None:
+            self.updates_flushed.emit(batch)
 
     def safe_recover_hvsrc(self) -> None:
         with self.station.hvsrc_resource as hvsrc_resource:
@@ -166,7 +205,14 @@ class MeasureWorker(QtCore.QObject):
         logger.info(" => applying re-contact overdrive: %g mm", overdrive)
         return z
 
-    def safe_move_table(self, position) -> None:
+    def table_position(self):
+        """Return live table position in millimeters, NaN if unknown."""
+        return self.station.table_worker.snapshot().position
+
+    def safe_move_table(self, position, same_sample: bool = False) -> None:
+        """Safe move table to position, `same_sample` permits a partial Z
+        retreat for short hops between contacts of the same sample."""
+        self.table_contact_sample = None
         table_worker = self.station.table_worker
         if table_worker.running and table_worker.enabled:
             logger.info("Safe move table to %s", position)
@@ -174,7 +220,7 @@ class MeasureWorker(QtCore.QObject):
             timeout = self.config.get("table_move_timeout")
             x, y, z = position
             try:
-                table_worker.safe_absolute_move(x, y, z).get(timeout=timeout)
+                table_worker.safe_absolute_move(x, y, z, same_sample=same_sample).get(timeout=timeout)
                 self.config.update({"table_position": table_worker.get_cached_position()})
                 self.set_message("Moving table... done.")
             except RequestTimeout as exc:
@@ -244,4 +290,5 @@ class MeasureWorker(QtCore.QObject):
         else:
             self.set_message("Measurement done.")
         finally:
+            self.request_flush()
             self.finished.emit()
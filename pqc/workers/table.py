@@ -11,10 +11,13 @@ from PyQt5 import QtCore
 import comet
 
 from pqc.utils import from_table_unit, to_table_unit
+from pqc.core.backoff import Backoff, poll_until
+from pqc.core.motion import partial_retreat_height
 from pqc.core.timer import Timer
 
 from ..core.request import Request
 from ..core.position import Position
+from ..core.snapshot import StateCell, TableState
 from ..settings import settings
 
 __all__ = ["TableWorker"]
@@ -27,7 +30,7 @@ AXIS_NAMES: dict = {
     2: "Z"
 }
 
-RETRIES: int = 180
+MOTION_TIMEOUT: float = 180.0  # seconds
 
 logger = logging.getLogger(__name__)
 
@@ -89,6 +92,10 @@ class AlternateTableWorker(TableWorker):
 
     maximum_z = 23.800
 
+    motion_start_delay = .100
+    motion_confirm_delay = 1.0
+    motion_backoff = .025, .500
+
     def __init__(self, message_changed=None, progress_changed=None,
                  position_changed=None, caldone_changed=None, joystick_changed=None,
                  relative_move_finished=None, absolute_move_finished=None,
@@ -96,9 +103,9 @@ class AlternateTableWorker(TableWorker):
         super().__init__(**kwargs)
         self._lock = threading.RLock()
         self._queue = queue.Queue()
-        self._cached_position = float("nan"), float("nan"), float("nan")
-        self._cached_caldone = float("nan"), float("nan"), float("nan")
+        self._state = StateCell(TableState())
         self._stop_event = threading.Event()
+        self._velocity = None
         self.enabled = False
         self.message_changed = message_changed
         self.progress_changed = progress_changed
@@ -128,11 +135,15 @@ class AlternateTableWorker(TableWorker):
     def stop_current_action(self):
         self._stop_event.set()
 
+    def snapshot(self) -> TableState:
+        """Return latest table state, safe to call from any thread."""
+        return self._state.get()
+
     def get_cached_position(self):
-        return self._cached_position
+        return self.snapshot().position
 
     def get_cached_caldone(self):
-        return self._cached_caldone
+        return self.snapshot().caldone
 
     def wait(self):
         with self._lock:
@@ -140,19 +151,81 @@ class AlternateTableWorker(TableWorker):
 
     def _get_position(self, table) -> Position:
         x, y, z = [from_table_unit(v) for v in table.position]
-        self._cached_position = x, y, z
+        self._state.publish(position=(x, y, z))
         return Position(x, y, z)
 
     def _get_caldone(self, table) -> Position:
         x, y, z = table.caldone
-        self._cached_caldone = x, y, z
+        self._state.publish(caldone=(x, y, z))
         return Position(x, y, z)
 
+    def _poll_status(self, table) -> None:
+        """Read position, caldone and joystick state, publish a single
+        snapshot and emit changes.
+        """
+        position = tuple(from_table_unit(v) for v in table.position)
+        caldone = tuple(table.caldone)
+        joystick = table.joystick_enabled
+        self._state.publish(position=position, caldone=caldone, joystick=joystick, error=None)
+        self.set_position(Position(*position))
+        self.set_caldone(Position(*caldone))
+        self.set_joystick_enabled(joystick)
+
+    def _wait_motion(self, table, distance, reached, handle_abort, update_status, timeout=MOTION_TIMEOUT) -> bool:
+        """Wait for table motion to complete, return `True` if `reached`
+        returns `True` before timeout.
+
+        Sleeps most of the travel time expected from distance (mm) and the
+        velocity observed on previous moves, then polls using short but
+        growing intervals. Observed durations include polling latency, so
+        the fastest observed velocity is kept as estimate.
+        """
+        t = Timer()
+        expected = 0.0
+        if self._velocity:
+            expected = .8 * distance / self._velocity
+        time.sleep(self.motion_start_delay)
+        while t.delta() < expected:
+            handle_abort()
+            update_status(*table.position)
+            time.sleep(max(0., min(self.update_interval, expected - t.delta())))
+
+        status_timer = Timer()
+
+        def predicate():
+            handle_abort()
+            if status_timer.delta() > self.update_interval:
+                update_status(*table.position)
+                status_timer.reset()
+            return reached()
+
+        success = poll_until(predicate, timeout - t.delta(), Backoff(*self.motion_backoff))
+        duration = t.delta()
+        if success and distance >= 1.0 and duration > 0:
+            self._velocity = max(self._velocity or 0., distance / duration)
+        return success
+
+    def _motion_stopped(self, table):
+        """Return predicate for waiting on motion without target position.
+
+        Stopped is accepted only after the table was seen moving, or after
+        `motion_confirm_delay` if the motion was not observed at all.
+        """
+        t = Timer()
+        started = False
+
+        def stopped():
+            nonlocal started
+            if table.is_moving:
+                started = True
+                return False
+            return started or t.delta() >= self.motion_confirm_delay
+
+        return stopped
+
     def status(self) -> Request:
         def request(table):
-            self.set_position(self._get_position(table))
-            self.set_caldone(self._get_caldone(table))
-            self.set_joystick_enabled(table.joystick_enabled)
+            self._poll_status(table)
         return self.async_request(request)
 
     def position(self) -> Request:
@@ -167,7 +240,9 @@ class AlternateTableWorker(TableWorker):
 
     def joystick(self) -> Request:
         def request(table):
-            self.set_joystick_enabled(table.joystick_enabled)
+            joystick = table.joystick_enabled
+            self._state.publish(joystick=joystick)
+            self.set_joystick_enabled(joystick)
         return self.async_request(request)
 
     def enable_joystick(self, state) -> Request:
@@ -184,7 +259,9 @@ class AlternateTableWorker(TableWorker):
             table.joystick_enabled = state
             limits = table.limit
             logger.info("updated table limits: %s mm", limits)
-            self.set_joystick_enabled(table.joystick_enabled)
+            joystick = table.joystick_enabled
+            self._state.publish(joystick=joystick)
+            self.set_joystick_enabled(joystick)
         return self.async_request(request)
 
     def relative_move(self, x, y, z) -> Request:
@@ -239,12 +316,16 @@ class AlternateTableWorker(TableWorker):
             self.set_message("Ready")
         return self.async_request(request)
 
-    def safe_absolute_move(self, x, y, z) -> Request:
+    def safe_absolute_move(self, x, y, z, same_sample: bool = False) -> Request:
         """Safely move to absolute position while moving X/Y axis at zero Z.
          - move Z down to zero
          - move X and Y
          - move Z up
 
+        For short hops between contacts of the same sample (`same_sample`)
+        inside probe card limits Z is only retreated by the configured safe
+        clearance (see `partial_retreat_height`).
+
         Emits following events:
         - position_changed
         - caldone_changed
@@ -256,9 +337,6 @@ class AlternateTableWorker(TableWorker):
             self._stop_event.clear()
             self.set_message("Moving...")
 
-            retries = RETRIES
-            delay = 1.0
-
             table.handle_machine_error()
             table.handle_error()
             table.handle_calibration_error()
@@ -271,33 +349,57 @@ class AlternateTableWorker(TableWorker):
 
             def update_status(x, y, z):
                 x, y, z = [from_table_unit(v) for v in (x, y, z)]
-                self._cached_position = x, y, z
+                self._state.publish(position=(x, y, z))
                 self.set_position(Position(x, y, z))
 
             def update_caldone():
                 x, y, z = table.caldone
                 self.set_caldone(Position(x, y, z))
 
+            def stopped_at(predicate):
+                def reached():
+                    if table.is_moving:
+                        return False
+                    current_pos = table.position
+                    update_status(*current_pos)
+                    return predicate(current_pos)
+                return reached
+
             handle_abort()
             update_caldone()
 
             self.set_progress(1, 4)
             self.set_message("Retreating Z axis...")
 
-            # Moving into limit switch generates error 1004
-            table.move_relative((0, 0, -AXIS_OFFSET))
-            for i in range(retries):
-                handle_abort()
+            start_pos = table.position
+            retreat_z = None
+            if same_sample:
+                retreat_z = partial_retreat_height(
+                    [from_table_unit(value) for value in start_pos],
+                    (x, y, z),
+                    settings.table_safe_clearance,
+                    settings.table_short_hop_distance,
+                    settings.table_probecard_maximum_limits,
+                )
+            if retreat_z is not None:
+                retreat_z = to_table_unit(retreat_z)
+                logger.info("short hop, retreating Z axis to %s", retreat_z)
+                table.move_absolute((start_pos[0], start_pos[1], retreat_z))
+                distance = from_table_unit(abs(start_pos[2] - retreat_z))
+                self._wait_motion(table, distance, stopped_at(lambda pos: pos[2] == retreat_z), handle_abort, update_status)
                 current_pos = table.position
-                update_status(*current_pos)
-                if current_pos[2] == 0:
-                    break
-                time.sleep(delay)
-            current_pos = table.position
-            if current_pos[2] != 0:
-                raise RuntimeError(f"failed to relative move, current pos: {current_pos}")
-            # Clear error 1004
-            table.handle_error(ignore=[1004])
+                if current_pos[2] != retreat_z:
+                    raise RuntimeError(f"failed to absolute move, current pos: {current_pos}")
+            else:
+                # Moving into limit switch generates error 1004
+                table.move_relative((0, 0, -AXIS_OFFSET))
+                distance = from_table_unit(abs(start_pos[2]))
+                self._wait_motion(table, distance, stopped_at(lambda pos: pos[2] == 0), handle_abort, update_status)
+                current_pos = table.position
+                if current_pos[2] != 0:
+                    raise RuntimeError(f"failed to relative move, current pos: {current_pos}")
+                # Clear error 1004
+                table.handle_error(ignore=[1004])
 
             handle_abort()
             update_caldone()
@@ -307,28 +409,19 @@ class AlternateTableWorker(TableWorker):
 
             self.set_progress(2, 4)
             self.set_message("Move X Y axes...")
-            table.move_absolute((position.x, position.y, 0))
-            for i in range(retries):
-                handle_abort()
-                current_pos = table.position
-                update_status(*current_pos)
-                if current_pos[:2] == (position.x, position.y):
-                    break
-                time.sleep(delay)
+            retreat_z = current_pos[2]
+            table.move_absolute((position.x, position.y, retreat_z))
+            distance = from_table_unit(max(abs(position.x - current_pos[0]), abs(position.y - current_pos[1])))
+            self._wait_motion(table, distance, stopped_at(lambda pos: pos[:2] == (position.x, position.y)), handle_abort, update_status)
             current_pos = table.position
             if current_pos[:2] != (position.x, position.y):
                 raise RuntimeError(f"failed to absolute move, current pos: {current_pos}")
 
             self.set_progress(3, 4)
             self.set_message("Move up Z axis...")
-            table.move_relative((0, 0, position.z))
-            for i in range(retries):
-                handle_abort()
-                current_pos = table.position
-                update_status(*current_pos)
-                if current_pos[2] >= position.z:
-                    break
-                time.sleep(delay)
+            table.move_relative((0, 0, position.z - retreat_z))
+            distance = from_table_unit(abs(position.z - retreat_z))
+            self._wait_motion(table, distance, stopped_at(lambda pos: pos[2] >= position.z), handle_abort, update_status)
             current_pos = table.position
             if current_pos != (position.x, position.y, position.z):
                 raise RuntimeError(f"failed to relative move, current pos: {current_pos}")
@@ -352,7 +445,6 @@ class AlternateTableWorker(TableWorker):
             self._stop_event.clear()
             self.set_message("Calibrating...")
             timeout: float = 60.0  # movement timeout in seconds
-            retries = RETRIES
             delay: float = 1.0  # operaion delay in seconds
             axes = table.axes
 
@@ -364,7 +456,7 @@ class AlternateTableWorker(TableWorker):
 
             def update_status(x, y, z):
                 x, y, z = [from_table_unit(v) for v in (x, y, z)]
-                self._cached_position = x, y, z
+                self._state.publish(position=(x, y, z))
                 self.set_position(Position(x, y, z))
 
             def update_caldone():
@@ -375,15 +467,8 @@ class AlternateTableWorker(TableWorker):
                 index = axes.index(axis)
                 logger.info("ncal %s...", AXIS_NAMES.get(index))
                 axis.ncal()
-                t_start = time.monotonic()
-                time.sleep(delay)
-                while table.is_moving:
-                    handle_abort()
-                    if time.monotonic() - t_start > timeout:
-                        raise TimeoutError()
-                    current_pos = table.position
-                    update_status(*current_pos)
-                    time.sleep(delay)
+                if not self._wait_motion(table, 0.0, self._motion_stopped(table), handle_abort, update_status, timeout=timeout):
+                    raise TimeoutError()
                 current_pos = table.position
                 update_status(*current_pos)
                 logger.info("ncal %s... done.", AXIS_NAMES.get(index))
@@ -393,15 +478,8 @@ class AlternateTableWorker(TableWorker):
                 index = axes.index(axis)
                 logger.info("nrm %s...", AXIS_NAMES.get(index))
                 axis.nrm()
-                t_start = time.monotonic()
-                time.sleep(delay)
-                while table.is_moving:
-                    handle_abort()
-                    if time.monotonic() - t_start > timeout:
-                        raise TimeoutError()
-                    current_pos = table.position
-                    update_status(*current_pos)
-                    time.sleep(delay)
+                if not self._wait_motion(table, 0.0, self._motion_stopped(table), handle_abort, update_status, timeout=timeout):
+                    raise TimeoutError()
                 current_pos = table.position
                 update_status(*current_pos)
                 logger.info("nrm %s... done.", AXIS_NAMES.get(index))
@@ -480,12 +558,7 @@ class AlternateTableWorker(TableWorker):
 
             # Moving into limit switches generates error 1004
             table.move_relative((-AXIS_OFFSET, -AXIS_OFFSET, 0))
-            for i in range(retries):
-                time.sleep(delay)
-                if not table.is_moving:
-                    break
-                handle_abort()
-                update_status(*table.position)
+            self._wait_motion(table, 0.0, self._motion_stopped(table), handle_abort, update_status)
             # Verify table position
             current_pos = table.position
             if current_pos[:2] != (0, 0):
@@ -497,12 +570,7 @@ class AlternateTableWorker(TableWorker):
             x_offset = 52000  # TODO
             y_offset = 0
             table.move_relative((x_offset, y_offset, 0))
-            for i in range(retries):
-                time.sleep(delay)
-                if not table.is_moving:
-                    break
-                handle_abort()
-                update_status(*table.position)
+            self._wait_motion(table, 0.0, self._motion_stopped(table), handle_abort, update_status)
             # Verify table position
             current_pos = table.position
             if current_pos[:2] != (x_offset, y_offset):
@@ -544,12 +612,7 @@ class AlternateTableWorker(TableWorker):
             x_offset = 52000  # TODO
             y_offset = 0
             table.move_absolute((x_offset, y_offset, 0))
-            for i in range(retries):
-                time.sleep(delay)
-                if not table.is_moving:
-                    break
-                handle_abort()
-                update_status(*table.position)
+            self._wait_motion(table, 0.0, self._motion_stopped(table), handle_abort, update_status)
             # Verify table position
             current_pos = table.position
             if current_pos[2] != 0:
@@ -563,12 +626,7 @@ class AlternateTableWorker(TableWorker):
 
             # Move to default position
             table.move_absolute((0, 0, 0))
-            for i in range(retries):
-                time.sleep(delay)
-                if not table.is_moving:
-                    break
-                handle_abort()
-                update_status(*table.position)
+            self._wait_motion(table, 0.0, self._motion_stopped(table), handle_abort, update_status)
             # Verify table position
             current_pos = table.position
             if current_pos != (0, 0, 0):
@@ -597,21 +655,36 @@ class AlternateTableWorker(TableWorker):
                         ...
                     else:
                         try:
-                            request(table)
-                        except comet.StopRequest:
-                            self.set_message("Stopped.")
-                            self.emit("stopped")
-                        except Exception as exc:
-                            self.set_message(exc)
-                            tb = traceback.format_exc()
-                            self.emit("failed", exc, tb)
-                            self.emit("stopped")
-                            raise
+                            self._execute(request, table)
                         finally:
                             self._queue.task_done()
                     if t.delta() > self.update_interval:
-                        self.position()
-                        self.caldone()
-                        self.joystick()
+                        self._update_status(table)
                         t.reset()
             time.sleep(self.throttle_interval)
+
+    def _update_status(self, table) -> None:
+        """Periodic status poll, errors are published and raised without
+        emitting `failed` or `stopped` meant for requests.
+        """
+        try:
+            self._poll_status(table)
+        except Exception as exc:
+            self._state.publish(error=format(exc))
+            self.set_message(format(exc))
+            raise
+
+    def _execute(self, target, table) -> None:
+        """Execute target with table, errors are published and raised."""
+        try:
+            target(table)
+        except comet.StopRequest:
+            self.set_message("Stopped.")
+            self.emit("stopped")
+        except Exception as exc:
+            self._state.publish(error=format(exc))
+            self.set_message(format(exc))
+            tb = traceback.format_exc()
+            self.emit("failed", exc, tb)
+            self.emit("stopped")
+            raise
@@ -0,0 +1,36 @@
+import time
+
+import pytest
+
+from pqc.core.backoff import Backoff, poll_until
+
+
+def test_backoff():
+    backoff = Backoff(0.001, 0.010)
+    assert [backoff.next() for _ in range(6)] == [0.001, 0.002, 0.004, 0.008, 0.010, 0.010]
+    backoff.reset()
+    assert backoff.next() == 0.001
+    backoff = Backoff(0.5, 0.25)
+    assert backoff.next() == 0.5
+    assert backoff.next() == 0.5
+
+
+def test_poll_until(monkeypatch):
+    now = [0.]
+    sleeps = []
+
+    def sleep(seconds):
+        sleeps.append(seconds)
+        now[0] += seconds
+
+    monkeypatch.setattr(time, "monotonic", lambda: now[0])
+    monkeypatch.setattr(time, "sleep", sleep)
+
+    results = iter([False, False, False, True])
+    assert poll_until(lambda: next(results), 1.0, Backoff(0.001, 0.25)) is True
+    assert sleeps == [0.001, 0.002, 0.004]
+
+    sleeps.clear()
+    assert poll_until(lambda: False, 1.0, Backoff(0.125, 0.25)) is False
+    assert sleeps == [0.125, 0.25, 0.25, 0.25, 0.125]
+    assert now[0] == pytest.approx(1.007)
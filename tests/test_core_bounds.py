@@ -0,0 +1,100 @@
+import math
+
+from pqc.core.bounds import Bounds
+
+
+def test_bounds():
+    bounds = Bounds()
+    assert bounds.empty
+    assert bounds.x_range is None
+    assert bounds.y_range is None
+    bounds.add(1.0, 4.0)
+    assert not bounds.empty
+    assert bounds.x_range == (1.0, 1.0)
+    bounds.extend([(-2.0, 3.0), (0.5, 8.0)])
+    assert bounds.x_range == (-2.0, 1.0)
+    assert bounds.y_range == (3.0, 8.0)
+    bounds.add(math.nan, 100.0)
+    bounds.add(100.0, math.inf)
+    assert bounds.x_range == (-2.0, 1.0)
+    assert bounds.y_range == (3.0, 8.0)
+    bounds.clear()
+    assert bounds.empty
+
+
+def test_bounds_update():
+    a = Bounds()
+    a.add(0.0, 0.0)
+    b = Bounds()
+    b.add(2.0, -1.0)
+    a.update(b)
+    assert a.x_range == (0.0, 2.0)
+    assert a.y_range == (-1.0, 0.0)
+    a.update(Bounds())
+    assert a.x_range == (0.0, 2.0)
+
+
+class Signal:
+
+    def __init__(self):
+        self.slots = []
+
+    def connect(self, slot):
+        self.slots.append(slot)
+
+    def emit(self, *args):
+        for slot in self.slots:
+            slot(*args)
+
+
+class Point:
+
+    def __init__(self, x, y):
+        self._x = x
+        self._y = y
+
+    def x(self):
+        return self._x
+
+    def y(self):
+        return self._y
+
+
+class Series:
+
+    def __init__(self, points):
+        self.points = [Point(x, y) for x, y in points]
+        self.pointAdded = Signal()
+        self.pointRemoved = Signal()
+        self.pointsRemoved = Signal()
+        self.pointReplaced = Signal()
+        self.pointsReplaced = Signal()
+
+    def at(self, index):
+        return self.points[index]
+
+    def pointsVector(self):
+        return list(self.points)
+
+    def append(self, x, y):
+        self.points.append(Point(x, y))
+        self.pointAdded.emit(len(self.points) - 1)
+
+    def remove(self, index):
+        del self.points[index]
+        self.pointRemoved.emit(index)
+
+
+def test_bounds_track():
+    series = Series([(1.0, 4.0)])
+    bounds = Bounds.track(series)
+    assert bounds.x_range == (1.0, 1.0)
+    series.append(-2.0, 3.0)
+    series.append(0.5, 8.0)
+    assert bounds.x_range == (-2.0, 1.0)
+    assert bounds.y_range == (3.0, 8.0)
+    series.remove(2)
+    assert bounds.y_range == (3.0, 4.0)
+    series.points.clear()
+    series.pointsReplaced.emit()
+    assert bounds.empty
@@ -0,0 +1,61 @@
+import math
+
+import numpy as np
+
+from pqc.core.decimate import DecimatedSeries, StreamDecimator, minmax_decimate, minmax_indices
+from pqc.core.ringbuffer import RingBuffer
+
+
+def test_ring_buffer():
+    buffer = RingBuffer(3, 2)
+    assert len(buffer) == 0
+    assert buffer.to_array().shape == (0, 2)
+    for i in range(5):
+        buffer.append((i, i * 2))
+    assert buffer.full
+    assert len(buffer) == 3
+    assert buffer.to_array().tolist() == [[2, 4], [3, 6], [4, 8]]
+    buffer.clear()
+    assert len(buffer) == 0
+
+
+def test_minmax_decimate():
+    x, y = minmax_decimate([0, 1, 2, 3, 4, 5, 6], [1, 5, 3, 2, 0, 4, 7], 3)
+    assert x.tolist() == [0, 1, 4, 5, 6]
+    assert y.tolist() == [1, 5, 0, 4, 7]
+    indices, counts = minmax_indices([math.nan, math.nan, 2, 2, 1, math.nan], 2)
+    assert indices.tolist() == [2, 4]
+    assert counts.tolist() == [0, 1, 1]
+
+
+def test_stream_decimator():
+    decimator = StreamDecimator(9, 3)
+    chart = []
+    for i in range(39):
+        front, back, points = decimator.push(float(i), float(np.sin(i)))
+        del chart[:front]
+        del chart[len(chart) - back:]
+        chart.extend(points)
+        assert [x for x, _ in chart] == sorted(x for x, _ in chart)
+    assert len(decimator) == 9
+    assert chart == decimator.points()
+    assert len(decimator.rebuild(1)) == 9
+
+
+def test_decimated_series():
+    series = DecimatedSeries()
+    x = np.arange(5000, dtype=float)
+    y = np.sin(x / 100)
+    series.extend(x, y)
+    series.append(5000.0, 2.0)
+    assert len(series) == 5001
+    vx, vy = series.view(200)
+    assert len(vx) <= 200
+    assert vy.max() == 2.0
+    assert vy.min() == y.min()
+    vx, vy = series.view(200, (100.0, 150.0))
+    assert vx.tolist() == list(range(99, 152))
+    vx, vy = series.view(10000)
+    assert len(vx) == 5001
+    series.clear()
+    assert len(series.view(200)[0]) == 0
@@ -1,6 +1,43 @@
-from pqc.core.filters import std_mean_filter
+import math
+
+import numpy as np
+import pytest
+
+from pqc.core.filters import RunningStatistics, std_mean_filter
 
 
 def test_std_mean_filter():
     assert std_mean_filter([0.250, 0.249], 0.005)
     assert not std_mean_filter([0.250, 0.249], 0.0005)
+
+
+def test_running_statistics():
+    stats = RunningStatistics(3)
+    assert stats.count == 0
+    assert math.isnan(stats.mean)
+    stats.push(0.250)
+    assert math.isnan(stats.std)
+    stats.push(0.249)
+    assert not stats.full
+    assert stats.ratio < 0.005
+    assert not stats.ratio < 0.0005
+    values = [0.250, 0.249]
+    for value in [4.2, -1.0, 0.3, 1e3, 1e3 + 1, 1e3 - 2, 7.5]:
+        stats.push(value)
+        values = (values + [value])[-3:]
+        assert stats.full
+        assert stats.mean == pytest.approx(np.mean(values))
+        assert stats.std == pytest.approx(np.std(values, ddof=1))
+        assert stats.sem == pytest.approx(np.std(values, ddof=1) / math.sqrt(3))
+    stats.clear()
+    assert stats.count == 0
+
+
+def test_running_statistics_filter():
+    rng = np.random.default_rng(42)
+    values = rng.normal(1.0, 0.01, 100).tolist()
+    stats = RunningStatistics(4)
+    for index, value in enumerate(values):
+        stats.push(value)
+        if index >= 3:
+            assert (stats.ratio < 0.01) == std_mean_filter(values[index - 3:index + 1], 0.01)
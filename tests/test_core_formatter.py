@@ -1,7 +1,8 @@
-import os
 from io import StringIO
 
-from pqc.core.formatter import CSVFormatter, PQCFormatter
+import numpy as np
+
+from pqc.core.formatter import CSVFormatter, PQCFormatter, format_column, printf_spec
 
 
 def test_csv_formatter():
@@ -34,3 +35,70 @@ def test_pqc_formatter():
         "key\tvalue",
         "spam\t+4.200000E+01",
     ]
+
+
+def test_csv_formatter_write_columns():
+    columns = {
+        "key": ["spam", "eggs", "ham"],
+        "value": np.array([42.0, -1.0, np.nan]),
+        "count": np.array([1, 2, 3]),
+    }
+    fp_rows = StringIO()
+    fmt = CSVFormatter(fp_rows)
+    fmt.add_column("key")
+    fmt.add_column("value", "+E")
+    fmt.add_column("count", "d")
+    fmt.write_header()
+    for i in range(3):
+        fmt.write_row({key: values[i] for key, values in columns.items()})
+    fp_columns = StringIO()
+    fmt = CSVFormatter(fp_columns)
+    fmt.add_column("key")
+    fmt.add_column("value", "+E")
+    fmt.add_column("count", "d")
+    fmt.write_header()
+    fmt.write_columns(columns)
+    assert fp_columns.getvalue() == fp_rows.getvalue()
+
+
+def test_csv_formatter_write_columns_quoting():
+    fp = StringIO()
+    fmt = CSVFormatter(fp, linesep="\n")
+    fmt.add_column("key")
+    fmt.add_column("value", ",")
+    fmt.write_columns({"key": ["spam", 'e"gg'], "value": [42, 1000]})
+    assert fp.getvalue() == 'spam,42\n"e""gg","1,000"\n'
+
+
+def test_pqc_formatter_write_columns():
+    columns = {
+        "voltage": np.linspace(-1, 1, 5),
+        "current": np.array([1e-9, -2e-12, np.inf, np.nan, 0.0]),
+    }
+    fp_rows = StringIO()
+    fmt = PQCFormatter(fp_rows)
+    fmt.add_column("voltage", "E", unit="V")
+    fmt.add_column("current", "E", unit="A")
+    fmt.write_header()
+    for i in range(5):
+        fmt.write_row({key: values[i] for key, values in columns.items()})
+    fp_columns = StringIO()
+    fmt = PQCFormatter(fp_columns)
+    fmt.add_column("voltage", "E", unit="V")
+    fmt.add_column("current", "E", unit="A")
+    fmt.write_header()
+    fmt.write_columns(columns)
+    assert fp_columns.getvalue() == fp_rows.getvalue()
+
+
+def test_format_column():
+    values = np.array([0.0, -0.0, 1.5e-12, -42.0, 1e300, np.inf, -np.inf, np.nan])
+    for spec in ("E", "+E", ".3e", "G", "+.2f", "12.4E", " E", "#G", "", ","):
+        assert format_column(values, spec) == [format(value, spec) for value in values.tolist()]
+    counts = np.array([1, -2, 300])
+    for spec in ("d", "+d", "05d", "E", ""):
+        assert format_column(counts, spec) == [format(value, spec) for value in counts.tolist()]
+    assert format_column(["spam", "eggs"], "") == ["spam", "eggs"]
+    assert printf_spec("d", "f") is None
+    assert printf_spec(">10E", "f") is None
+    assert printf_spec("E", "U") is None
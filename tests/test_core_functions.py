@@ -1,3 +1,5 @@
+import random
+
 from pqc.core import functions
 
 
@@ -91,3 +93,29 @@ def test_range():
     assert_range(0, 0, 5.0, [])
     assert_range(0, 1, 5.0, [0, 1])  # limited step
     assert_range(1, 0, 5.0, [1, 0])  # limited step
+
+
+def test_range_to_array():
+    assert functions.LinearRange(0, 0, 1).to_array().tolist() == []
+    assert functions.LinearRange(0, 10, 2.5).to_array().tolist() == [0, 2.5, 5, 7.5, 10]
+    assert functions.LinearRange(0, 10, 4).to_array().tolist() == [0, 4, 8, 10]  # last odd step
+    assert functions.LinearRange(0, 10, 6).to_array().tolist() == [0, 6, 10]  # end clamped
+    assert functions.LinearRange(-2.5e-24, 2.5e-24, 2.5e-24).to_array().tolist() == [-2.5e-24, 0, 2.5e-24]
+    assert functions.LinearRange(2.5e+24, -2.5e+24, 2.5e+24).to_array().tolist() == [2.5e+24, 0, -2.5e+24]
+
+
+def test_range_reference():
+    rng = random.Random(42)
+    scales = [1e-12, 1e-6, 1e-3, 1, 1e3, 1e24]
+    for _ in range(2000):
+        scale = rng.choice(scales)
+        begin = round(rng.uniform(-100, 100), rng.randint(0, 6)) * scale
+        end = round(rng.uniform(-100, 100), rng.randint(0, 6)) * scale
+        step = round(rng.uniform(0.1, 10), rng.randint(1, 6)) * rng.choice([scale, -scale, scale * 0.1])
+        ramp = functions.LinearRange(begin, end, step)
+        ref = functions.DecimalLinearRange(begin, end, step)
+        assert len(ramp) == len(ref)
+        assert ramp.distance == ref.distance
+        values = list(ref)
+        assert list(ramp) == values
+        assert ramp.to_array().tolist() == values
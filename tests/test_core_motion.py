@@ -0,0 +1,30 @@
+import math
+
+import pytest
+
+from pqc.core.motion import partial_retreat_height
+
+LIMITS = 100.0, 100.0, 25.0
+
+
+def test_partial_retreat_height():
+    assert partial_retreat_height((10, 10, 20), (12, 11, 20.5), 1.0, 5.0, LIMITS) == pytest.approx(19.0)
+    assert partial_retreat_height((10, 10, 20.5), (12, 11, 20), 0.5, 5.0, LIMITS) == pytest.approx(19.5)
+    assert partial_retreat_height((10, 10, 20), (10, 15, 20), 1.0, 5.0, LIMITS) == pytest.approx(19.0)
+
+
+def test_partial_retreat_height_fallback():
+    # disabled
+    assert partial_retreat_height((10, 10, 20), (12, 10, 20), 0.0, 5.0, LIMITS) is None
+    assert partial_retreat_height((10, 10, 20), (12, 10, 20), 1.0, 0.0, LIMITS) is None
+    # long hop
+    assert partial_retreat_height((10, 10, 20), (14, 14, 20), 1.0, 5.0, LIMITS) is None
+    # clearance reaches zero
+    assert partial_retreat_height((10, 10, 1.0), (12, 10, 20), 1.0, 5.0, LIMITS) is None
+    # unknown positions or limits
+    assert partial_retreat_height((math.nan, 10, 20), (12, 10, 20), 1.0, 5.0, LIMITS) is None
+    assert partial_retreat_height((10, 10, 20), (12, 10, 20), 1.0, 5.0, (0, 0, 0)) is None
+    # outside probe card limits
+    assert partial_retreat_height((10, 10, 20), (12, 10, 26), 1.0, 5.0, LIMITS) is None
+    assert partial_retreat_height((10, 10, 26), (12, 10, 20), 1.0, 5.0, LIMITS) is None
+    assert partial_retreat_height((-1, 10, 20), (1, 10, 20), 1.0, 5.0, LIMITS) is None
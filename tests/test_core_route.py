@@ -0,0 +1,51 @@
+import itertools
+import random
+
+import pytest
+
+from pqc.core.route import plan_route, route_length
+
+
+def test_route_length():
+    points = [(0, 0), (3, 4), (3, 0)]
+    assert route_length(points, [0, 1, 2]) == pytest.approx(9.0)
+    assert route_length(points, [0, 2, 1]) == pytest.approx(7.0)
+    assert route_length(points, [1], start=(0, 0)) == pytest.approx(5.0)
+    assert route_length([], []) == 0.0
+
+
+def test_plan_route_trivial():
+    assert plan_route([]) == []
+    assert plan_route([(1, 1)]) == [0]
+    assert plan_route([(1, 1), (2, 2)]) == [0, 1]
+    assert plan_route([(1, 1), (0, 0)], start=(0, 0)) == [1, 0]
+
+
+def test_plan_route_line():
+    points = [(0, 0), (10, 0), (1, 0), (11, 0), (2, 0)]
+    order = plan_route(points)
+    assert sorted(order) == list(range(len(points)))
+    assert route_length(points, order) == pytest.approx(11.0)
+
+
+def test_plan_route_pinned():
+    points = [(5, 0), (0, 0), (10, 0), (1, 0), (9, 0)]
+    order = plan_route(points, pin_first=True, pin_last=True)
+    assert order[0] == 0
+    assert order[-1] == 4
+    assert sorted(order) == list(range(len(points)))
+    order = plan_route(points, start=(0, 0), pin_last=True)
+    assert order[-1] == 4
+
+
+def test_plan_route_not_worse():
+    rng = random.Random(42)
+    for _ in range(20):
+        points = [(rng.uniform(0, 100), rng.uniform(0, 100)) for _ in range(7)]
+        start = (0.0, 0.0)
+        order = plan_route(points, start=start)
+        assert sorted(order) == list(range(len(points)))
+        length = route_length(points, order, start)
+        assert length <= route_length(points, range(len(points)), start) + 1e-9
+        best = min(route_length(points, p, start) for p in itertools.permutations(range(len(points))))
+        assert length <= best * 1.25
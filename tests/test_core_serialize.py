@@ -0,0 +1,42 @@
+from io import BytesIO
+
+import numpy as np
+
+from pqc.core.serialize import deserialize_npz, serialize_npz
+
+
+def test_serialize_npz():
+    data = {
+        "meta": {"sample_name": "HPK_VPX1234_001", "bias_voltage": -5.0, "measurement_tags": ["iv", ""]},
+        "series_units": {"voltage": "V", "current": "A", "count": "1"},
+        "series": {
+            "voltage": np.linspace(0, -10, 11),
+            "current": np.array([1e-9] * 10 + [np.nan]),
+            "count": np.arange(11, dtype=np.int64),
+        },
+        "analysis": {"iv": {"i_800": 1.2e-9}},
+    }
+    fp = BytesIO()
+    serialize_npz(data, fp)
+    fp.seek(0)
+    result = deserialize_npz(fp)
+    assert result["meta"] == data["meta"]
+    assert result["series_units"] == data["series_units"]
+    assert result["analysis"] == data["analysis"]
+    assert list(result["series"].keys()) == ["voltage", "current", "count"]
+    for key, values in data["series"].items():
+        assert result["series"][key].dtype == values.dtype
+        np.testing.assert_array_equal(result["series"][key], values)
+
+
+def test_serialize_npz_empty():
+    data = {"meta": {}, "series": {"voltage": np.empty(0)}}
+    fp = BytesIO()
+    serialize_npz(data, fp)
+    fp.seek(0)
+    result = deserialize_npz(fp)
+    assert result["meta"] == {}
+    assert result["series_units"] == {}
+    assert result["analysis"] == {}
+    assert result["series"]["voltage"].dtype == np.float64
+    assert len(result["series"]["voltage"]) == 0
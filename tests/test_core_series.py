@@ -0,0 +1,65 @@
+import numpy as np
+import pytest
+
+from pqc.core.series import SeriesStore
+
+
+def test_series_store():
+    store = SeriesStore()
+    store.register("voltage")
+    store.register("current")
+    assert list(store.keys()) == ["voltage", "current"]
+    assert store.size == 0
+    store.reserve(2)
+    assert store.capacity == 2
+    store.append(voltage=0.0, current=1e-9)
+    store.append(current=2e-9, voltage=1.0)
+    store.append(voltage=2.0, current=float("nan"))
+    assert store.size == 3
+    assert store.capacity > 2
+    assert store["voltage"].tolist() == [0.0, 1.0, 2.0]
+    assert store["current"][:2].tolist() == [1e-9, 2e-9]
+    assert np.isnan(store["current"][2])
+    store.clear()
+    assert store.size == 0
+    assert len(store["voltage"]) == 0
+
+
+def test_series_store_views():
+    store = SeriesStore()
+    store.register("voltage")
+    store.append(voltage=42.0)
+    view = store["voltage"]
+    with pytest.raises(ValueError):
+        view[0] = 0.0
+    assert np.shares_memory(view, store["voltage"])
+
+
+def test_series_store_keys():
+    store = SeriesStore()
+    store.register("voltage")
+    with pytest.raises(KeyError):
+        store.register("voltage")
+    with pytest.raises(KeyError):
+        store.append(current=1.0)
+    with pytest.raises(KeyError):
+        store.append(voltage=1.0, current=1.0)
+    store.append(voltage=1.0)
+    with pytest.raises(ValueError):
+        store.register("current")
+
+
+def test_series_store_extend():
+    store = SeriesStore()
+    store.register("voltage")
+    store.register("current")
+    store.append(voltage=0.0, current=0.0)
+    store.extend(voltage=np.arange(1, 301), current=np.arange(1, 301) * 1e-9)
+    assert store.size == 301
+    assert store["voltage"][-1] == 300.0
+    store.extend(voltage=[], current=[])
+    assert store.size == 301
+    with pytest.raises(ValueError):
+        store.extend(voltage=[1.0, 2.0], current=[1.0])
+    with pytest.raises(KeyError):
+        store.extend(voltage=[1.0])
@@ -0,0 +1,75 @@
+import math
+import threading
+import time
+
+import pytest
+
+from pqc.core.snapshot import EnvironmentState, StateCell, TableState
+
+
+def test_table_state():
+    state = TableState()
+    assert all(math.isnan(value) for value in state.position)
+    assert state.joystick is None
+    assert state.error is None
+    assert state.age >= 0
+    with pytest.raises(AttributeError):
+        state.position = (1.0, 2.0, 3.0)
+    with pytest.raises(AttributeError):
+        state.other = 42
+    with pytest.raises(TypeError):
+        TableState(other=42)
+    other = state.replace(position=(1.0, 2.0, 3.0), joystick=False)
+    assert other is not state
+    assert other.position == (1.0, 2.0, 3.0)
+    assert other.joystick is False
+    assert other.timestamp >= state.timestamp
+    assert all(math.isnan(value) for value in state.position)
+
+
+def test_state_cell():
+    cell = StateCell(EnvironmentState())
+    first = cell.get()
+    assert first.pc_data is None
+    state = cell.publish(pc_data="data")
+    assert cell.get() is state
+    assert state.pc_data == "data"
+    assert first.pc_data is None
+    state = cell.publish(error="timeout")
+    assert state.pc_data == "data"
+    assert state.error == "timeout"
+
+
+def test_state_cell_field_age():
+    cell = StateCell(EnvironmentState())
+    assert cell.get().field_age("pc_data") == math.inf
+    state = cell.publish(pc_data="data")
+    data_timestamp = state.timestamps["pc_data"]
+    time.sleep(0.01)
+    state = cell.publish(error="timeout")
+    assert state.timestamps["pc_data"] == data_timestamp
+    assert state.timestamps["error"] > data_timestamp
+    assert state.field_age("pc_data") > state.field_age("error")
+    assert state.field_age("pc_data") >= 0.01
+    state = cell.publish(pc_data="other", error=None)
+    assert state.timestamps["pc_data"] > data_timestamp
+
+
+def test_state_cell_concurrent():
+    cell = StateCell(TableState())
+
+    def publish(offset):
+        for index in range(200):
+            value = float(offset + index)
+            cell.publish(position=(value, value, value))
+
+    threads = [threading.Thread(target=publish, args=(offset * 1000,)) for offset in range(4)]
+    for thread in threads:
+        thread.start()
+    for _ in range(200):
+        x, y, z = cell.get().position
+        assert x == y == z or math.isnan(x)
+    for thread in threads:
+        thread.join()
+    x, y, z = cell.get().position
+    assert x == y == z
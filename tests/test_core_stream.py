@@ -0,0 +1,26 @@
+import math
+import os
+
+from pqc.core.stream import StreamWriter, read_stream
+
+
+def test_stream_writer(tmp_path):
+    filename = os.path.join(tmp_path, "data.partial")
+    with open(filename, "w") as fp:
+        stream = StreamWriter(fp, fsync_interval=0)
+        stream.write_meta("sample_name", "spam")
+        stream.write_series_unit("voltage", "V")
+        stream.write_series_unit("current", "A")
+        stream.write_row({"voltage": 0.0, "current": 1e-9})
+        stream.write_row({"voltage": 1.0, "current": float("nan")})
+        stream.write_analysis("iv", {"i_800": 4.2})
+        # Simulate incomplete record
+        fp.write('{"series": {"voltage"')
+    with open(filename) as fp:
+        data = read_stream(fp)
+    assert data["meta"] == {"sample_name": "spam"}
+    assert data["series_units"] == {"voltage": "V", "current": "A"}
+    assert data["series"]["voltage"] == [0.0, 1.0]
+    assert data["series"]["current"][0] == 1e-9
+    assert math.isnan(data["series"]["current"][1])
+    assert data["analysis"] == {"iv": {"i_800": 4.2}}
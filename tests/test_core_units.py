@@ -0,0 +1,32 @@
+import numpy as np
+import pint
+import pytest
+
+from pqc.core.units import convert, convert_array, scale_factor
+
+
+@pytest.mark.parametrize("unit, target", [
+    ("um", "mm"),
+    ("mm", "um"),
+    ("A", "uA"),
+    ("F", "pF"),
+    ("V", "V"),
+    ("ms", "s"),
+    ("kHz", "Hz"),
+])
+def test_scale_factor(unit, target):
+    ureg = pint.UnitRegistry()
+    assert scale_factor(unit, target) == pytest.approx(ureg(unit).to(target).m, rel=1e-12)
+
+
+def test_scale_factor_errors():
+    with pytest.raises(ValueError):
+        scale_factor("um", "V")
+    with pytest.raises(ValueError):
+        scale_factor("xV", "V")
+
+
+def test_convert():
+    assert convert(1.0, "um", "mm") == 0.001
+    assert convert(0.42, "mm", "um") == 420.0
+    assert np.array_equal(convert_array([1.0, 2.0], "A", "uA"), [1e6, 2e6])
@@ -0,0 +1,47 @@
+import numpy as np
+
+from pqc.core.updates import UpdateBuffer
+
+
+def test_update_buffer():
+    buffer = UpdateBuffer()
+    assert buffer.take() is None
+    buffer.append_reading("iv", 1.0, 2.0)
+    buffer.append_reading("cv", 0.0, 1e-12)
+    buffer.append_reading("iv", 2.0, 4.0)
+    buffer.update_state({"voltage": 1.0, "current": 2.0})
+    buffer.update_state({"voltage": 2.0})
+    batch = buffer.take()
+    assert list(batch.readings) == ["iv", "cv"]
+    x, y = batch.readings["iv"]
+    assert np.array_equal(x, [1.0, 2.0])
+    assert np.array_equal(y, [2.0, 4.0])
+    assert batch.readings_updated is False
+    assert batch.state == {"voltage": 2.0, "current": 2.0}
+    assert buffer.take() is None
+
+
+def test_update_buffer_readings_updated():
+    buffer = UpdateBuffer()
+    buffer.update_readings()
+    batch = buffer.take()
+    assert batch.readings == {}
+    assert batch.readings_updated is True
+    assert batch.state == {}
+    assert buffer.take() is None
+
+
+def test_update_buffer_barrier():
+    buffer = UpdateBuffer()
+    buffer.append_reading("iv", 1.0, 2.0)
+    buffer.barrier()
+    buffer.append_reading("iv", 2.0, 4.0)
+    buffer.update_state({"voltage": 2.0})
+    batch = buffer.take()
+    assert np.array_equal(batch.readings["iv"][0], [1.0])
+    assert buffer.take() is None
+    assert buffer.take(release=True) is None
+    batch = buffer.take()
+    assert np.array_equal(batch.readings["iv"][0], [2.0])
+    assert batch.state == {"voltage": 2.0}
+    assert buffer.take(release=True) is None
@@ -0,0 +1,50 @@
+import pytest
+
+from pqc.instruments.k2410 import K2410Instrument
+
+
+class FakeResource:
+
+    def __init__(self, fetch=""):
+        self.fetch = fetch
+        self.commands = []
+
+    def write(self, message):
+        self.commands.append(message)
+
+    def query(self, message):
+        self.commands.append(message)
+        if message == ":SOUR:DEL?":
+            return "1.000000E-03"
+        if message == ":SOUR:DEL:AUTO?":
+            return "0"
+        if message == "*ESR?":
+            return "0"
+        if message == ":FETC?":
+            return self.fetch
+        return "1"
+
+
+def test_sweep_voltage_timeout():
+    resource = FakeResource(fetch="-1.000000E+00,+1.000000E-09,-2.000000E+00,+2.000000E-09")
+    instrument = K2410Instrument(resource)
+    with pytest.raises(RuntimeError):
+        instrument.sweep_voltage([-1.0, -2.0, -3.0], 0.0, timeout=0.01)
+    commands = resource.commands[resource.commands.index(":INIT"):]
+    assert "*ESR?" in commands
+    abort = commands.index(":ABOR")
+    level = commands.index(":SOUR:VOLT:LEV -2.000000E+00")
+    mode = commands.index(":SOUR:VOLT:MODE FIX")
+    assert abort < commands.index(":FETC?") < level < mode
+    assert commands[-1] == "*OPC?"
+
+
+def test_sweep_voltage_stop_requested():
+    resource = FakeResource()
+    instrument = K2410Instrument(resource)
+    readings = instrument.sweep_voltage([-1.0, -2.0, -3.0], 0.0, stop_requested=lambda: True)
+    assert readings == []
+    commands = resource.commands[resource.commands.index(":INIT"):]
+    assert "*ESR?" not in commands
+    abort = commands.index(":ABOR")
+    assert abort < commands.index(":SOUR:VOLT:LEV -1.000000E+00") < commands.index(":SOUR:VOLT:MODE FIX")
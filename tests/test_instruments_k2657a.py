@@ -0,0 +1,61 @@
+from pqc.instruments.k2657a import K2657AInstrument
+
+
+class FakeResource:
+
+    def __init__(self, count, sweeping="2.00000e+00", compliance="false"):
+        self.count = count
+        self.sweeping = sweeping
+        self.compliance = compliance
+        self.commands = []
+
+    def write(self, message):
+        self.commands.append(message)
+
+    def query(self, message):
+        self.commands.append(message)
+        if message == "print(smua.measure.delay)":
+            return "0.00000e+00"
+        if message.startswith("print(bit.bitand("):
+            return f"{self.sweeping}\t{self.compliance}"
+        if message == "print(smua.nvbuffer1.n)":
+            return f"{self.count:d}"
+        if message.startswith("printbuffer("):
+            return ", ".join(f"{-index:E}, {index * 1e-9:E}" for index in range(1, self.count + 1))
+        raise AssertionError(f"unexpected query: {message}")
+
+
+def test_sweep_voltage():
+    resource = FakeResource(3, sweeping="0.00000e+00")
+    instrument = K2657AInstrument(resource)
+    readings = instrument.sweep_voltage([-1.0, -2.0, -3.0], 0.0)
+    assert readings == [(-1.0, 1e-9), (-2.0, 2e-9), (-3.0, 3e-9)]
+    assert "smua.trigger.initiate()" in resource.commands
+    assert "smua.abort()" not in resource.commands
+    assert resource.commands[-1] == "smua.source.levelv = -3.000000E+00"
+
+
+def test_sweep_voltage_stop_requested():
+    resource = FakeResource(1)
+    instrument = K2657AInstrument(resource)
+    readings = instrument.sweep_voltage([-1.0, -2.0, -3.0], 0.0, stop_requested=lambda: True)
+    assert readings == [(-1.0, 1e-9)]
+    assert resource.commands.index("smua.trigger.initiate()") < resource.commands.index("smua.abort()")
+    assert resource.commands[-1] == "smua.source.levelv = -1.000000E+00"
+
+
+def test_sweep_voltage_compliance():
+    resource = FakeResource(2, compliance="true")
+    instrument = K2657AInstrument(resource)
+    readings = instrument.sweep_voltage([-1.0, -2.0, -3.0], 0.0)
+    assert len(readings) == 2
+    assert "smua.abort()" in resource.commands
+
+
+def test_sweep_voltage_list_chunks():
+    resource = FakeResource(0, sweeping="0.00000e+00")
+    instrument = K2657AInstrument(resource)
+    instrument.sweep_voltage([-1.0] * 250, 0.0)
+    chunks = [command for command in resource.commands if command.startswith("for _, v in ipairs(")]
+    assert len(chunks) == 3
+    assert resource.commands[-1] == "smua.source.levelv = -1.000000E+00"
@@ -0,0 +1,84 @@
+import comet
+import pytest
+
+from pqc.measurements.frequency_scan import FrequencyScanMeasurement, frequency_plan, voltage_list
+
+
+def test_frequency_plan():
+    assert frequency_plan(1e2, 1e4, 2).tolist() == pytest.approx([1e2, 1e3, 1e4])
+    assert frequency_plan(1e2, 3e2, 2, "linear").tolist() == pytest.approx([1e2, 2e2, 3e2])
+    with pytest.raises(ValueError):
+        frequency_plan(1e2, 1e4, 0)
+    with pytest.raises(ValueError):
+        frequency_plan(1e2, 1e2, 10)
+    with pytest.raises(ValueError):
+        frequency_plan(0, 1e4, 10)
+    with pytest.raises(ValueError):
+        frequency_plan(1e2, -1e4, 10)
+    assert frequency_plan(0, 1e2, 2, "linear").tolist() == pytest.approx([0, 5e1, 1e2])
+
+
+def test_frequency_scan_validate_parameters():
+    parameters = {
+        "bias_voltage": comet.ureg("-5 V"),
+        "hvsrc_current_compliance": comet.ureg("1 uA"),
+        "lcr_frequency_start": comet.ureg("0 Hz"),
+        "lcr_frequency_stop": comet.ureg("1 MHz"),
+        "lcr_amplitude": comet.ureg("250 mV"),
+    }
+    measurement = FrequencyScanMeasurement(None, parameters, dict(parameters), 0.0)
+    with pytest.raises(ValueError, match="above 0 Hz"):
+        measurement.validate_parameters()
+    parameters["lcr_frequency_start"] = comet.ureg("100 Hz")
+    measurement = FrequencyScanMeasurement(None, parameters, dict(parameters), 0.0)
+    measurement.validate_parameters()
+    assert len(measurement.frequencies()) == 11
+    del parameters["bias_voltage"]
+    measurement = FrequencyScanMeasurement(None, parameters, dict(parameters), 0.0)
+    with pytest.raises(ValueError, match="bias_voltage"):
+        measurement.validate_parameters()
+    parameters["bias_voltage_list"] = [-5, -10]
+    measurement = FrequencyScanMeasurement(None, parameters, dict(parameters), 0.0)
+    measurement.validate_parameters()
+    assert measurement.bias_voltages() == [-5.0, -10.0]
+
+
+class Process:
+
+    def set_progress(self, value, maximum):
+        pass
+
+
+def test_frequency_scan_analyze_incomplete():
+    measurement = FrequencyScanMeasurement(Process(), {}, {}, 0.0)
+    for key in ("voltage_hvsrc", "frequency", "capacitance"):
+        measurement.register_series(key)
+    # Lowest frequency missing at third bias voltage
+    for voltage, frequencies in ((-5.0, (1e2, 1e3)), (-10.0, (1e2, 1e3)), (-15.0, (1e3,))):
+        for frequency in frequencies:
+            measurement.append_series(voltage_hvsrc=voltage, frequency=frequency, capacitance=-voltage * 1e-12)
+    calls = []
+    measurement.analysis_cv = lambda c, v: calls.append((c.tolist(), v.tolist()))
+    measurement.analyze()
+    assert calls == [([10e-12, 5e-12], [-10.0, -5.0])]
+    calls.clear()
+    measurement = FrequencyScanMeasurement(Process(), {}, {}, 0.0)
+    for key in ("voltage_hvsrc", "frequency", "capacitance"):
+        measurement.register_series(key)
+    measurement.append_series(voltage_hvsrc=-5.0, frequency=1e2, capacitance=5e-12)
+    measurement.append_series(voltage_hvsrc=-10.0, frequency=1e3, capacitance=10e-12)
+    measurement.analysis_cv = lambda c, v: calls.append((c.tolist(), v.tolist()))
+    measurement.analyze()
+    assert calls == []
+
+
+def test_voltage_list():
+    assert voltage_list([]) == []
+    assert voltage_list([-5, 2.5]) == [-5.0, 2.5]
+    assert voltage_list([comet.ureg("-10 V"), comet.ureg("-500 mV")]) == pytest.approx([-10.0, -0.5])
+    with pytest.raises(ValueError):
+        voltage_list([comet.ureg("10 uA")])
+    with pytest.raises(ValueError):
+        voltage_list(["10 foo"])
+    with pytest.raises(ValueError):
+        voltage_list([None])
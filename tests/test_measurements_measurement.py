@@ -0,0 +1,79 @@
+import comet
+import pytest
+
+from pqc.measurements.measurement import Measurement
+
+
+class Station:
+
+    def __init__(self):
+        self.created = []
+
+    def create_instrument(self, key):
+        self.created.append(key)
+        raise AssertionError(f"instrument created: {key}")
+
+
+def create_measurement(parameters):
+    measurement = Measurement(None, parameters, dict(parameters), 0.0)
+    measurement.register_parameter("voltage", unit="V", required=True)
+    measurement.register_parameter("waiting_time", 1.5, unit="s")
+    measurement.register_parameter("count", 10, type=int)
+    measurement.register_parameter("mode", "local", values=("local", "remote"))
+    return measurement
+
+
+def test_measurement_parameters():
+    measurement = create_measurement({"voltage": comet.ureg("-500 mV"), "count": "4"})
+    measurement.validate_parameters()
+    assert measurement.get_parameter("voltage") == pytest.approx(-0.5)
+    assert measurement.get_parameter("count") == 4
+    assert measurement.get_parameter("mode") == "local"
+    with pytest.raises(KeyError):
+        measurement.get_parameter("unknown")
+
+
+def test_measurement_parameters_missing():
+    measurement = create_measurement({})
+    with pytest.raises(ValueError):
+        measurement.validate_parameters()
+    with pytest.raises(ValueError):
+        measurement.get_parameter("voltage")
+
+
+def test_measurement_parameters_snapshot():
+    measurement = create_measurement({"voltage": comet.ureg("1 V")})
+    measurement.validate_parameters()
+    snapshot = measurement._parameters
+    with pytest.raises(TypeError):
+        snapshot["voltage"] = 2.0
+    measurement.measurement_parameters["voltage"] = comet.ureg("2 V")
+    assert measurement.get_parameter("voltage") == 1.0
+    assert measurement._parameters is snapshot
+
+
+def test_measurement_parameters_plain_default():
+    measurement = create_measurement({"voltage": comet.ureg("1 V")})
+    measurement.validate_parameters()
+    assert measurement.get_parameter("waiting_time") == 1.5
+
+
+def test_measurement_parameters_missing_unit():
+    measurement = create_measurement({"voltage": 1.0})
+    with pytest.raises(ValueError):
+        measurement.validate_parameters()
+    measurement = create_measurement({"voltage": comet.ureg("1 V"), "mode": "unknown"})
+    with pytest.raises(ValueError):
+        measurement.validate_parameters()
+
+
+def test_measurement_run_validates_parameters():
+    class DummyMeasurement(Measurement):
+        required_instruments = ["hvsrc"]
+
+    measurement = DummyMeasurement(None, {}, {}, 0.0)
+    measurement.register_parameter("voltage", unit="V", required=True)
+    station = Station()
+    with pytest.raises(ValueError):
+        measurement.run(station)
+    assert station.created == []
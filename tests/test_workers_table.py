@@ -0,0 +1,134 @@
+import types
+
+import pytest
+
+from pqc.workers import table as table_module
+from pqc.workers.table import AXIS_OFFSET, AlternateTableWorker
+
+
+class Table:
+
+    def __init__(self, moving):
+        self.moving = list(moving)
+
+    @property
+    def is_moving(self):
+        if self.moving:
+            return self.moving.pop(0)
+        return False
+
+
+class MoveTable:
+    """Table moving instantly, positions in micron."""
+
+    caldone = 3, 3, 3
+    is_moving = False
+
+    def __init__(self, position):
+        self.position = tuple(position)
+        self.moves = []
+
+    def handle_machine_error(self):
+        pass
+
+    def handle_error(self, ignore=None):
+        pass
+
+    def handle_calibration_error(self):
+        pass
+
+    def move_absolute(self, position):
+        self.moves.append(("absolute", tuple(position)))
+        self.position = tuple(position)
+
+    def move_relative(self, offset):
+        self.moves.append(("relative", tuple(offset)))
+        # Stop at limit switches
+        self.position = tuple(max(0, value + delta) for value, delta in zip(self.position, offset))
+
+
+@pytest.fixture
+def table_settings(monkeypatch):
+    monkeypatch.setattr(table_module, "settings", types.SimpleNamespace(
+        table_safe_clearance=1.0,
+        table_short_hop_distance=5.0,
+        table_probecard_maximum_limits=(100.0, 100.0, 25.0),
+    ))
+
+
+def safe_absolute_move(table, x, y, z, **kwargs):
+    worker = AlternateTableWorker(table=None)
+    worker.motion_start_delay = 0.0
+    worker.safe_absolute_move(x, y, z, **kwargs)
+    worker._queue.get_nowait()(table)
+
+
+def test_motion_stopped():
+    worker = AlternateTableWorker(table=None)
+    worker.motion_confirm_delay = 60.0
+    stopped = worker._motion_stopped(Table([False, True, True, False]))
+    assert [stopped() for _ in range(4)] == [False, False, False, True]
+
+
+def test_motion_stopped_unobserved():
+    worker = AlternateTableWorker(table=None)
+    worker.motion_confirm_delay = 0.0
+    stopped = worker._motion_stopped(Table([]))
+    assert stopped()
+
+
+def test_safe_absolute_move_same_sample(table_settings):
+    table = MoveTable((12000, 11000, 20000))
+    safe_absolute_move(table, 10.0, 10.0, 20.0, same_sample=True)
+    assert table.moves == [
+        ("absolute", (12000, 11000, 19000)),
+        ("absolute", (10000, 10000, 19000)),
+        ("relative", (0, 0, 1000)),
+    ]
+    assert table.position == (10000, 10000, 20000)
+
+
+def test_safe_absolute_move_other_sample(table_settings):
+    table = MoveTable((12000, 11000, 20000))
+    safe_absolute_move(table, 10.0, 10.0, 20.0)
+    assert table.moves == [
+        ("relative", (0, 0, -AXIS_OFFSET)),
+        ("absolute", (10000, 10000, 0)),
+        ("relative", (0, 0, 20000)),
+    ]
+    assert table.position == (10000, 10000, 20000)
+
+
+def test_execute_failure():
+    worker = AlternateTableWorker(table=None)
+    events = []
+    worker.emit = lambda event, *args: events.append(event)
+
+    def poll_status(table):
+        raise RuntimeError("connection lost")
+
+    with pytest.raises(RuntimeError):
+        worker._execute(poll_status, None)
+    assert events == ["message", "failed", "stopped"]
+    assert worker.snapshot().error == "connection lost"
+
+
+def test_update_status_failure():
+    worker = AlternateTableWorker(table=None)
+    events = []
+    worker.emit = lambda event, *args: events.append(event)
+    published = []
+    publish = worker._state.publish
+    worker._state.publish = lambda **changes: published.append(changes) or publish(**changes)
+
+    class FailingTable:
+
+        @property
+        def position(self):
+            raise RuntimeError("connection lost")
+
+    with pytest.raises(RuntimeError):
+        worker._update_status(FailingTable())
+    assert events == ["message"]
+    assert published == [{"error": "connection lost"}]
+    assert worker.snapshot().error == "connection lost"